@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+import hashlib
+import time
+
+from cachetools import TTLCache
+
+from core.events.backtest import BacktestStarted
+from infrastructure.event_dispatcher.event_dedup import EventDedup
+
+
+class LegacyEventDedup:
+    def __init__(self, ttl: int = 30, maxsize: int = 2048):
+        self._caches = [TTLCache(maxsize=maxsize // 4, ttl=ttl) for _ in range(4)]
+        self._locks = [asyncio.Lock() for _ in range(4)]
+
+    def _get_shard(self, key: str):
+        index = int(hashlib.sha256(key.encode()).hexdigest(), 16) % len(self._caches)
+        return self._caches[index], self._locks[index]
+
+    async def acquire(self, event) -> bool:
+        key = event.meta.key
+        shard, lock = self._get_shard(key)
+
+        async with lock:
+            if key in shard:
+                return False
+
+            shard[key] = True
+
+            return True
+
+
+async def bench_legacy(events) -> float:
+    dedup = LegacyEventDedup()
+
+    start = time.perf_counter()
+
+    for event in events:
+        await dedup.acquire(event)
+
+    return (time.perf_counter() - start) / len(events)
+
+
+def bench(events) -> float:
+    dedup = EventDedup()
+
+    start = time.perf_counter()
+
+    for event in events:
+        dedup.acquire(event)
+
+    return (time.perf_counter() - start) / len(events)
+
+
+def main(args):
+    events = [BacktestStarted(None, None, None) for _ in range(args.events)]
+    events += events[: args.events // 10]
+
+    legacy = asyncio.run(bench_legacy(events))
+    current = bench(events)
+
+    print(f"events={len(events)}")
+    print(f"{'legacy':>8}: {legacy * 1e9:,.0f} ns/event")
+    print(f"{'ring':>8}: {current * 1e9:,.0f} ns/event ({legacy / current:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="EventDedup benchmark")
+    parser.add_argument("--events", type=int, default=200_000)
+
+    main(parser.parse_args())
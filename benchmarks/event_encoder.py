@@ -0,0 +1,110 @@
+import argparse
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+
+from core.events._base import Event
+from core.events.backtest import BacktestStarted
+from core.events.market import NewMarketDataReceived
+from core.models.datasource_type import DataSourceType
+from core.models.entity.bar import Bar
+from core.models.entity.ohlcv import OHLCV
+from core.models.strategy import Strategy
+from core.models.symbol import Symbol
+from core.models.timeframe import Timeframe
+from factor.baseline.ma import MaBaseLine
+from factor.confirm.dpo import DpoConfirm
+from factor.pulse.adx import AdxPulse
+from factor.signal.ma.ma_cross import MaCrossSignal
+from infrastructure.event_store.event_encoder import Encoder, EventEncoder
+
+
+def legacy_to_dict(self):
+    res = asdict(self)
+    res["meta"]["name"] = self.__class__.__name__
+    return res
+
+
+@contextmanager
+def legacy_events():
+    to_dict = Event.to_dict
+    Event.to_dict = legacy_to_dict
+
+    try:
+        yield
+    finally:
+        Event.to_dict = to_dict
+
+
+def make_events(count: int):
+    symbol = Symbol("BTCUSDT", 0.0006, 0.0001, 0.001, 0.1, 3, 1, 100.0)
+    strategy = Strategy(MaCrossSignal(), DpoConfirm(), AdxPulse(), MaBaseLine())
+
+    events = []
+
+    for i in range(count):
+        if i % 100 == 0:
+            events.append(BacktestStarted(symbol, Timeframe.ONE_MINUTE, strategy))
+        else:
+            price = 100.0 + i % 7
+            bar = Bar(OHLCV(i, price, price + 1, price - 1, price, 10.0), True)
+            events.append(
+                NewMarketDataReceived(
+                    symbol, Timeframe.ONE_MINUTE, DataSourceType.BYBIT, bar
+                )
+            )
+
+    return events
+
+
+def bench(encode, events) -> float:
+    start = time.perf_counter()
+
+    for event in events:
+        encode(event)
+
+    return len(events) / (time.perf_counter() - start)
+
+
+def main(args):
+    events = make_events(args.events)
+    encoder = EventEncoder()
+
+    def stdlib(event):
+        return json.dumps(event, cls=Encoder).encode("utf-8")
+
+    sample = events[:101]
+
+    with legacy_events():
+        expected = [json.loads(stdlib(event)) for event in sample]
+
+    for event, legacy_json in zip(sample, expected, strict=True):
+        assert legacy_json == json.loads(encoder.encode(event))
+        assert json.loads(stdlib(event)) == json.loads(encoder.encode(event))
+
+    native = [event for event in events if type(event).to_dict is Event.to_dict]
+
+    with legacy_events():
+        legacy = bench(stdlib, events)
+        legacy_native = bench(stdlib, native)
+
+    current = bench(stdlib, events)
+    fast = bench(encoder.encode, events)
+    fast_native = bench(encoder.encode, native)
+
+    print(f"events={args.events}, native={len(native)}")
+    print(f"{'legacy':>8}: {legacy:,.0f} events/sec")
+    print(f"{'stdlib':>8}: {current:,.0f} events/sec ({current / legacy:.1f}x)")
+    print(f"{'orjson':>8}: {fast:,.0f} events/sec ({fast / legacy:.1f}x)")
+    print(
+        f"{'native':>8}: {fast_native:,.0f} events/sec "
+        f"({fast_native / legacy_native:.1f}x vs {legacy_native:,.0f} legacy)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="EventStore encoder benchmark")
+    parser.add_argument("--events", type=int, default=100_000)
+
+    main(parser.parse_args())
@@ -0,0 +1,94 @@
+import argparse
+import gc
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from core.events.market import NewMarketDataReceived
+from core.groups.event import EventGroup
+from core.models.datasource_type import DataSourceType
+from core.models.entity.bar import Bar
+from core.models.entity.ohlcv import OHLCV
+from core.models.symbol import Symbol
+from core.models.timeframe import Timeframe
+
+
+@dataclass
+class LegacyEventMeta:
+    key: str = field(default_factory=lambda: str(uuid.uuid4()))
+    timestamp: int = field(default_factory=lambda: datetime.now().timestamp())
+    priority: int = field(default_factory=lambda: 0)
+    version: int = field(default_factory=lambda: 1)
+    group: EventGroup = field(default_factory=lambda: EventGroup.service)
+    trace_id: Optional[str] = None
+    parent_id: Optional[str] = None
+
+    def __post_init__(self):
+        if self.trace_id is None:
+            self.trace_id = self.key
+
+
+@dataclass(frozen=True)
+class LegacyNewMarketDataReceived:
+    symbol: Symbol
+    timeframe: Timeframe
+    datasource: DataSourceType
+    bar: Bar
+    meta: LegacyEventMeta = field(
+        default_factory=lambda: LegacyEventMeta(priority=4, group=EventGroup.market),
+        init=False,
+    )
+
+
+def bench(event_class, count: int):
+    symbol = Symbol("BTCUSDT", 0.0006, 0.0001, 0.001, 0.1, 3, 1, 100.0)
+    bar = Bar(OHLCV(0, 100.0, 101.0, 99.0, 100.0, 10.0), True)
+    args = (symbol, Timeframe.ONE_MINUTE, DataSourceType.BYBIT, bar)
+
+    gc.collect()
+    start = time.perf_counter()
+    events = [event_class(*args) for _ in range(count)]
+    elapsed = time.perf_counter() - start
+
+    del events
+    gc.collect()
+
+    tracemalloc.start()
+    events = [event_class(*args) for _ in range(count)]
+    snapshot = tracemalloc.take_snapshot()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del events
+
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+
+    return count / elapsed, size / count, blocks / count
+
+
+def main(args):
+    print(f"events={args.events}")
+
+    legacy = bench(LegacyNewMarketDataReceived, args.events)
+    compact = bench(NewMarketDataReceived, args.events)
+
+    for name, (rate, size, blocks) in (("legacy", legacy), ("compact", compact)):
+        print(
+            f"{name:>8}: {rate:,.0f} events/sec, {size:,.0f} bytes/event, "
+            f"{blocks:.1f} allocations/event"
+        )
+
+    print(
+        f"{'':>8}  {compact[0] / legacy[0]:.1f}x faster, "
+        f"{legacy[1] / compact[1]:.1f}x smaller"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Event envelope benchmark")
+    parser.add_argument("--events", type=int, default=1_000_000)
+
+    main(parser.parse_args())
@@ -0,0 +1,115 @@
+import argparse
+import random
+import time
+
+import numpy as np
+
+from infrastructure.event_dispatcher.load_balancer import LoadBalancer
+
+
+class LegacyPID:
+    def __init__(self, num_groups, kp=0.3, ki=0.6, kd=0.1, lr=0.001, decay=0.99):
+        self.kp = np.ones(num_groups) * kp
+        self.ki = np.ones(num_groups) * ki
+        self.kd = np.ones(num_groups) * kd
+        self.integral_errors = np.zeros(num_groups)
+        self.previous_errors = np.zeros(num_groups)
+        self.learning_rate = lr
+        self.decay_rate = decay
+
+    def update(self, errors):
+        control_outputs = np.zeros_like(errors)
+
+        for i, error in enumerate(errors):
+            self.integral_errors[i] += error
+            derivative = error - self.previous_errors[i]
+
+            self.kp[i] = np.clip(self.kp[i] + self.learning_rate * error, 0, 1)
+            self.ki[i] = np.clip(
+                self.ki[i] + self.learning_rate * self.integral_errors[i], 0, 1
+            )
+            self.kd[i] = np.clip(self.kd[i] + self.learning_rate * derivative, 0, 1)
+
+            control_outputs[i] = (
+                self.kp[i] * error
+                + self.ki[i] * self.integral_errors[i]
+                + self.kd[i] * derivative
+            )
+
+            self.previous_errors[i] = error
+
+        self.learning_rate *= self.decay_rate
+
+        return control_outputs
+
+
+class LegacyLoadBalancer:
+    def __init__(self, priority_groups, smoothing_factor=0.2, temperature=0.5):
+        self._group_event_counts = np.zeros(priority_groups)
+        self._pid = LegacyPID(priority_groups)
+        self._target_ratios = 1 / (np.arange(priority_groups) + 1)
+        self._smoothing_factor = smoothing_factor
+        self._temperature = temperature
+
+    def register_event(self, priority_group):
+        self._group_event_counts[priority_group] += 1
+
+    def determine_priority_group(self, priority):
+        total_group = self._group_event_counts.sum()
+
+        if total_group == 0:
+            return np.clip(priority - 1, 0, len(self._group_event_counts) - 1)
+
+        processed_ratios = self._group_event_counts / total_group
+        errors = self._target_ratios - processed_ratios
+
+        control_outputs = self._pid.update(errors)
+
+        penalty_factor = np.exp(-processed_ratios)
+        weighted_outputs = control_outputs * penalty_factor
+        smoothed_outputs = (
+            self._smoothing_factor * weighted_outputs
+            + (1 - self._smoothing_factor) * control_outputs
+        )
+
+        x = smoothed_outputs / self._temperature
+        e_x = np.exp(x - np.max(x))
+        prob = e_x / np.sum(e_x)
+
+        return np.random.choice(np.arange(len(prob)), p=prob)
+
+
+def bench(balancer, groups: int, events: int) -> float:
+    priorities = [random.randint(1, groups) for _ in range(events)]
+
+    start = time.perf_counter()
+
+    for priority in priorities:
+        group = balancer.determine_priority_group(priority)
+        balancer.register_event(group)
+
+    return (time.perf_counter() - start) / events * 1e6
+
+
+def main(args):
+    print(f"groups={args.groups}, events={args.events}")
+
+    legacy = bench(LegacyLoadBalancer(args.groups), args.groups, args.events)
+    print(f"{'legacy':>12}: {legacy:.2f} us/dispatch")
+
+    for refresh in (1, args.refresh):
+        balancer = LoadBalancer(args.groups, refresh_interval=refresh)
+        current = bench(balancer, args.groups, args.events)
+        print(
+            f"{f'refresh={refresh}':>12}: {current:.2f} us/dispatch "
+            f"({legacy / current:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LoadBalancer dispatch benchmark")
+    parser.add_argument("--groups", type=int, default=13)
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--refresh", type=int, default=32)
+
+    main(parser.parse_args())
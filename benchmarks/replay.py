@@ -0,0 +1,171 @@
+import argparse
+import asyncio
+import tempfile
+import time
+
+from benchmarks.event_encoder import make_events
+from core.commands.factor import InitGeneration
+from core.events.market import NewMarketDataReceived
+from core.events.position import BrokerPositionOpened
+from core.events.signal import GoLongSignalReceived, GoShortSignalReceived
+from core.interfaces.abstract_config import AbstractConfig
+from core.models.cap import CapType
+from core.models.datasource_type import DataSourceType
+from core.models.dispatch_mode import DispatchMode
+from core.models.entity.ohlcv import OHLCV
+from core.models.entity.signal import Signal
+from core.models.side import PositionSide, SignalSide
+from core.models.strategy import Strategy
+from core.models.symbol import Symbol
+from core.models.timeframe import Timeframe
+from core.queries.account import GetBalance
+from core.queries.broker import GetSymbols
+from factor import FactorActor
+from factor.baseline.ma import MaBaseLine
+from factor.confirm.dpo import DpoConfirm
+from factor.pulse.adx import AdxPulse
+from factor.signal.ma.ma_cross import MaCrossSignal
+from infrastructure.config import ConfigService
+from infrastructure.event_dispatcher.direct_dispatch import set_dispatch_mode
+from infrastructure.event_dispatcher.event_dispatcher import EventDispatcher
+from infrastructure.event_store import EventStore
+from portfolio import PortfolioActor
+from position._actor import PositionActor
+
+
+async def snapshot(factor: FactorActor, position: PositionActor):
+    population = await factor.state.get(FactorActor.POPULATION_KEY, [])
+    generation = await factor.state.get(FactorActor.GENERATION_KEY, 0)
+    sides = [position._get_key(side) for side in PositionSide]
+
+    return (
+        list(population),
+        generation,
+        [await position._state.get(key) for key in sides],
+        [await position.sm._state.get(key) for key in sides],
+    )
+
+
+async def verify(config_service: AbstractConfig) -> None:
+    set_dispatch_mode(DispatchMode.DIRECT)
+
+    dispatcher = EventDispatcher(config_service)
+    symbol = Symbol("BTCUSDT", 0.0006, 0.0001, 0.001, 0.1, 3, 1, 100.0)
+    timeframe = Timeframe.ONE_MINUTE
+    strategy = Strategy(MaCrossSignal(), DpoConfirm(), AdxPulse(), MaBaseLine())
+
+    async def balance(_query: GetBalance) -> float:
+        return 1000.0
+
+    async def symbols(_query: GetSymbols) -> list:
+        return [symbol]
+
+    dispatcher.register(GetBalance, balance)
+    dispatcher.register(GetSymbols, symbols)
+
+    portfolio = PortfolioActor(config_service)
+    factor = FactorActor(None, config_service)
+    position = PositionActor(symbol, timeframe)
+
+    for actor in (portfolio, factor, position):
+        actor.start()
+
+    await dispatcher.execute(InitGeneration(DataSourceType.BYBIT, CapType.A))
+
+    ohlcv = OHLCV(int(time.time()), 100.0, 101.0, 99.0, 100.0, 10.0)
+
+    await dispatcher.dispatch(
+        GoLongSignalReceived(
+            Signal(symbol, timeframe, strategy, SignalSide.BUY, ohlcv, 100.0)
+        )
+    )
+    await dispatcher.dispatch(
+        GoShortSignalReceived(
+            Signal(symbol, timeframe, strategy, SignalSide.SELL, ohlcv, 100.0)
+        )
+    )
+
+    opened = await position._state.get(position._get_key(PositionSide.LONG))
+    await dispatcher.dispatch(BrokerPositionOpened(opened))
+
+    before = await snapshot(factor, position)
+
+    for actor in (portfolio, factor, position):
+        actor.stop()
+
+    portfolio = PortfolioActor(config_service)
+    factor = FactorActor(None, config_service)
+    position = PositionActor(symbol, timeframe)
+
+    for actor in (portfolio, factor):
+        actor.start()
+
+    await dispatcher.replay()
+    await position.restore()
+
+    after = await snapshot(factor, position)
+
+    assert before[0], "empty population"
+    assert before == after, f"state mismatch: {before} != {after}"
+
+    print(f"{'state':>8}: population={len(after[0])}, positions={after[3]}")
+
+    for actor in (portfolio, factor):
+        actor.stop()
+
+    dispatcher.unregister(GetBalance, balance)
+    dispatcher.unregister(GetSymbols, symbols)
+
+
+async def fill(store: EventStore, events: list) -> None:
+    await store.append_many(events)
+    await store.close()
+
+
+async def replay(config_service: AbstractConfig) -> None:
+    dispatcher = EventDispatcher(config_service)
+    bars = 0
+
+    async def balance(_query: GetBalance) -> float:
+        return 1000.0
+
+    async def count(_event: NewMarketDataReceived) -> None:
+        nonlocal bars
+        bars += 1
+
+    dispatcher.register(GetBalance, balance)
+    dispatcher.register(NewMarketDataReceived, count)
+    PortfolioActor(config_service).start()
+
+    stats = await dispatcher.replay()
+
+    print(f"{'replay':>8}: {stats.events_per_sec:,.0f} events/sec ({bars} bars)")
+
+
+def main(args):
+    with tempfile.TemporaryDirectory() as base_dir:
+        config_service = ConfigService()
+        config_service.load(config_path="config.default.ini")
+        config_service.update({"store": {"base_dir": base_dir, "journal": 1}})
+
+        store = EventStore(config_service)
+
+        asyncio.run(verify(config_service))
+
+        asyncio.run(fill(store, make_events(args.events)))
+
+        start = time.perf_counter()
+        decoded = sum(1 for _ in store.replay())
+        elapsed = time.perf_counter() - start
+
+        print(f"events={decoded}")
+        print(f"{'decode':>8}: {decoded / elapsed:,.0f} events/sec")
+
+        asyncio.run(replay(config_service))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="EventStore replay benchmark")
+    parser.add_argument("--events", type=int, default=100_000)
+
+    main(parser.parse_args())
@@ -0,0 +1,97 @@
+import argparse
+import os
+import time
+
+import numpy as np
+from wasmtime import Instance, Module, Store
+
+from core.models.entity.ohlcv import OHLCV
+from core.models.timeseries_ref import TimeSeriesRef
+from core.models.wasm_type import WasmType
+from service._wasm import WasmManager
+
+# Accepts bars without storing them when the timeseries module has not been built.
+BRIDGE_MODULE = """
+(module
+  (memory (export "memory") 1)
+  (func (export "timeseries_register") (result i32) i32.const 0)
+  (func (export "timeseries_add") (param i32 i64 f32 f32 f32 f32 f32) (result i32 i32)
+    i32.const 0 i32.const 0)
+  (func (export "timeseries_batch_buffer") (param i32) (result i32)
+    (local $grow i32)
+    local.get 0 i32.const 48 i32.mul i32.const 1024 i32.add
+    i32.const 16 i32.shr_u i32.const 1 i32.add
+    memory.size i32.sub local.tee $grow
+    i32.const 0 i32.gt_s
+    if local.get $grow memory.grow drop end
+    i32.const 1024)
+  (func (export "timeseries_add_batch") (param i32 i32) (result i32 i32)
+    local.get 1 i32.const 0))
+"""
+
+
+def make_block(n: int) -> np.ndarray:
+    rng = np.random.default_rng(42)
+    close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, n))
+
+    return np.column_stack(
+        [
+            1_700_000_000_000 + np.arange(n, dtype=np.float64) * 60_000,
+            close,
+            close + 1.0,
+            close - 1.0,
+            close,
+            1000.0 + np.arange(n, dtype=np.float64),
+        ]
+    )
+
+
+def new_ref(built: bool) -> TimeSeriesRef:
+    if built:
+        instance, store = WasmManager().get_instance(WasmType.TIMESERIES)
+    else:
+        store = Store()
+        instance = Instance(store, Module(store.engine, BRIDGE_MODULE), [])
+
+    id = instance.exports(store)["timeseries_register"](store)
+
+    return TimeSeriesRef(id=id, instance_ref=instance, store_ref=store)
+
+
+def bench_add(ref: TimeSeriesRef, bars) -> float:
+    start = time.perf_counter()
+
+    for bar in bars:
+        ref.add(bar)
+
+    return time.perf_counter() - start
+
+
+def bench_add_many(ref: TimeSeriesRef, block: np.ndarray) -> float:
+    start = time.perf_counter()
+    ref.add_many(block)
+
+    return time.perf_counter() - start
+
+
+def main(args):
+    built = os.path.exists(os.path.join("wasm", "timeseries.wasm"))
+    block = make_block(args.bars)
+    bars = [OHLCV.from_list(row) for row in block]
+
+    single = bench_add(new_ref(built), bars)
+    batch = bench_add_many(new_ref(built), block)
+
+    print(f"bars={args.bars} ({'wasm/timeseries.wasm' if built else 'bridge only'})")
+    print(f"{'add':>9}: {single * 1e3:,.1f} ms ({args.bars / single:,.0f} bars/sec)")
+    print(
+        f"{'add_many':>9}: {batch * 1e3:,.1f} ms ({args.bars / batch:,.0f} bars/sec, "
+        f"{single / batch:.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TimeSeriesRef ingest benchmark")
+    parser.add_argument("--bars", type=int, default=525_600)
+
+    main(parser.parse_args())
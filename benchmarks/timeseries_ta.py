@@ -0,0 +1,174 @@
+import argparse
+import os
+import time
+from typing import Optional
+
+import numpy as np
+import orjson as json
+from wasmtime import Instance, Module, Store
+
+from core.models.entity.ohlcv import OHLCV
+from core.models.ta import TechAnalysis
+from core.models.timeseries_ref import TimeSeriesRef
+from core.models.wasm_type import WasmType
+from service._wasm import WasmManager
+
+COLUMNS = [
+    "frsi",
+    "srsi",
+    "fma",
+    "sma",
+    "froc",
+    "sroc",
+    "macd",
+    "ppo",
+    "cci",
+    "obv",
+    "vo",
+    "nvol",
+    "mfi",
+    "tr",
+    "gkyz",
+    "yz",
+    "upb",
+    "lwb",
+    "ebb",
+    "ekch",
+    "k",
+    "d",
+    "hh",
+    "ll",
+    "support",
+    "resistance",
+    "dmi",
+    "vwap",
+    "close",
+    "hlc3",
+    "hlcc4",
+]
+
+# Serves pre-encoded payloads when the timeseries module has not been built.
+PAYLOAD_MODULE = """
+(module
+  (memory (export "memory") 1)
+  (global $json (mut i64) (i64.const 0))
+  (global $columns (mut i64) (i64.const 0))
+  (func (export "set_payloads") (param i64 i64)
+    local.get 0 global.set $json
+    local.get 1 global.set $columns)
+  (func $split (param i64) (result i32 i32)
+    local.get 0 i64.const 32 i64.shr_u i32.wrap_i64
+    local.get 0 i32.wrap_i64)
+  (func (export "timeseries_ta") (param i32 i64 f32 f32 f32 f32 f32) (result i32 i32)
+    global.get $json call $split)
+  (func (export "timeseries_ta_columns") (param i32 i64 f32 f32 f32 f32 f32) (result i32 i32)
+    global.get $columns call $split))
+"""
+
+
+def legacy_ta(ref: TimeSeriesRef, bar: OHLCV) -> Optional[TechAnalysis]:
+    ptr, length = ref.exports["timeseries_ta"](
+        ref.store_ref,
+        ref.id,
+        bar.timestamp,
+        bar.open,
+        bar.high,
+        bar.low,
+        bar.close,
+        bar.volume,
+    )
+
+    return ref._deserialize(ref._read_from_memory(ptr, length), TechAnalysis)
+
+
+def make_bars(n: int):
+    rng = np.random.default_rng(42)
+    close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, n))
+
+    return [
+        OHLCV(
+            timestamp=1_700_000_000_000 + i * 60_000,
+            open=float(c),
+            high=float(c) + 1.0,
+            low=float(c) - 1.0,
+            close=float(c),
+            volume=1000.0 + i,
+        )
+        for i, c in enumerate(close)
+    ]
+
+
+def wasm_ref(bars) -> TimeSeriesRef:
+    instance, store = WasmManager().get_instance(WasmType.TIMESERIES)
+    id = instance.exports(store)["timeseries_register"](store)
+    ref = TimeSeriesRef(id=id, instance_ref=instance, store_ref=store)
+
+    for bar in bars:
+        ref.add(bar)
+
+    return ref
+
+
+def payload_ref(window: int) -> TimeSeriesRef:
+    rng = np.random.default_rng(7)
+    columns = [rng.normal(size=window).astype(np.float32) for _ in COLUMNS]
+
+    encoded_json = json.dumps(
+        {name: column.tolist() for name, column in zip(COLUMNS, columns, strict=True)}
+    )
+    encoded_columns = (
+        np.array([len(columns), *map(len, columns)], dtype="<u8").tobytes()
+        + np.concatenate(columns).astype("<f8").tobytes()
+    )
+
+    store = Store()
+    instance = Instance(store, Module(store.engine, PAYLOAD_MODULE), [])
+    exports = instance.exports(store)
+
+    json_ptr = 8
+    columns_ptr = json_ptr + len(encoded_json) + (-len(encoded_json) % 8)
+    exports["memory"].write(store, encoded_json, json_ptr)
+    exports["memory"].write(store, encoded_columns, columns_ptr)
+    exports["set_payloads"](
+        store,
+        json_ptr << 32 | len(encoded_json),
+        columns_ptr << 32 | len(encoded_columns),
+    )
+
+    return TimeSeriesRef(id=0, instance_ref=instance, store_ref=store)
+
+
+def bench(ta, ref: TimeSeriesRef, bar: OHLCV, calls: int) -> float:
+    start = time.perf_counter()
+
+    for _ in range(calls):
+        ta(ref, bar)
+
+    return calls / (time.perf_counter() - start)
+
+
+def main(args):
+    bars = make_bars(args.bars)
+
+    if os.path.exists(os.path.join("wasm", "timeseries.wasm")):
+        ref = wasm_ref(bars)
+        source = "wasm/timeseries.wasm"
+    else:
+        ref = payload_ref(args.window)
+        source = f"pre-encoded payloads, window={args.window}"
+
+    legacy = bench(legacy_ta, ref, bars[-1], args.calls)
+    columns = bench(TimeSeriesRef.ta, ref, bars[-1], args.calls)
+
+    print(f"calls={args.calls} ({source})")
+    print(f"{'json':>8}: {legacy:,.0f} ta/sec")
+    print(f"{'columns':>8}: {columns:,.0f} ta/sec ({columns / legacy:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TimeSeriesRef.ta benchmark")
+    parser.add_argument("--calls", type=int, default=5_000)
+    parser.add_argument("--bars", type=int, default=500)
+    parser.add_argument("--window", type=int, default=26)
+
+    main(parser.parse_args())
@@ -0,0 +1,92 @@
+import argparse
+import asyncio
+import os
+import random
+import time
+
+from core.events.backtest import BacktestStarted
+from infrastructure.event_dispatcher.event_handler import EventHandler
+from infrastructure.event_dispatcher.event_worker import EventWorker
+from infrastructure.event_dispatcher.worker_pool import WorkerPool
+from infrastructure.event_dispatcher.worker_selector import SELECTORS
+
+
+async def _noop(_event):
+    pass
+
+
+async def _shutdown():
+    tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    for task in tasks:
+        task.cancel()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def bench_select(selection: str, num_workers: int, events: int) -> float:
+    handler = EventHandler()
+    workers = [EventWorker(handler, asyncio.Event()) for _ in range(num_workers)]
+
+    for worker in workers:
+        for _ in range(random.randint(0, 16)):
+            worker._queue.put_nowait(None)
+        for _ in range(16):
+            worker._record_duration(random.uniform(1e-5, 1e-3))
+
+    selector = SELECTORS[selection]()
+
+    start = time.perf_counter()
+
+    for _ in range(events):
+        selector.select(workers)
+
+    return events / (time.perf_counter() - start)
+
+
+async def bench_pool(selection: str, num_workers: int, groups: int, events: int):
+    handler = EventHandler()
+    handler.register(BacktestStarted, _noop)
+    cancel_event = asyncio.Event()
+
+    pool = WorkerPool(
+        num_workers, groups, handler, cancel_event, SELECTORS[selection]()
+    )
+
+    batch = [BacktestStarted(None, None, None) for _ in range(events)]
+
+    start = time.perf_counter()
+
+    for event in batch:
+        await pool.dispatch_to_worker(event)
+
+    await pool.wait()
+
+    elapsed = time.perf_counter() - start
+
+    cancel_event.set()
+    await _shutdown()
+
+    return events / elapsed
+
+
+async def main(args):
+    print(f"workers={args.workers}, groups={args.groups}, events={args.events}")
+
+    for selection in SELECTORS:
+        selected = bench_select(selection, args.workers, args.events)
+        dispatched = await bench_pool(selection, args.workers, args.groups, args.events)
+
+        print(
+            f"{selection:>10}: select {selected:,.0f} events/sec, "
+            f"pool {dispatched:,.0f} events/sec"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="WorkerPool selection benchmark")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--groups", type=int, default=13)
+    parser.add_argument("--events", type=int, default=50_000)
+
+    asyncio.run(main(parser.parse_args()))
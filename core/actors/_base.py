@@ -1,7 +1,7 @@
 import asyncio
 import inspect
 import uuid
-from typing import Union, get_args, get_origin
+from typing import Awaitable, Callable, List, Type, Union, get_args, get_origin
 
 from core.commands._base import Command
 from core.events._base import Event
@@ -9,7 +9,9 @@ from core.interfaces.abstract_actor import AbstractActor, Ask, Message
 from core.queries._base import Query
 from core.result import Result
 from core.tasks._base import Task
+from infrastructure.event_dispatcher.direct_dispatch import spawn
 from infrastructure.event_dispatcher.event_dispatcher import EventDispatcher
+from infrastructure.event_dispatcher.event_replayer import ReplayStats
 
 
 class BaseActor(AbstractActor):
@@ -28,6 +30,10 @@ class BaseActor(AbstractActor):
     def running(self):
         return self._running
 
+    @property
+    def routing_key(self):
+        return None
+
     def on_start(self):
         pass
 
@@ -59,6 +65,9 @@ class BaseActor(AbstractActor):
     async def tell(self, msg: Message, *args, **kwrgs):
         await self._mailbox.dispatch(msg, *args, **kwrgs)
 
+    async def tell_many(self, msgs: List[Message], *args, **kwrgs):
+        await self._mailbox.dispatch_many(msgs, *args, **kwrgs)
+
     async def ask(self, msg: Ask, *args, **kwrgs) -> Union[Result, None]:
         if isinstance(msg, Query):
             return await self._mailbox.query(msg, *args, **kwrgs)
@@ -67,12 +76,23 @@ class BaseActor(AbstractActor):
         if isinstance(msg, Task):
             return await self._mailbox.run(msg, *args, **kwrgs)
 
+    async def replay(
+        self, handler: Callable[[Event], Awaitable], *events: Type[Event]
+    ) -> ReplayStats:
+        async def receive(event: Event):
+            if isinstance(event, events) and self.pre_receive(event):
+                await handler(event)
+
+        return await self._mailbox.replay(
+            {event.GROUP for event in events}, handler=receive
+        )
+
     def _run_hook(self, hook):
         if asyncio.iscoroutinefunction(hook):
             loop = asyncio.get_running_loop()
 
             if loop.is_running():
-                asyncio.create_task(hook())
+                spawn(hook())
             else:
                 asyncio.run_coroutine_threadsafe(hook(), loop)
         else:
@@ -80,7 +100,9 @@ class BaseActor(AbstractActor):
 
     def _register_events(self):
         for event in self._EVENTS:
-            self._mailbox.register(event, self.on_receive, self.pre_receive)
+            self._mailbox.register(
+                event, self.on_receive, self.pre_receive, self.routing_key
+            )
 
     def _unregister_events(self):
         for event in self._EVENTS:
@@ -13,10 +13,14 @@ logger = logging.getLogger(__name__)
 
 class FeedActor(BaseActor):
     def __init__(
-        self, symbol: Symbol, timeframe: Timeframe, datasource: DataSourceType
+        self,
+        symbol: Symbol,
+        timeframe: Timeframe,
+        datasource: DataSourceType,
+        collector_size: int = 0,
     ):
         super().__init__()
-        self._collector = DataCollector()
+        self._collector = DataCollector(collector_size)
         self._symbol = symbol
         self._timeframe = timeframe
         self._datasource = datasource
@@ -29,6 +33,10 @@ class FeedActor(BaseActor):
     def id(self) -> str:
         return self._id
 
+    @property
+    def routing_key(self):
+        return self.symbol, self.timeframe
+
     @property
     def symbol(self) -> "Symbol":
         return self._symbol
@@ -16,6 +16,10 @@ class StrategyActor(BaseActor):
     def id(self) -> str:
         return self._id
 
+    @property
+    def routing_key(self):
+        return self.symbol, self.timeframe
+
     @property
     def symbol(self) -> "Symbol":
         return self._symbol
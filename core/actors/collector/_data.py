@@ -3,6 +3,8 @@ import logging
 from typing import Any, AsyncIterable, Awaitable, Callable, Optional
 
 from core.events._base import Event
+from infrastructure.backpressure import BoundedQueue, consume_from
+from infrastructure.event_dispatcher.direct_dispatch import spawn
 
 STOP = object()
 
@@ -10,8 +12,8 @@ logger = logging.getLogger(__name__)
 
 
 class DataCollector:
-    def __init__(self):
-        self._queue = asyncio.Queue()
+    def __init__(self, max_size: int = 0):
+        self._queue = BoundedQueue(max_size)
         self._producers = []
         self._consumers = []
         self._tasks = set()
@@ -21,18 +23,18 @@ class DataCollector:
         self._stop_event.clear()
 
         for producer in self._producers:
-            task = asyncio.create_task(self._run_producer(producer, msg))
+            task = spawn(self._run_producer(producer, msg))
             self._tasks.add(task)
             task.add_done_callback(lambda t: self._tasks.discard(t))
 
         for consumer in self._consumers:
-            task = asyncio.create_task(self._run_consumer(consumer))
+            task = spawn(self._run_consumer(consumer))
             self._tasks.add(task)
             task.add_done_callback(lambda t: self._tasks.discard(t))
 
     async def stop(self):
         self._stop_event.set()
-        await self._queue.put(STOP)
+        self._queue.put_nowait(STOP)
 
         for task in self._tasks:
             task.cancel()
@@ -48,6 +50,10 @@ class DataCollector:
         except Exception as e:
             logger.error(f"Unexpected error during task completion: {e}")
 
+    @property
+    def metrics(self):
+        return self._queue.metrics
+
     async def wait_for_completion(self):
         try:
             await asyncio.gather(*self._tasks)
@@ -69,9 +75,11 @@ class DataCollector:
         except Exception as e:
             logger.error(f"Error in producer: {e}")
         finally:
-            await self._queue.put(STOP)
+            self._queue.put_nowait(STOP)
 
     async def _run_consumer(self, consumer):
+        consume_from(self._queue)
+
         try:
             while not self._stop_event.is_set():
                 data = await self._queue.get()
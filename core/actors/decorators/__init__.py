@@ -1,3 +1,4 @@
 from ._collector import Consumer, Producer
+from ._execution import Execution
 
-__all__ = [Producer, Consumer]
+__all__ = [Producer, Consumer, Execution]
@@ -0,0 +1,11 @@
+from typing import Any, Callable
+
+from core.models.execution_policy import ExecutionPolicy
+
+
+def Execution(policy: ExecutionPolicy):
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        func._execution_policy_ = policy
+        return func
+
+    return decorator
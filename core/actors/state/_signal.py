@@ -1,6 +1,8 @@
 import asyncio
 from typing import Any, Callable, List
 
+from infrastructure.event_dispatcher.direct_dispatch import spawn
+
 
 class Signal:
     def __init__(self):
@@ -19,7 +21,7 @@ class Signal:
                 subscriber(*args, **kwargs)
 
         if tasks:
-            asyncio.create_task(self._run_async_subscribers(tasks))
+            spawn(self._run_async_subscribers(tasks))
 
     @staticmethod
     async def _run_async_subscribers(tasks: List[asyncio.Future]) -> None:
@@ -0,0 +1,19 @@
+import time
+from contextvars import ContextVar, Token
+from typing import Optional
+
+_replay_time: ContextVar[Optional[float]] = ContextVar("replay_time", default=None)
+
+
+def now() -> float:
+    replay_time = _replay_time.get()
+
+    return time.time() if replay_time is None else replay_time
+
+
+def is_replaying() -> bool:
+    return _replay_time.get() is not None
+
+
+def set_replay_time(timestamp: Optional[float]) -> Token:
+    return _replay_time.set(timestamp)
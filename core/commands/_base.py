@@ -3,7 +3,9 @@ import hashlib
 from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
 from enum import Enum, auto
-from typing import Union
+from typing import Any, Union
+
+import numpy as np
 
 from core.events._base import Event
 from core.events.meta import EventMeta
@@ -15,11 +17,12 @@ class Status(Enum):
     FAIL = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Command(Event):
+    PRIORITY = 1
+
     _execution_event: asyncio.Event = field(default_factory=asyncio.Event, init=False)
     _status: Result[Status, Union[Exception, None]] = field(default=None, init=False)
-    meta: EventMeta = field(default_factory=lambda: EventMeta(priority=1), init=False)
 
     def executed(self, status: Result):
         object.__setattr__(self, "_status", status)
@@ -30,22 +33,25 @@ class Command(Event):
         return self._status
 
     def __post_init__(self):
-        attribute_values = [
-            getattr(self, field.name)
-            for field in fields(self)
-            if field.name not in ["meta", "_execution_event"]
-        ]
+        digest = hashlib.sha256(self.__class__.__name__.encode("utf-8"))
+
+        for f in fields(self):
+            if f.name not in ["meta", "_execution_event"]:
+                digest.update(_key_bytes(getattr(self, f.name)) + b",")
+
         expiration = datetime.now() + timedelta(seconds=5)
-        concatenated = f"{self.__class__.__name__}{attribute_values}{expiration}"
-        idempotency_key = hashlib.sha256(concatenated.encode("utf-8")).hexdigest()
+        digest.update(str(expiration).encode("utf-8"))
+        idempotency_key = digest.hexdigest()
 
         object.__setattr__(
             self,
             "meta",
-            EventMeta(
-                priority=self.meta.priority,
-                group=self.meta.group,
-                version=self.meta.version,
-                key=idempotency_key,
-            ),
+            EventMeta(priority=self.PRIORITY, group=self.GROUP, key=idempotency_key),
         )
+
+
+def _key_bytes(value: Any) -> bytes:
+    if isinstance(value, np.ndarray):
+        return f"{value.dtype}{value.shape}".encode("utf-8") + value.tobytes()
+
+    return repr(value).encode("utf-8")
@@ -1,19 +1,16 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from core.events._base import EventMeta
 from core.groups.command import CommandGroup
 
 from ._base import Command
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountCommand(Command):
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=4, group=CommandGroup.account),
-        init=False,
-    )
+    PRIORITY = 4
+    GROUP = CommandGroup.account
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateAccountSize(AccountCommand):
     amount: float
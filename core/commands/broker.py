@@ -1,6 +1,5 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from core.events._base import EventMeta
 from core.groups.command import CommandGroup
 from core.models.broker import MarginMode, PositionMode
 from core.models.datasource_type import DataSourceType
@@ -9,15 +8,13 @@ from core.models.symbol import Symbol
 from ._base import Command
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrokerCommand(Command):
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=5, group=CommandGroup.broker),
-        init=False,
-    )
+    PRIORITY = 5
+    GROUP = CommandGroup.broker
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateSymbolSettings(BrokerCommand):
     datasource: DataSourceType
     symbol: Symbol
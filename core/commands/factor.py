@@ -1,6 +1,5 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from core.events._base import EventMeta
 from core.groups.command import CommandGroup
 from core.models.cap import CapType
 from core.models.datasource_type import DataSourceType
@@ -8,21 +7,19 @@ from core.models.datasource_type import DataSourceType
 from ._base import Command
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FactorCommand(Command):
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=6, group=CommandGroup.factor),
-        init=False,
-    )
+    PRIORITY = 6
+    GROUP = CommandGroup.factor
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InitGeneration(FactorCommand):
     datasource: DataSourceType
     cap: CapType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnvolveGeneration(FactorCommand):
     datasource: DataSourceType
     cap: CapType
@@ -1,6 +1,7 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+
+import numpy as np
 
-from core.events.meta import EventMeta
 from core.groups.command import CommandGroup
 from core.models.datasource_type import DataSourceType
 from core.models.entity.bar import Bar
@@ -10,17 +11,25 @@ from core.models.timeframe import Timeframe
 from ._base import Command
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarketCommand(Command):
+    PRIORITY = 2
+    GROUP = CommandGroup.market
+
     symbol: Symbol
     timeframe: Timeframe
     datasource: DataSourceType
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=2, group=CommandGroup.market),
-        init=False,
-    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IngestMarketData(MarketCommand):
+    IDEMPOTENT = True
+
     bar: Bar
+
+
+@dataclass(frozen=True, slots=True)
+class IngestMarketDataBatch(MarketCommand):
+    IDEMPOTENT = True
+
+    ohlcv: np.ndarray
@@ -1,24 +1,21 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from core.events._base import EventMeta
 from core.groups.command import CommandGroup
 
 from ._base import Command
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PortfolioCommand(Command):
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=3, group=CommandGroup.portfolio),
-        init=False,
-    )
+    PRIORITY = 3
+    GROUP = CommandGroup.portfolio
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PortfolioReset(PortfolioCommand):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StrategyReset(PortfolioCommand):
     pass
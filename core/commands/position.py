@@ -1,25 +1,22 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from core.events._base import EventMeta
 from core.groups.command import CommandGroup
 from core.models.entity.position import Position
 
 from ._base import Command
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionCommand(Command):
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=1, group=CommandGroup.position),
-        init=False,
-    )
+    PRIORITY = 1
+    GROUP = CommandGroup.position
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenPosition(PositionCommand):
     position: Position
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClosePosition(PositionCommand):
     position: Position
@@ -1,18 +1,68 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import Enum
+from typing import Any, ClassVar, Dict, Tuple
 
 from core.events.meta import EventMeta
+from core.groups.event import EventGroup
 
+_LEAF, _DATACLASS, _SEQUENCE, _MAPPING = range(4)
+_KINDS: Dict[type, int] = {}
+_FIELDS: Dict[type, Tuple[str, ...]] = {}
 
-@dataclass(frozen=True)
+
+def _kind(obj: Any) -> int:
+    cls = type(obj)
+    kind = _KINDS.get(cls)
+
+    if kind is None:
+        if is_dataclass(obj) and not isinstance(obj, type):
+            kind = _DATACLASS
+            _FIELDS[cls] = tuple(f.name for f in fields(cls))
+        elif isinstance(obj, (list, tuple)) and not hasattr(obj, "_fields"):
+            kind = _SEQUENCE
+        elif isinstance(obj, dict):
+            kind = _MAPPING
+        else:
+            kind = _LEAF
+
+        _KINDS[cls] = kind
+
+    return kind
+
+
+def _to_builtin(obj: Any) -> Any:
+    kind = _kind(obj)
+
+    if kind == _LEAF:
+        return obj
+
+    if kind == _DATACLASS:
+        return {name: _to_builtin(getattr(obj, name)) for name in _FIELDS[type(obj)]}
+
+    if kind == _SEQUENCE:
+        return type(obj)(_to_builtin(item) for item in obj)
+
+    return type(obj)((_to_builtin(k), _to_builtin(v)) for k, v in obj.items())
+
+
+@dataclass(frozen=True, slots=True)
 class Event:
-    meta: EventMeta
+    PRIORITY: ClassVar[int] = 0
+    GROUP: ClassVar[Enum] = EventGroup.service
+    IDEMPOTENT: ClassVar[bool] = False
+    meta: EventMeta = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "meta", EventMeta(priority=self.PRIORITY, group=self.GROUP)
+        )
 
     def to_dict(self):
-        res = asdict(self)
+        res = _to_builtin(self)
         res["meta"]["name"] = self.__class__.__name__
         return res
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventEnded(Event):
-    meta: EventMeta = field(default_factory=lambda: EventMeta(priority=1))
+    PRIORITY = 1
@@ -1,25 +1,23 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from core.events.meta import EventMeta
 from core.groups.event import EventGroup
 
 from ._base import Event
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountUpdated(Event):
+    PRIORITY = 7
+    GROUP = EventGroup.account
+
     amount: float
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=7, group=EventGroup.account),
-        init=False,
-    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PortfolioAccountUpdated(AccountUpdated):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionAccountUpdated(AccountUpdated):
     pass
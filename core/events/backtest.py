@@ -1,6 +1,5 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from core.events.meta import EventMeta
 from core.groups.event import EventGroup
 from core.models.strategy import Strategy
 from core.models.symbol import Symbol
@@ -9,22 +8,21 @@ from core.models.timeframe import Timeframe
 from ._base import Event
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BacktestEvent(Event):
+    PRIORITY = 6
+    GROUP = EventGroup.backtest
+
     symbol: Symbol
     timeframe: Timeframe
     strategy: Strategy
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=6, group=EventGroup.backtest),
-        init=False,
-    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BacktestStarted(BacktestEvent):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BacktestEnded(BacktestEvent):
     pass
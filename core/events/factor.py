@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import List
+
+from core.groups.event import EventGroup
+from core.models.individual import Individual
+
+from ._base import Event
+
+
+@dataclass(frozen=True, slots=True)
+class FactorEvent(Event):
+    PRIORITY = 6
+    GROUP = EventGroup.factor
+
+
+@dataclass(frozen=True, slots=True)
+class GenerationUpdated(FactorEvent):
+    IDEMPOTENT = True
+
+    population: List[Individual]
+    generation: int
@@ -1,6 +1,5 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from core.events.meta import EventMeta
 from core.groups.event import EventGroup
 from core.models.datasource_type import DataSourceType
 from core.models.entity.bar import Bar
@@ -11,23 +10,22 @@ from core.models.timeframe import Timeframe
 from ._base import Event
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarketEvent(Event):
+    PRIORITY = 4
+    GROUP = EventGroup.market
+
     symbol: Symbol
     timeframe: Timeframe
     datasource: DataSourceType
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=4, group=EventGroup.market),
-        init=False,
-    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewMarketDataReceived(MarketEvent):
     bar: Bar
 
     def to_dict(self):
-        parent_dict = super().to_dict()
+        parent_dict = Event.to_dict(self)
 
         current_dict = {
             "symbol": str(self.symbol),
@@ -39,12 +37,12 @@ class NewMarketDataReceived(MarketEvent):
         return {**parent_dict, **current_dict}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewMarketOrderReceived(MarketEvent):
     order: Order
 
     def to_dict(self):
-        parent_dict = super().to_dict()
+        parent_dict = Event.to_dict(self)
 
         current_dict = {
             "symbol": str(self.symbol),
@@ -1,14 +1,57 @@
-import uuid
+import itertools
+import os
+import time
+from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
-from datetime import datetime
+from enum import Enum
+from typing import Optional
 
 from core.groups.event import EventGroup
 
+_EPOCH_OFFSET = time.time() - time.monotonic()
+_SESSION = f"{int(time.time() * 1000):x}{os.getpid():x}-"
+_ids = itertools.count()
 
-@dataclass
+
+def next_key() -> str:
+    return f"{_SESSION}{next(_ids):x}"
+
+
+def timestamp() -> float:
+    return _EPOCH_OFFSET + time.monotonic()
+
+
+@dataclass(slots=True)
 class EventMeta:
-    key: str = field(default_factory=lambda: str(uuid.uuid4()))
-    timestamp: int = field(default_factory=lambda: datetime.now().timestamp())
-    priority: int = field(default_factory=lambda: 0)
-    version: int = field(default_factory=lambda: 1)
-    group: EventGroup = field(default_factory=lambda: EventGroup.service)
+    key: str = field(default_factory=next_key)
+    timestamp: float = field(default_factory=timestamp)
+    priority: int = 0
+    version: int = 1
+    group: Enum = EventGroup.service
+    trace_id: Optional[str] = None
+    parent_id: Optional[str] = None
+
+    def __post_init__(self):
+        if self.trace_id is not None:
+            return
+
+        parent = _current_meta.get()
+
+        if parent is None:
+            self.trace_id = self.key
+        else:
+            self.trace_id = parent.trace_id
+            self.parent_id = parent.key
+
+
+_current_meta: ContextVar[Optional[EventMeta]] = ContextVar(
+    "current_event_meta", default=None
+)
+
+
+def set_current_meta(meta: Optional[EventMeta]) -> Token:
+    return _current_meta.set(meta)
+
+
+def reset_current_meta(token: Token) -> None:
+    _current_meta.reset(token)
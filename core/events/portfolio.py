@@ -1,6 +1,5 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from core.events.meta import EventMeta
 from core.groups.event import EventGroup
 from core.models.entity.portfolio import Performance
 from core.models.strategy import Strategy
@@ -10,23 +9,24 @@ from core.models.timeframe import Timeframe
 from ._base import Event
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PortfolioEvent(Event):
+    PRIORITY = 8
+    GROUP = EventGroup.portfolio
+
     symbol: Symbol
     timeframe: Timeframe
     strategy: Strategy
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=8, group=EventGroup.portfolio),
-        init=False,
-    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PortfolioPerformanceUpdated(PortfolioEvent):
+    IDEMPOTENT = True
+
     performance: Performance
 
     def to_dict(self):
-        parent_dict = super().to_dict()
+        parent_dict = Event.to_dict(self)
 
         current_dict = {
             "symbol": str(self.symbol),
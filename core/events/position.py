@@ -1,22 +1,20 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from core.events.meta import EventMeta
 from core.groups.event import EventGroup
 from core.models.entity.position import Position
 
 from ._base import Event
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionEvent(Event):
+    PRIORITY = 2
+    GROUP = EventGroup.position
+
     position: Position
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=2, group=EventGroup.position),
-        init=False,
-    )
 
     def to_dict(self):
-        parent_dict = super().to_dict()
+        parent_dict = Event.to_dict(self)
 
         current_dict = {
             "position": self.position.to_dict(),
@@ -25,41 +23,41 @@ class PositionEvent(Event):
         return {**parent_dict, **current_dict}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionInitialized(PositionEvent):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionAdjusted(PositionEvent):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionOpened(PositionEvent):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionCloseRequested(PositionEvent):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionClosed(PositionEvent):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrokerPositionOpened(PositionEvent):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrokerPositionReduced(PositionEvent):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrokerPositionClosed(PositionEvent):
     pass
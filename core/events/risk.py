@@ -1,21 +1,20 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from core.events.meta import EventMeta
 from core.groups.event import EventGroup
 from core.models.entity.signal import Signal
 
 from ._base import Event
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RiskEvent(Event):
+    PRIORITY = 1
+    GROUP = EventGroup.risk
+
     signal: Signal
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=1, group=EventGroup.risk), init=False
-    )
 
     def to_dict(self):
-        parent_dict = super().to_dict()
+        parent_dict = Event.to_dict(self)
 
         current_dict = {
             "signal": self.signal.to_dict(),
@@ -24,11 +23,11 @@ class RiskEvent(Event):
         return {**parent_dict, **current_dict}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RiskLongThresholdBreached(RiskEvent):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RiskShortThresholdBreached(RiskEvent):
     pass
@@ -1,22 +1,20 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from core.events.meta import EventMeta
 from core.groups.event import EventGroup
 from core.models.entity.signal import Signal
 
 from ._base import Event
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignalEvent(Event):
+    PRIORITY = 5
+    GROUP = EventGroup.signal
+
     signal: Signal
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=5, group=EventGroup.signal),
-        init=False,
-    )
 
     def to_dict(self):
-        parent_dict = super().to_dict()
+        parent_dict = Event.to_dict(self)
 
         current_dict = {
             "signal": self.signal.to_dict(),
@@ -25,21 +23,21 @@ class SignalEvent(Event):
         return {**parent_dict, **current_dict}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoLongSignalReceived(SignalEvent):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoShortSignalReceived(SignalEvent):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExitLongSignalReceived(SignalEvent):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExitShortSignalReceived(SignalEvent):
     pass
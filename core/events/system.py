@@ -1,21 +1,36 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List
 
-from core.events.meta import EventMeta
 from core.groups.event import EventGroup
 from core.models.strategy import Strategy
 
 from ._base import Event
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SystemEvent(Event):
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=8, group=EventGroup.system),
-        init=False,
-    )
+    PRIORITY = 8
+    GROUP = EventGroup.system
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeployStrategy(SystemEvent):
     strategy: List[Strategy]
+
+
+@dataclass(frozen=True, slots=True)
+class DeadLetterRecorded(SystemEvent):
+    event: Event
+    handler: str
+    error: str
+    attempts: int
+    retryable: bool
+
+    def to_dict(self):
+        parent_dict = Event.to_dict(self)
+
+        current_dict = {
+            "event": self.event.to_dict(),
+        }
+
+        return {**parent_dict, **current_dict}
@@ -4,6 +4,7 @@ from enum import Enum, auto
 class EventGroup(Enum):
     account = auto()
     backtest = auto()
+    factor = auto()
     market = auto()
     portfolio = auto()
     position = auto()
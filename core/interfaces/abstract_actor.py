@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import List, Union
 
 from core.commands._base import Command
-from core.commands.market import IngestMarketData
+from core.commands.market import IngestMarketData, IngestMarketDataBatch
 from core.events.backtest import BacktestEnded
 from core.events.market import NewMarketDataReceived, NewMarketOrderReceived
 from core.events.position import (
@@ -43,6 +43,7 @@ Message = Union[
     StartHistoricalFeed,
     StartRealtimeFeed,
     IngestMarketData,
+    IngestMarketDataBatch,
     NextBar,
     PrevBar,
     BatchBars,
@@ -92,6 +93,10 @@ class AbstractActor(ABC):
     def tell(self, msg: Message):
         pass
 
+    @abstractmethod
+    def tell_many(self, msgs: List[Message]):
+        pass
+
     @abstractmethod
     def ask(self, ask: Ask):
         pass
@@ -1,10 +1,39 @@
 from abc import ABC, abstractmethod
+from typing import Hashable, Optional, Tuple
 
+import numpy as np
+
+from core.models.entity.ohlcv import OHLCV
 from core.models.strategy import Strategy
-from core.models.strategy_ref import StrategyRef
+from core.models.strategy_ref import SignalEvent, StrategyRef
+from core.models.symbol import Symbol
+from core.models.timeframe import Timeframe
 
 
 class AbstractSignalService(ABC):
     @abstractmethod
-    def register(self, strategy: Strategy) -> StrategyRef:
+    def register(
+        self, strategy: Strategy, affinity: Optional[Hashable] = None
+    ) -> StrategyRef:
+        pass
+
+    @abstractmethod
+    def unregister(self, strategy_ref: StrategyRef) -> None:
+        pass
+
+    @abstractmethod
+    async def next(
+        self,
+        strategy_ref: StrategyRef,
+        symbol: Symbol,
+        timeframe: Timeframe,
+        strategy: Strategy,
+        ohlcv: OHLCV,
+    ) -> Optional[SignalEvent]:
+        pass
+
+    @abstractmethod
+    async def run(
+        self, strategy_ref: StrategyRef, ohlcv: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
         pass
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Dict, Optional
+
+import numpy as np
 
 from core.models.entity.ohlcv import OHLCV
 from core.models.symbol import Symbol
@@ -7,10 +9,28 @@ from core.models.timeframe import Timeframe
 
 
 class AbstractTimeSeriesService(ABC):
+    @abstractmethod
+    def register(self, symbol: Symbol, timeframe: Timeframe):
+        pass
+
+    @abstractmethod
+    def unregister(self, symbol: Symbol, timeframe: Timeframe) -> None:
+        pass
+
+    @abstractmethod
+    def metrics(self) -> Dict[str, Any]:
+        pass
+
     @abstractmethod
     async def upsert(self, symbol: Symbol, timeframe: Timeframe, bar: OHLCV):
         pass
 
+    @abstractmethod
+    async def upsert_many(
+        self, symbol: Symbol, timeframe: Timeframe, ohlcv: np.ndarray
+    ) -> int:
+        pass
+
     @abstractmethod
     async def next_bar(
         self, symbol: Symbol, timeframe: Timeframe, bar: OHLCV
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Any, Callable, Hashable, Optional, Tuple
 
 from wasmtime import Instance, Store
 
@@ -8,5 +8,19 @@ from core.models.wasm_type import WasmType
 
 class AbstractWasmManager(ABC):
     @abstractmethod
-    def get_instance(self, wasm_type: WasmType) -> Tuple[Instance, Store]:
+    def get_instance(
+        self, wasm_type: WasmType, affinity: Optional[Hashable] = None
+    ) -> Tuple[Instance, Store]:
+        pass
+
+    @abstractmethod
+    async def run(self, store: Store, fn: Callable[..., Any], *args) -> Any:
+        pass
+
+    @abstractmethod
+    def call(self, store: Store, fn: Callable[..., Any], *args) -> Any:
+        pass
+
+    @abstractmethod
+    def shutdown(self) -> None:
         pass
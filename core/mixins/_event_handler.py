@@ -1,10 +1,12 @@
-import asyncio
 from typing import Any, Callable, Dict, Type
 
+from infrastructure.event_dispatcher.event_dispatcher import EventDispatcher
+
 
 class EventHandlerMixin:
     def __init__(self):
         self._handlers: Dict[Type[Any], Callable] = {}
+        self._executor = EventDispatcher().executor
 
     def register_handler(self, event_type: Type[Any], handler: Callable):
         self._handlers[event_type] = handler
@@ -13,9 +15,6 @@ class EventHandlerMixin:
         handler = self._handlers.get(type(event))
 
         if handler:
-            if asyncio.iscoroutinefunction(handler):
-                return await handler(event)
-            else:
-                return await asyncio.to_thread(handler, event)
+            return await self._executor.run(handler, event)
 
         return None
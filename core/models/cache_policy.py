@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Mapping, Optional, Tuple
+
+CacheKey = Tuple[Hashable, ...]
+KeyFunc = Callable[[Any], CacheKey]
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    ttl: Optional[float] = None
+    maxsize: int = 1024
+    invalidated_by: Mapping[type, Optional[KeyFunc]] = field(default_factory=dict)
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class DispatchMode(Enum):
+    QUEUED = "queued"
+    DIRECT = "direct"
@@ -2,20 +2,36 @@ import json
 from dataclasses import dataclass, fields
 from enum import Enum
 from functools import cached_property
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 
 def Entity(cls):
     cls = dataclass(frozen=True)(cls)
+    schema = {}
+
+    def _schema(klass) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        if klass not in schema:
+            schema[klass] = (
+                tuple(f.name for f in fields(klass)),
+                tuple(
+                    k
+                    for k in dir(klass)
+                    if isinstance(getattr(klass, k, None), (property, cached_property))
+                ),
+            )
+
+        return schema[klass]
 
     def to_dict(self) -> Dict[str, Any]:
-        field_dict = {f.name: getattr(self, f.name) for f in fields(self)}
-        property_dict = {
-            k: getattr(self, k)
-            for k in dir(self)
-            if isinstance(getattr(self.__class__, k, None), (property, cached_property))
-            and hasattr(self, k)
-        }
+        field_names, property_names = _schema(self.__class__)
+        field_dict = {name: getattr(self, name) for name in field_names}
+        property_dict = {}
+
+        for k in property_names:
+            try:
+                property_dict[k] = getattr(self, k)
+            except AttributeError:
+                pass
 
         result = {**field_dict, **property_dict}
 
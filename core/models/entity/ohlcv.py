@@ -1,5 +1,7 @@
 from typing import Any, Dict, List
 
+import numpy as np
+
 from core.models.candle_type import CandleType
 
 from ._base import Entity
@@ -37,6 +39,16 @@ class OHLCV:
             float(volume),
         )
 
+    @staticmethod
+    def to_array(bars: List["OHLCV"]) -> np.ndarray:
+        return np.array(
+            [
+                (bar.timestamp, bar.open, bar.high, bar.low, bar.close, bar.volume)
+                for bar in bars
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 6)
+
     @classmethod
     def from_dict(cls, data: Dict) -> "OHLCV":
         required_keys = {
@@ -0,0 +1,7 @@
+from enum import Enum, auto
+
+
+class ExecutionPolicy(Enum):
+    DEFAULT = auto()
+    INLINE = auto()
+    THREAD = auto()
@@ -2,7 +2,9 @@ import logging
 import typing
 from dataclasses import dataclass
 from functools import cached_property
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
+
+import numpy as np
 
 if typing.TYPE_CHECKING:
     from wasmtime import Instance, Store
@@ -20,6 +22,7 @@ from core.models.side import SignalSide
 from core.models.strategy import Strategy
 from core.models.symbol import Symbol
 from core.models.timeframe import Timeframe
+from core.models.wasm_memory import OHLCV_FIELDS, read_array, write_array
 
 SignalEvent = Union[
     GoLongSignalReceived,
@@ -63,29 +66,52 @@ class StrategyRef:
 
         action = Action.from_raw(raw_action)
 
-        side = SignalSide.BUY if action == Action.GO_LONG else SignalSide.SELL
-
-        action_event_map = {
-            Action.GO_LONG: GoLongSignalReceived(
+        if action == Action.GO_LONG:
+            return GoLongSignalReceived(
                 signal=Signal(
                     symbol,
                     timeframe,
                     strategy,
-                    side,
+                    SignalSide.BUY,
                     ohlcv,
                     entry=price,
                 ),
-            ),
-            Action.GO_SHORT: GoShortSignalReceived(
+            )
+
+        if action == Action.GO_SHORT:
+            return GoShortSignalReceived(
                 signal=Signal(
                     symbol,
                     timeframe,
                     strategy,
-                    side,
+                    SignalSide.SELL,
                     ohlcv,
                     entry=price,
                 ),
-            ),
-        }
+            )
+
+        return None
+
+    def run(self, ohlcv: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        block = np.ascontiguousarray(ohlcv, dtype="<f8").reshape(-1, OHLCV_FIELDS)
+        rows = len(block)
+
+        if not rows:
+            return np.empty(0, dtype="<i4"), np.empty(0, dtype="<f4")
+
+        memory = self.exports["memory"]
+        write_array(
+            memory,
+            self.store_ref,
+            self.exports["strategy_batch_buffer"](self.store_ref, rows),
+            block,
+        )
+
+        ptr, length = self.exports["strategy_run_batch"](self.store_ref, self.id, rows)
+
+        if ptr == -1:
+            raise ValueError(f"Strategy {self.id} is not registered")
+
+        output = read_array(memory, self.store_ref, ptr, length, "<u4")
 
-        return action_event_map.get(action)
+        return output[:rows].view("<i4"), output[rows:].view("<f4")
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from functools import cached_property
 from typing import Any, List, Optional, Type
 
+import numpy as np
 import orjson as json
 
 if typing.TYPE_CHECKING:
@@ -11,6 +12,7 @@ if typing.TYPE_CHECKING:
 from core.models.entity.ohlcv import OHLCV
 
 from .ta import TechAnalysis
+from .wasm_memory import OHLCV_FIELDS, read_array, write_array
 
 
 @dataclass(frozen=True)
@@ -42,6 +44,23 @@ class TimeSeriesRef:
         if res == -1:
             raise ValueError("Can't add new market bar")
 
+    def add_many(self, ohlcv: np.ndarray) -> int:
+        block = np.ascontiguousarray(ohlcv, dtype="<f8").reshape(-1, OHLCV_FIELDS)
+        rows = len(block)
+
+        if not rows:
+            return 0
+
+        ptr = self.exports["timeseries_batch_buffer"](self.store_ref, rows)
+        write_array(self.exports["memory"], self.store_ref, ptr, block)
+
+        res, _ = self.exports["timeseries_add_batch"](self.store_ref, self.id, rows)
+
+        if res == -1:
+            raise ValueError("Can't add market bars")
+
+        return res
+
     def next_bar(self, bar: OHLCV) -> Optional[OHLCV]:
         return self._get_bar("next_bar", bar)
 
@@ -66,7 +85,7 @@ class TimeSeriesRef:
         return self._deserialize(buff, OHLCV) or []
 
     def ta(self, bar: OHLCV) -> Optional[TechAnalysis]:
-        ptr, length = self.exports["timeseries_ta"](
+        ptr, length = self.exports["timeseries_ta_columns"](
             self.store_ref,
             self.id,
             bar.timestamp,
@@ -77,9 +96,15 @@ class TimeSeriesRef:
             bar.volume,
         )
 
-        buff = self._read_from_memory(ptr, length)
+        columns = self._read_columns(ptr, length)
+
+        if columns is None:
+            return None
 
-        return self._deserialize(buff, TechAnalysis)
+        try:
+            return TechAnalysis.from_list(columns)
+        except ValueError:
+            return None
 
     def _get_bar(self, method: str, bar: OHLCV) -> Optional[OHLCV]:
         ptr, length = self.exports[f"timeseries_{method}"](
@@ -103,6 +128,17 @@ class TimeSeriesRef:
 
         return self.exports["memory"].data_ptr(self.store_ref)[ptr : ptr + length]
 
+    def _read_columns(self, ptr: int, length: int) -> Optional[List[np.ndarray]]:
+        if ptr == -1 and length == 0:
+            return None
+
+        words = read_array(self.exports["memory"], self.store_ref, ptr, length, "<u8")
+
+        n = int(words[0])
+        offsets = np.cumsum(words[1 : n + 1])
+
+        return np.split(words[n + 1 :].view("<f8"), offsets[:-1])
+
     def _deserialize(self, buff: bytes, data_class: Type[Any]) -> Optional[Any]:
         try:
             raw_data = json.loads("".join(chr(val) for val in buff))
@@ -0,0 +1,26 @@
+import ctypes
+import typing
+
+import numpy as np
+
+if typing.TYPE_CHECKING:
+    from wasmtime import Memory, Store
+
+OHLCV_FIELDS = 6
+
+
+def memory_view(memory: "Memory", store: "Store", ptr: int, length: int):
+    base = ctypes.addressof(memory.data_ptr(store).contents)
+
+    return (ctypes.c_char * length).from_address(base + ptr)
+
+
+def read_array(
+    memory: "Memory", store: "Store", ptr: int, length: int, dtype: str
+) -> np.ndarray:
+    return np.frombuffer(memory_view(memory, store, ptr, length), dtype=dtype).copy()
+
+
+def write_array(memory: "Memory", store: "Store", ptr: int, data: np.ndarray) -> None:
+    view = memory_view(memory, store, ptr, data.nbytes)
+    ctypes.memmove(view, data.ctypes.data, data.nbytes)
@@ -1,21 +1,24 @@
 import asyncio
 from dataclasses import dataclass, field
-from typing import Generic, TypeVar, Union
+from typing import ClassVar, Generic, Optional, TypeVar, Union
 
 from core.events._base import Event
-from core.events.meta import EventMeta
+from core.models.cache_policy import CachePolicy
 from core.result import Result
 
 T = TypeVar("T")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Query(Generic[T], Event):
+    PRIORITY = 1
+    IDEMPOTENT = True
+    CACHE: ClassVar[Optional[CachePolicy]] = None
+
     _response_event: asyncio.Event = field(default_factory=asyncio.Event, init=False)
     _response: Result[Union[T, None], Union[Exception, None]] = field(
         default=None, init=False
     )
-    meta: EventMeta = field(default_factory=lambda: EventMeta(priority=1), init=False)
 
     def set_response(self, response: Result):
         object.__setattr__(self, "_response", response)
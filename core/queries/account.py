@@ -1,15 +1,44 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from core.events.meta import EventMeta
+from core.events.account import (
+    AccountUpdated,
+    PortfolioAccountUpdated,
+    PositionAccountUpdated,
+)
+from core.events.position import (
+    BrokerPositionClosed,
+    BrokerPositionOpened,
+    BrokerPositionReduced,
+    PositionAdjusted,
+    PositionClosed,
+    PositionOpened,
+)
 from core.groups.query import QueryGroup
+from core.models.cache_policy import CachePolicy
 
 from ._base import Query
 
+BALANCE_EVENTS = (
+    AccountUpdated,
+    PortfolioAccountUpdated,
+    PositionAccountUpdated,
+    PositionOpened,
+    PositionAdjusted,
+    PositionClosed,
+    BrokerPositionOpened,
+    BrokerPositionReduced,
+    BrokerPositionClosed,
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class GetBalance(Query[float]):
-    currency: str = "USDT"
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=4, group=QueryGroup.account),
-        init=False,
+    PRIORITY = 4
+    GROUP = QueryGroup.account
+    CACHE = CachePolicy(
+        ttl=5,
+        maxsize=16,
+        invalidated_by=dict.fromkeys(BALANCE_EVENTS),
     )
+
+    currency: str = "USDT"
@@ -1,8 +1,9 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List, Optional
 
-from core.events._base import EventMeta
+from core.commands.broker import UpdateSymbolSettings
 from core.groups.query import QueryGroup
+from core.models.cache_policy import CachePolicy
 from core.models.cap import CapType
 from core.models.datasource_type import DataSourceType
 from core.models.symbol import Symbol
@@ -10,21 +11,22 @@ from core.models.symbol import Symbol
 from ._base import Query
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetSymbols(Query[List[Symbol]]):
+    PRIORITY = 3
+    GROUP = QueryGroup.broker
+    CACHE = CachePolicy(
+        ttl=300, maxsize=64, invalidated_by={UpdateSymbolSettings: None}
+    )
+
     datasource: DataSourceType
     cap: Optional[CapType] = None
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=3, group=QueryGroup.broker),
-        init=False,
-    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetSimilarSymbols(Query[List[Symbol]]):
+    PRIORITY = 3
+    GROUP = QueryGroup.broker
+
     symbol: Symbol
     datasource: DataSourceType
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=3, group=QueryGroup.broker),
-        init=False,
-    )
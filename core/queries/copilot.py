@@ -1,7 +1,6 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List
 
-from core.events._base import EventMeta
 from core.groups.query import QueryGroup
 from core.models.entity.ohlcv import OHLCV
 from core.models.entity.signal import Signal
@@ -13,23 +12,21 @@ from core.models.ta import TechAnalysis
 from ._base import Query
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvaluateSignal(Query[SignalRisk]):
+    PRIORITY = 5
+    GROUP = QueryGroup.copilot
+
     signal: Signal
     prev_bar: List[OHLCV]
     ta: TechAnalysis
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=5, group=QueryGroup.copilot),
-        init=False,
-    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvaluateSession(Query[SessionRiskType]):
+    PRIORITY = 1
+    GROUP = QueryGroup.copilot
+
     side: PositionSide
     session: List[OHLCV]
     ta: TechAnalysis
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=1, group=QueryGroup.copilot),
-        init=False,
-    )
@@ -1,8 +1,8 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List
 
-from core.events._base import EventMeta
 from core.groups.query import QueryGroup
+from core.models.cache_policy import CachePolicy
 from core.models.entity.ohlcv import OHLCV
 from core.models.symbol import Symbol
 from core.models.ta import TechAnalysis
@@ -11,58 +11,54 @@ from core.models.timeframe import Timeframe
 from ._base import Query
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NextBar(Query[OHLCV]):
+    PRIORITY = 3
+    GROUP = QueryGroup.market
+
     symbol: Symbol
     timeframe: Timeframe
     ohlcv: OHLCV
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=3, group=QueryGroup.market),
-        init=False,
-    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PrevBar(Query[OHLCV]):
+    PRIORITY = 4
+    GROUP = QueryGroup.market
+
     symbol: Symbol
     timeframe: Timeframe
     ohlcv: OHLCV
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=4, group=QueryGroup.market),
-        init=False,
-    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatchBars(Query[List[OHLCV]]):
+    PRIORITY = 4
+    GROUP = QueryGroup.market
+
     symbol: Symbol
     timeframe: Timeframe
     ohlcv: OHLCV
     n: int
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=4, group=QueryGroup.market),
-        init=False,
-    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BackNBars(Query[List[OHLCV]]):
+    PRIORITY = 4
+    GROUP = QueryGroup.market
+
     symbol: Symbol
     timeframe: Timeframe
     ohlcv: OHLCV
     n: int
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=4, group=QueryGroup.market),
-        init=False,
-    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TA(Query[TechAnalysis]):
+    PRIORITY = 2
+    GROUP = QueryGroup.ta
+    CACHE = CachePolicy(ttl=60, maxsize=1024)
+
     symbol: Symbol
     timeframe: Timeframe
     ohlcv: OHLCV
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=2, group=QueryGroup.ta),
-        init=False,
-    )
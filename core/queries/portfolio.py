@@ -1,8 +1,11 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List
 
-from core.events._base import EventMeta
+from core.commands.portfolio import PortfolioReset
+from core.events.portfolio import PortfolioPerformanceUpdated
+from core.events.position import PositionClosed
 from core.groups.query import QueryGroup
+from core.models.cache_policy import CachePolicy
 from core.models.entity.portfolio import Performance
 from core.models.strategy import Strategy
 from core.models.symbol import Symbol
@@ -11,20 +14,34 @@ from core.models.timeframe import Timeframe
 from ._base import Query
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetPortfolioRank(Query[List[Strategy]]):
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=2, group=QueryGroup.portfolio),
-        init=False,
-    )
+    PRIORITY = 2
+    GROUP = QueryGroup.portfolio
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetPortfolioPerformance(Query[Performance]):
+    PRIORITY = 2
+    GROUP = QueryGroup.portfolio
+    CACHE = CachePolicy(
+        ttl=60,
+        maxsize=4096,
+        invalidated_by={
+            PositionClosed: lambda event: (
+                event.position.signal.symbol,
+                event.position.signal.timeframe,
+                event.position.signal.strategy,
+            ),
+            PortfolioPerformanceUpdated: lambda event: (
+                event.symbol,
+                event.timeframe,
+                event.strategy,
+            ),
+            PortfolioReset: None,
+        },
+    )
+
     symbol: Symbol
     timeframe: Timeframe
     strategy: Strategy
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=2, group=QueryGroup.portfolio),
-        init=False,
-    )
@@ -1,6 +1,5 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from core.events._base import EventMeta
 from core.groups.query import QueryGroup
 from core.models.entity.order import Order
 from core.models.entity.position import Position
@@ -8,28 +7,25 @@ from core.models.entity.position import Position
 from ._base import Query
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetOpenPosition(Query[Order]):
+    PRIORITY = 1
+    GROUP = QueryGroup.position
+
     position: Position
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=1, group=QueryGroup.position),
-        init=False,
-    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetClosePosition(Query[Order]):
+    PRIORITY = 1
+    GROUP = QueryGroup.broker
+
     position: Position
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=1, group=QueryGroup.broker),
-        init=False,
-    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HasPosition(Query[bool]):
+    PRIORITY = 3
+    GROUP = QueryGroup.broker
+
     position: Position
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=3, group=QueryGroup.broker),
-        init=False,
-    )
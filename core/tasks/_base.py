@@ -2,14 +2,14 @@ import asyncio
 from dataclasses import dataclass, field
 
 from core.events._base import Event
-from core.events.meta import EventMeta
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Task(Event):
+    PRIORITY = 1
+
     _task_event: asyncio.Event = field(default_factory=asyncio.Event, init=False)
     _task: asyncio.Task = field(default=None, init=False)
-    meta: EventMeta = field(default_factory=lambda: EventMeta(priority=1), init=False)
 
     def set_task(self, task: asyncio.Task):
         object.__setattr__(self, "_task", task)
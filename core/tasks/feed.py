@@ -1,6 +1,5 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from core.events.meta import EventMeta
 from core.groups.tasks import TasksGroup
 from core.models.datasource_type import DataSourceType
 from core.models.lookback import Lookback
@@ -10,23 +9,22 @@ from core.models.timeframe import Timeframe
 from ._base import Task
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FeedTask(Task):
+    PRIORITY = 2
+    GROUP = TasksGroup.feed
+
     symbol: Symbol
     timeframe: Timeframe
     datasource: DataSourceType
-    meta: EventMeta = field(
-        default_factory=lambda: EventMeta(priority=2, group=TasksGroup.feed),
-        init=False,
-    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StartHistoricalFeed(FeedTask):
     in_sample: Lookback
     out_sample: Lookback | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StartRealtimeFeed(FeedTask):
     pass
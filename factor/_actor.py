@@ -8,7 +8,9 @@ import numpy as np
 from coral import DataSourceFactory
 from core.actors import BaseActor
 from core.actors.state import InMemory
+from core.clock import is_replaying
 from core.commands.factor import EnvolveGeneration, InitGeneration
+from core.events.factor import GenerationUpdated
 from core.interfaces.abstract_config import AbstractConfig
 from core.mixins import EventHandlerMixin
 from core.models.individual import Individual
@@ -21,7 +23,7 @@ from core.queries.portfolio import GetPortfolioPerformance
 
 from .generator import PopulationGenerator
 
-FactorEvent = Union[InitGeneration, GetGeneration, EnvolveGeneration]
+FactorEvent = Union[InitGeneration, GetGeneration, EnvolveGeneration, GenerationUpdated]
 
 
 class GeneticAttributes(Enum):
@@ -69,6 +71,7 @@ class FactorActor(BaseActor, EventHandlerMixin):
         self.register_handler(InitGeneration, self._init_generation)
         self.register_handler(GetGeneration, self._get_generation)
         self.register_handler(EnvolveGeneration, self._envolve_generation)
+        self.register_handler(GenerationUpdated, self._restore_generation)
 
     async def _init_generation(self, msg: InitGeneration):
         generator = await self._get_generator(msg.datasource, msg.cap)
@@ -80,9 +83,17 @@ class FactorActor(BaseActor, EventHandlerMixin):
 
         await self.state.set(self.POPULATION_KEY, population)
         await self.state.set(self.GENERATION_KEY, 0)
+        await self.tell(GenerationUpdated(list(population), 0))
 
         logger.info(f"Initialized generation with {len(population)} individuals.")
 
+    async def _restore_generation(self, event: GenerationUpdated):
+        if not is_replaying():
+            return
+
+        await self.state.set(self.POPULATION_KEY, list(event.population))
+        await self.state.set(self.GENERATION_KEY, event.generation)
+
     async def _get_generator(self, datasource, cap):
         result = await self.ask(GetSymbols(datasource, cap))
 
@@ -135,6 +146,7 @@ class FactorActor(BaseActor, EventHandlerMixin):
 
         await self.state.set(self.POPULATION_KEY, next_population)
         await self.state.set(self.GENERATION_KEY, next_generation)
+        await self.tell(GenerationUpdated(list(next_population), next_generation))
 
         logger.info(
             f"Evolved to generation {next_generation + 1} with {len(next_population)} individuals."
@@ -4,7 +4,7 @@ from typing import AsyncIterator, List
 from coral import DataSourceFactory
 from core.actors import FeedActor
 from core.actors.decorators import Consumer, Producer
-from core.commands.market import IngestMarketData
+from core.commands.market import IngestMarketDataBatch
 from core.events.market import NewMarketDataReceived
 from core.interfaces.abstract_config import AbstractConfig
 from core.models.datasource_type import DataSourceType
@@ -27,7 +27,12 @@ class HistoricalActor(FeedActor):
         datasource_factory: DataSourceFactory,
         config_service: AbstractConfig,
     ):
-        super().__init__(symbol, timeframe, datasource)
+        super().__init__(
+            symbol,
+            timeframe,
+            datasource,
+            config_service.get("feed").get("collector_size", 0),
+        )
         self.datasource_factory = datasource_factory
         self.config = config_service.get("feed")
         self.bp = asyncio.Semaphore(10)
@@ -61,22 +66,25 @@ class HistoricalActor(FeedActor):
         await self._handle_market(batch)
 
     async def _handle_market(self, batch: List[Bar]) -> None:
-        for bar in batch:
-            await self.tell(
+        await self.tell_many(
+            [
                 NewMarketDataReceived(self.symbol, self.timeframe, self.datasource, bar)
-            )
+                for bar in batch
+            ]
+        )
 
     async def _outbox(self, batch: List[Bar]) -> None:
+        closed = [bar.ohlcv for bar in batch if bar.closed]
+
+        if not closed:
+            return
+
         async with self.bp:
-            tasks = [
-                self.ask(
-                    IngestMarketData(self.symbol, self.timeframe, self.datasource, bar)
+            await self.ask(
+                IngestMarketDataBatch(
+                    self.symbol, self.timeframe, self.datasource, OHLCV.to_array(closed)
                 )
-                for bar in batch
-                if bar.closed
-            ]
-
-            await asyncio.gather(*tasks)
+            )
 
     @staticmethod
     async def batched(stream: AsyncIterator[Bar], batch_size: int):
@@ -0,0 +1,125 @@
+import asyncio
+import time
+from contextvars import ContextVar
+from itertools import islice
+from typing import Any, Dict, Iterable, Optional
+
+_consumer: ContextVar[Optional["BoundedQueue"]] = ContextVar(
+    "backpressure_consumer", default=None
+)
+
+
+def consume_from(queue: Optional["BoundedQueue"]) -> None:
+    _consumer.set(queue)
+
+
+class QueueMetrics:
+    def __init__(self):
+        self.depth = 0
+        self.peak_depth = 0
+        self.blocked_time = 0.0
+        self.blocked_puts = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "depth": self.depth,
+            "peak_depth": self.peak_depth,
+            "blocked_time": self.blocked_time,
+            "blocked_puts": self.blocked_puts,
+        }
+
+    @staticmethod
+    def merge(metrics: Iterable["QueueMetrics"]) -> Dict[str, Any]:
+        result = QueueMetrics().to_dict()
+
+        for item in metrics:
+            result["depth"] += item.depth
+            result["peak_depth"] = max(result["peak_depth"], item.peak_depth)
+            result["blocked_time"] += item.blocked_time
+            result["blocked_puts"] += item.blocked_puts
+
+        return result
+
+
+class BoundedQueue(asyncio.Queue):
+    def __init__(self, high_water: int = 0):
+        super().__init__()
+        self._high_water = high_water
+        self._has_capacity = asyncio.Event()
+        self._has_capacity.set()
+        self._stalled = 0
+        self.metrics = QueueMetrics()
+
+    @property
+    def high_water(self) -> int:
+        return self._high_water
+
+    async def put(self, item: Any) -> None:
+        await self.wait_for_capacity()
+        self.put_nowait(item)
+
+    async def put_many(self, items: Iterable[Any]) -> None:
+        items = iter(items)
+
+        while True:
+            await self.wait_for_capacity()
+            chunk = list(islice(items, self._free_slots()))
+
+            if not chunk:
+                return
+
+            for item in chunk:
+                self.put_nowait(item)
+
+    def put_nowait(self, item: Any) -> None:
+        super().put_nowait(item)
+        self._update_depth()
+
+    def get_nowait(self) -> Any:
+        item = super().get_nowait()
+        self._update_depth()
+        return item
+
+    # A consumer putting into its own queue, or into a queue whose consumer is
+    # itself stalled on a put, skips the bound: waiting there could never end.
+    async def wait_for_capacity(self) -> None:
+        consumer = _consumer.get()
+
+        if not self._bounded(consumer):
+            return
+
+        while self.qsize() >= self._high_water and self._bounded(consumer):
+            self._has_capacity.clear()
+            start = time.monotonic()
+
+            if consumer is not None:
+                consumer._stalled += 1
+
+            try:
+                await self._has_capacity.wait()
+            finally:
+                if consumer is not None:
+                    consumer._stalled -= 1
+
+                self.metrics.blocked_time += time.monotonic() - start
+                self.metrics.blocked_puts += 1
+
+    def _bounded(self, consumer: Optional["BoundedQueue"]) -> bool:
+        return bool(self._high_water) and consumer is not self and not self._stalled
+
+    def _free_slots(self) -> Optional[int]:
+        if not self._bounded(_consumer.get()):
+            return None
+
+        return max(self._high_water - self.qsize(), 1)
+
+    def _update_depth(self) -> None:
+        depth = self.qsize()
+
+        self.metrics.depth = depth
+
+        if depth > self.metrics.peak_depth:
+            self.metrics.peak_depth = depth
+
+        if self._high_water and depth < self._high_water:
+            self._has_capacity.set()
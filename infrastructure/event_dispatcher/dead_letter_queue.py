@@ -0,0 +1,195 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from core.clock import is_replaying
+from core.events._base import Event
+from core.events.system import DeadLetterRecorded
+from core.models.dispatch_mode import DispatchMode
+from core.tasks._base import Task
+from infrastructure.event_store import EventStore
+from infrastructure.telemetry.bus_metrics import handler_name
+
+from .direct_dispatch import set_dispatch_mode
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    batch_size: int = 32
+    concurrency: int = 4
+    jitter: Tuple[float, float] = (0.5, 1.5)
+    retryable: Tuple[type, ...] = (TimeoutError, ConnectionError)
+
+    def delay(self, attempts: int) -> float:
+        return min(
+            self.base_delay * (2 ** (attempts - 1)) * random.uniform(*self.jitter),
+            self.max_delay,
+        )
+
+
+class DeadLetter:
+    __slots__ = ("handler", "event", "error", "attempts", "args", "kwargs")
+
+    def __init__(
+        self,
+        handler: Callable[..., Any],
+        event: Event,
+        error: Exception,
+        attempts: int,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ):
+        self.handler = handler
+        self.event = event
+        self.error = error
+        self.attempts = attempts
+        self.args = args
+        self.kwargs = kwargs
+
+
+RetryFunc = Callable[[DeadLetter], Awaitable[bool]]
+
+
+class DeadLetterQueue:
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        store: Optional[EventStore] = None,
+        max_size: int = 10000,
+    ):
+        self.policy = policy or RetryPolicy()
+        self._store = store
+        self._retry: Optional[RetryFunc] = None
+        self._scheduled: List[Tuple[float, int, DeadLetter]] = []
+        self._exhausted: Deque[DeadLetter] = deque(maxlen=max_size)
+        self._seq = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self.persisted = 0
+        self.retries = 0
+        self.recovered = 0
+
+    @property
+    def exhausted(self) -> Deque[DeadLetter]:
+        return self._exhausted
+
+    def bind(self, retry: RetryFunc) -> None:
+        self._retry = retry
+
+    def retryable(self, letter: DeadLetter) -> bool:
+        return (
+            self._retry is not None
+            and not isinstance(letter.event, Task)
+            and letter.event.IDEMPOTENT
+            and isinstance(letter.error, self.policy.retryable)
+            and letter.attempts < self.policy.max_attempts
+        )
+
+    async def add(self, letter: DeadLetter) -> bool:
+        if is_replaying():
+            return False
+
+        retryable = self.retryable(letter)
+        await self._persist(letter, retryable)
+
+        if not retryable:
+            self._exhausted.append(letter)
+            return False
+
+        due = time.monotonic() + self.policy.delay(letter.attempts)
+        heapq.heappush(self._scheduled, (due, next(self._seq), letter))
+        self._ensure_started()
+
+        return True
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "scheduled": len(self._scheduled),
+            "exhausted": len(self._exhausted),
+            "persisted": self.persisted,
+            "retries": self.retries,
+            "recovered": self.recovered,
+        }
+
+    def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _persist(self, letter: DeadLetter, retryable: bool) -> None:
+        if self._store is None:
+            return
+
+        await self._store.append(
+            DeadLetterRecorded(
+                letter.event,
+                handler_name(letter.handler),
+                repr(letter.error),
+                letter.attempts,
+                retryable,
+            )
+        )
+        self.persisted += 1
+
+    def _ensure_started(self) -> None:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        else:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        set_dispatch_mode(DispatchMode.QUEUED)
+        semaphore = asyncio.Semaphore(self.policy.concurrency)
+
+        async def attempt(letter: DeadLetter) -> None:
+            async with semaphore:
+                self.retries += 1
+
+                if await self._retry(letter):
+                    self.recovered += 1
+
+        while self._scheduled:
+            delay = self._scheduled[0][0] - time.monotonic()
+
+            if delay > 0:
+                self._wakeup.clear()
+
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+
+                continue
+
+            batch = self._due_batch()
+
+            logger.info(f"Retrying {len(batch)} dead letters")
+
+            await asyncio.gather(*[attempt(letter) for letter in batch])
+
+    def _due_batch(self) -> List[DeadLetter]:
+        now = time.monotonic()
+        batch = []
+
+        while (
+            self._scheduled
+            and self._scheduled[0][0] <= now
+            and len(batch) < self.policy.batch_size
+        ):
+            batch.append(heapq.heappop(self._scheduled)[2])
+
+        return batch
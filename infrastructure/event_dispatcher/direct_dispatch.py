@@ -0,0 +1,44 @@
+import asyncio
+from collections import deque
+from contextvars import Context, ContextVar, copy_context
+from typing import Any, Coroutine, Deque, Dict, Optional, Tuple
+
+from core.events._base import Event
+from core.models.dispatch_mode import DispatchMode
+from infrastructure.backpressure import consume_from
+
+PendingEvent = Tuple[Event, Tuple[Any], Dict[str, Any], float]
+
+
+class DirectQueue:
+    __slots__ = ("pending", "draining")
+
+    def __init__(self):
+        self.pending: Deque[PendingEvent] = deque()
+        self.draining = False
+
+
+_direct: ContextVar[Optional[DirectQueue]] = ContextVar("direct_dispatch", default=None)
+
+
+def set_dispatch_mode(mode: DispatchMode) -> None:
+    _direct.set(DirectQueue() if mode == DispatchMode.DIRECT else None)
+
+
+def current_direct_queue() -> Optional[DirectQueue]:
+    return _direct.get()
+
+
+# Tasks copy the caller's context, so without this a task spawned from a
+# direct-mode handler would append to, and drain, its parent's queue, and one
+# spawned from a worker would bypass backpressure on the worker's own queue.
+def spawn(
+    coro: Coroutine[Any, Any, Any], context: Optional[Context] = None
+) -> asyncio.Task:
+    context = context or copy_context()
+    context.run(consume_from, None)
+
+    if context.get(_direct) is not None:
+        context.run(_direct.set, DirectQueue())
+
+    return asyncio.create_task(coro, context=context)
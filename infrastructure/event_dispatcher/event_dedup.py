@@ -1,37 +1,65 @@
-import asyncio
-import hashlib
-
-from cachetools import TTLCache
+import time
+from collections import deque
+from typing import Deque, List, Set
 
 from core.events._base import Event
 
 
 class EventDedup:
-    def __init__(self, ttl: int = 30, maxsize: int = 2048):
-        self._caches = [TTLCache(maxsize=maxsize // 4, ttl=ttl) for _ in range(4)]
-        self._locks = [asyncio.Lock() for _ in range(4)]
-
-    def _get_shard(self, key: str):
-        shard_index = int(hashlib.sha256(key.encode()).hexdigest(), 16) % len(
-            self._caches
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        num_buckets: int = 4,
+        event_rate: int = 5000,
+        min_bucket_size: int = 1024,
+    ):
+        self._span = ttl / num_buckets
+        self._bucket_size = max(int(event_rate * self._span), min_bucket_size)
+        self._buckets: Deque[Set[int]] = deque(
+            (set() for _ in range(num_buckets)), maxlen=num_buckets
         )
-        return self._caches[shard_index], self._locks[shard_index]
+        self._current = self._buckets[-1]
+        self._rotate_at = time.monotonic() + self._span
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets)
 
-    async def acquire(self, event: Event) -> bool:
-        key = event.meta.key
-        shard, lock = self._get_shard(key)
+    def acquire(self, event: Event) -> bool:
+        key = hash(event.meta.key)
 
-        async with lock:
-            if key in shard:
+        if time.monotonic() >= self._rotate_at:
+            self._rotate()
+
+        for bucket in self._buckets:
+            if key in bucket:
                 return False
 
-            shard[key] = True
+        if len(self._current) >= self._bucket_size:
+            self._rotate()
+
+        self._current.add(key)
 
-            return True
+        return True
+
+    def acquire_many(self, events: List[Event]) -> List[Event]:
+        return [event for event in events if self.acquire(event)]
+
+    def release(self, event: Event) -> None:
+        key = hash(event.meta.key)
+
+        for bucket in self._buckets:
+            bucket.discard(key)
+
+    def _rotate(self) -> None:
+        now = time.monotonic()
+        expired = (
+            int((now - self._rotate_at) / self._span) + 1
+            if now >= self._rotate_at
+            else 1
+        )
 
-    async def release(self, event: Event) -> None:
-        key = event.meta.key
-        shard, lock = self._get_shard(key)
+        for _ in range(min(expired, self._buckets.maxlen)):
+            self._current = set()
+            self._buckets.append(self._current)
 
-        async with lock:
-            shard.pop(key, None)
+        self._rotate_at = now + self._span
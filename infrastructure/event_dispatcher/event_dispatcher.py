@@ -1,16 +1,38 @@
 import asyncio
-from typing import Callable, Optional, Type, Union
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
-from core.commands._base import Command
+from core.clock import is_replaying
+from core.commands._base import Command, Status
 from core.events._base import Event, EventEnded
 from core.interfaces.abstract_config import AbstractConfig
 from core.queries._base import Query
 from core.result import Result
 from core.tasks._base import Task
 from infrastructure.event_store import EventStore
+from infrastructure.telemetry.bus_metrics import BusMetrics
+from infrastructure.telemetry.tracer import Tracer
 
+from .dead_letter_queue import DeadLetterQueue, RetryPolicy
+from .direct_dispatch import current_direct_queue
+from .event_dedup import EventDedup
 from .event_handler import EventHandler
-from .worker_pool import WorkerPool
+from .event_replayer import EventReplayer, ReplayStats
+from .event_routing import RoutingKey
+from .handler_executor import HandlerExecutor
+from .query_cache import QueryCache
+from .worker_pool import ScalingPolicy, WorkerPool
+from .worker_selector import create_selector
 
 
 class SingletonMeta(type):
@@ -26,15 +48,61 @@ class EventDispatcher(metaclass=SingletonMeta):
     def __init__(self, config_service: AbstractConfig):
         self.config = config_service.get("bus")
 
-        self._event_handler = EventHandler(self.config.get("timeout", 10))
-        self._cancel_event = asyncio.Event()
+        self._executor = HandlerExecutor(
+            self.config.get("thread_pool_size", 4),
+            self.config.get("executor_queue_size", 256),
+        )
+        telemetry = config_service.get("telemetry") or {}
+        telemetry_enabled = bool(telemetry.get("enabled", 0))
+
+        self._bus_metrics = BusMetrics(enabled=telemetry_enabled)
+        self._tracer = Tracer(
+            telemetry.get("trace_spans", 0) if telemetry_enabled else 0
+        )
         self._store = EventStore(config_service)
+        self._dlq = DeadLetterQueue(
+            RetryPolicy(
+                self.config.get("retry_attempts", 3),
+                self.config.get("retry_delay", 1.0),
+                self.config.get("retry_max_delay", 60.0),
+                self.config.get("retry_batch_size", 32),
+                self.config.get("retry_concurrency", 4),
+            ),
+            self._store,
+            self.config.get("dlq_size", 10000),
+        )
+        self._event_handler = EventHandler(
+            self.config.get("timeout", 10),
+            self._executor,
+            self._bus_metrics,
+            self._tracer,
+            self._dlq,
+        )
+        self._replayer = EventReplayer(self._event_handler)
+        self._query_cache = QueryCache(bool(self.config.get("query_cache", 1)))
+        self._cancel_event = asyncio.Event()
 
         self._command_worker_pool = None
         self._query_worker_pool = None
         self._event_worker_pool = None
         self._task_worker_pool = None
 
+    @property
+    def executor(self) -> HandlerExecutor:
+        return self._executor
+
+    @property
+    def bus_metrics(self) -> BusMetrics:
+        return self._bus_metrics
+
+    @property
+    def tracer(self) -> Tracer:
+        return self._tracer
+
+    @property
+    def dlq(self) -> DeadLetterQueue:
+        return self._dlq
+
     @property
     def command_worker_pool(self):
         return self._get_worker_pool("_command_worker_pool")
@@ -56,29 +124,93 @@ class EventDispatcher(metaclass=SingletonMeta):
         event_class: Type[Event],
         handler: Callable,
         filter_func: Optional[Callable[[Event], bool]] = None,
+        routing_key: Optional[RoutingKey] = None,
     ) -> None:
-        self._event_handler.register(event_class, handler, filter_func)
+        self._event_handler.register(event_class, handler, filter_func, routing_key)
 
     def unregister(self, event_class: Type[Event], handler: Callable) -> None:
         self._event_handler.unregister(event_class, handler)
 
     async def execute(self, command: Command, *args, **kwargs) -> Result:
-        await self._dispatch_to_poll(command, self.command_worker_pool, *args, **kwargs)
+        if is_replaying():
+            return Result.Ok(Status.SUCCESS)
+
+        self._query_cache.invalidate(command)
+        await self._dispatch_to_poll(command, "_command_worker_pool", *args, **kwargs)
         return await command.wait_for_execution()
 
     async def query(self, query: Query, *args, **kwargs) -> Result:
-        await self._dispatch_to_poll(query, self.query_worker_pool, *args, **kwargs)
-        return await query.wait_for_response()
+        async def fetch() -> Result:
+            await self._dispatch_to_poll(query, "_query_worker_pool", *args, **kwargs)
+            return await query.wait_for_response()
+
+        if is_replaying():
+            return await fetch()
+
+        return await self._query_cache.get(query, fetch)
 
     async def run(self, task: Task, *args, **kwargs) -> None:
-        await self._dispatch_to_poll(task, self.task_worker_pool, *args, **kwargs)
+        if is_replaying():
+            return
+
+        await self._dispatch_to_poll(task, "_task_worker_pool", *args, **kwargs)
         await task.wait_for_finishing()
 
     async def dispatch(self, event: Event, *args, **kwargs) -> None:
-        await self._dispatch_to_poll(event, self.event_worker_pool, *args, **kwargs)
-        self._store.append(event)
+        if is_replaying():
+            return
+
+        self._query_cache.invalidate(event)
+        await self._dispatch_to_poll(event, "_event_worker_pool", *args, **kwargs)
+        await self._store.append(event)
+        await self._drain()
+
+    async def dispatch_many(self, events: List[Event], *args, **kwargs) -> None:
+        for event in events:
+            if not isinstance(event, Event) or isinstance(event, EventEnded):
+                raise ValueError(f"Invalid event type: {type(event)}")
+
+        if is_replaying():
+            return
+
+        for event in events:
+            self._query_cache.invalidate(event)
+
+        direct = current_direct_queue()
+
+        if direct is None:
+            await self.event_worker_pool.dispatch_many_to_worker(
+                events, *args, **kwargs
+            )
+        else:
+            enqueued_at = time.monotonic()
+            direct.pending.extend(
+                (event, args, kwargs, enqueued_at) for event in events
+            )
+
+        await self._store.append_many(events)
+        await self._drain()
+
+    async def replay(
+        self,
+        groups: Optional[Iterable[str]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        handler: Optional[Callable[[Event], Awaitable[Any]]] = None,
+    ) -> ReplayStats:
+        await self._store.flush()
+
+        stats = await self._replayer.replay(
+            self._store.replay(groups, start, end), handler
+        )
+        self._query_cache.clear()
+
+        return stats
 
     async def wait(self) -> None:
+        if current_direct_queue() is not None:
+            return await self._drain()
+
         await asyncio.gather(
             *[
                 self.event_worker_pool.wait(),
@@ -88,41 +220,107 @@ class EventDispatcher(metaclass=SingletonMeta):
             ]
         )
 
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        pools = {
+            name: pool.metrics()
+            for name, pool in (
+                ("event", self._event_worker_pool),
+                ("query", self._query_worker_pool),
+                ("command", self._command_worker_pool),
+                ("task", self._task_worker_pool),
+            )
+            if pool is not None
+        }
+
+        return {
+            **pools,
+            "executor": self._executor.metrics(),
+            "store": self._store.metrics(),
+            "dlq": self._dlq.metrics(),
+            "query_cache": self._query_cache.metrics(),
+        }
+
     async def stop(self) -> None:
         await asyncio.gather(
             *[
-                self._dispatch_to_poll(EventEnded(), self.event_worker_pool),
-                self._dispatch_to_poll(EventEnded(), self.query_worker_pool),
-                self._dispatch_to_poll(EventEnded(), self.command_worker_pool),
-                self._dispatch_to_poll(EventEnded(), self.task_worker_pool),
+                self._dispatch_to_poll(EventEnded(), "_event_worker_pool"),
+                self._dispatch_to_poll(EventEnded(), "_query_worker_pool"),
+                self._dispatch_to_poll(EventEnded(), "_command_worker_pool"),
+                self._dispatch_to_poll(EventEnded(), "_task_worker_pool"),
             ]
         )
-        self._store.close()
+        self._dlq.stop()
+        await self._store.close()
+        self._executor.shutdown()
 
     async def _dispatch_to_poll(
         self,
         event: Union[Event, Command, Query],
-        worker_pool: WorkerPool,
+        pool_attr: str,
         *args,
         **kwargs,
     ) -> None:
         if isinstance(event, EventEnded):
             self._cancel_event.set()
-        elif isinstance(event, (Command, Query, Event, Task)):
+        elif not isinstance(event, (Command, Query, Event, Task)):
+            raise ValueError(f"Invalid event type: {type(event)}")
+        elif (direct := current_direct_queue()) is None:
+            worker_pool = self._get_worker_pool(pool_attr)
             await worker_pool.dispatch_to_worker(event, *args, **kwargs)
+        elif isinstance(event, (Command, Query, Task)):
+            await self._event_handler.handle_event(event, *args, **kwargs)
         else:
-            raise ValueError(f"Invalid event type: {type(event)}")
+            direct.pending.append((event, args, kwargs, time.monotonic()))
+
+    async def _drain(self) -> None:
+        direct = current_direct_queue()
+
+        if direct is None or direct.draining:
+            return
+
+        direct.draining = True
+
+        try:
+            while direct.pending:
+                event, args, kwargs, enqueued_at = direct.pending.popleft()
+                self._bus_metrics.observe_queue_wait(
+                    event, time.monotonic() - enqueued_at
+                )
+                await self._event_handler.handle_event(event, *args, **kwargs)
+        finally:
+            direct.draining = False
+
+    def _create_worker_pool(self, name: str) -> WorkerPool:
+        max_queue_size = self.config.get(
+            f"{name}_queue_size", self.config.get("queue_size", 0)
+        )
 
-    def _create_worker_pool(self) -> WorkerPool:
         return WorkerPool(
             self.config["num_workers"],
             self.config["piority_groups"],
             self._event_handler,
             self._cancel_event,
+            create_selector(self.config.get("worker_selection", "weighted")),
+            self.config.get("balancer_refresh", 32),
+            max_queue_size,
+            self._bus_metrics,
+            ScalingPolicy(
+                self.config.get("min_workers", self.config["num_workers"]),
+                self.config["num_workers"],
+                self.config.get("scale_interval", 64),
+                self.config.get("scale_up_depth", 8),
+                self.config.get("scale_idle_checks", 4),
+            ),
+            EventDedup(
+                self.config.get("dedup_ttl", 30.0),
+                self.config.get("dedup_buckets", 4),
+                self.config.get("dedup_event_rate", 5000),
+            ),
         )
 
     def _get_worker_pool(self, pool_attr: str) -> WorkerPool:
         if getattr(self, pool_attr) is None:
-            setattr(self, pool_attr, self._create_worker_pool())
+            name = pool_attr.removeprefix("_").removesuffix("_worker_pool")
+            setattr(self, pool_attr, self._create_worker_pool(name))
 
         return getattr(self, pool_attr)
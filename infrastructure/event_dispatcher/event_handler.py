@@ -1,60 +1,158 @@
 import asyncio
+import contextvars
+import heapq
+import itertools
 import logging
-from collections import defaultdict, deque
+import time
+from collections import defaultdict
 from functools import partial
-from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Type, Union
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from core.commands._base import Command, Status
 from core.events._base import Event
+from core.events.meta import reset_current_meta, set_current_meta
 from core.queries._base import Query
 from core.result import Result
 from core.tasks._base import Task
+from infrastructure.telemetry.bus_metrics import BusMetrics
+from infrastructure.telemetry.tracer import Tracer
+
+from .dead_letter_queue import DeadLetter, DeadLetterQueue
+from .direct_dispatch import spawn
+from .event_routing import EventRouter, RoutingKey
+from .handler_executor import HandlerExecutor
 
 HandlerType = Union[partial, Callable[..., Any]]
+FilterType = Optional[Callable[[Event], bool]]
+HandlerEntry = Tuple[HandlerType, FilterType, int]
+
+_order = itemgetter(2)
 
 
 logger = logging.getLogger(__name__)
 
 
 class EventHandler:
-    def __init__(self, timeout: int = 15):
-        self._event_handlers: Dict[Type[Event], List[HandlerType]] = defaultdict(list)
-        self._dlq: Deque[Tuple[Event, Exception]] = deque(maxlen=100)
+    def __init__(
+        self,
+        timeout: int = 15,
+        executor: Optional[HandlerExecutor] = None,
+        bus_metrics: Optional[BusMetrics] = None,
+        tracer: Optional[Tracer] = None,
+        dead_letters: Optional[DeadLetterQueue] = None,
+    ):
+        self._event_handlers: Dict[Type[Event], List[HandlerEntry]] = defaultdict(list)
+        self._routed_handlers: Dict[
+            Type[Event], Dict[RoutingKey, List[HandlerEntry]]
+        ] = defaultdict(dict)
+        self._router = EventRouter()
+        self._seq = itertools.count()
         self.timeout = timeout
+        self.executor = executor or HandlerExecutor()
+        self.bus_metrics = bus_metrics or BusMetrics()
+        self.tracer = tracer or Tracer()
+        self._dlq = dead_letters or DeadLetterQueue()
+        self._dlq.bind(self._retry)
 
     @property
-    def dlq(self):
+    def dlq(self) -> DeadLetterQueue:
         return self._dlq
 
     def register(
         self,
         event_class: Type[Event],
         handler: HandlerType,
-        filter_func: Optional[Callable[[Event], bool]] = None,
+        filter_func: FilterType = None,
+        routing_key: Optional[RoutingKey] = None,
     ) -> None:
-        self._event_handlers[event_class].append((handler, filter_func))
+        entry = (handler, filter_func, next(self._seq))
+
+        if routing_key is None:
+            self._event_handlers[event_class].append(entry)
+            return
+
+        routed = self._routed_handlers[event_class]
+        routed[routing_key] = [*routed.get(routing_key, []), entry]
 
     def unregister(self, event_class: Type[Event], handler: HandlerType) -> None:
         self._event_handlers[event_class] = [
-            (h, filter_fn)
-            for h, filter_fn in self._event_handlers.get(event_class, [])
-            if h != handler
+            entry
+            for entry in self._event_handlers.get(event_class, [])
+            if entry[0] != handler
         ]
 
-    async def handle_event(self, event: Event, *args, **kwargs) -> None:
-        handlers = self._event_handlers.get(type(event), [])
+        routed = self._routed_handlers.get(event_class, {})
+
+        for key in list(routed):
+            entries = [entry for entry in routed[key] if entry[0] != handler]
+
+            if entries:
+                routed[key] = entries
+            else:
+                del routed[key]
 
-        for handler, filter_fn in handlers:
+    async def handle_event(self, event: Event, *args, **kwargs) -> None:
+        for handler, filter_fn, _ in self._get_handlers(event):
             if not filter_fn or filter_fn(event):
                 await self._call_handler(handler, event, *args, **kwargs)
 
+    def _get_handlers(self, event: Event) -> List[HandlerEntry]:
+        event_class = type(event)
+        handlers = self._event_handlers.get(event_class, [])
+        routed = self._routed_handlers.get(event_class)
+
+        if not routed:
+            return handlers
+
+        key = self._router.routing_key(event)
+
+        if key is None:
+            return list(heapq.merge(handlers, *routed.values(), key=_order))
+
+        keyed = routed.get(key)
+
+        if not keyed:
+            return handlers
+
+        return list(heapq.merge(handlers, keyed, key=_order))
+
     async def _call_handler(
         self, handler: HandlerType, event: Event, *args, **kwargs
     ) -> None:
+        await self._invoke(handler, event, args, kwargs)
+
+    async def _retry(self, letter: DeadLetter) -> bool:
+        self.bus_metrics.retry(letter.event, letter.handler)
+
+        recovered = await self._invoke(
+            letter.handler, letter.event, letter.args, letter.kwargs, letter.attempts
+        )
+
+        if recovered:
+            self.bus_metrics.recovered(letter.event, letter.handler)
+
+        return recovered
+
+    async def _invoke(
+        self,
+        handler: HandlerType,
+        event: Event,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        attempts: int = 0,
+    ) -> bool:
+        start_time = time.monotonic()
+        started_at = time.time() if self.tracer.enabled else 0.0
+        token = set_current_meta(event.meta)
+
         try:
             if isinstance(event, Task):
-                response = asyncio.create_task(
-                    self._execute_handler(handler, event, *args, **kwargs)
+                context = contextvars.copy_context()
+                context.run(set_current_meta, None)
+
+                response = spawn(
+                    self._execute_handler(handler, event, *args, **kwargs), context
                 )
             else:
                 response = await asyncio.wait_for(
@@ -63,15 +161,27 @@ class EventHandler:
                 )
 
             self._handle_event_response(event, response)
+
+            return True
+        except asyncio.TimeoutError as e:
+            self.bus_metrics.timeout(event, handler)
+            await self._handle_event_error(handler, event, e, args, kwargs, attempts)
         except Exception as e:
-            self._handle_event_error(handler, event, e)
+            await self._handle_event_error(handler, event, e, args, kwargs, attempts)
+        finally:
+            reset_current_meta(token)
+            duration = time.monotonic() - start_time
+            self.bus_metrics.observe_handler(event, handler, duration)
+
+            if self.tracer.enabled:
+                self.tracer.record(event, handler, started_at, started_at + duration)
+
+        return False
 
     async def _execute_handler(
         self, handler: HandlerType, event: Event, *args, **kwargs
     ) -> None:
-        if asyncio.iscoroutinefunction(handler):
-            return await handler(event, *args, **kwargs)
-        return await asyncio.to_thread(handler, event, *args, **kwargs)
+        return await self.executor.run(handler, event, *args, **kwargs)
 
     def _handle_event_response(self, event: Event, response: Any) -> None:
         if isinstance(event, Query):
@@ -81,9 +191,26 @@ class EventHandler:
         elif isinstance(event, Task):
             event.set_task(response)
 
-    def _handle_event_error(
-        self, handler: HandlerType, event: Event, error: Exception
+    async def _handle_event_error(
+        self,
+        handler: HandlerType,
+        event: Event,
+        error: Exception,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        attempts: int,
     ) -> None:
+        self.bus_metrics.dead_letter(event, handler)
+
+        letter = DeadLetter(handler, event, error, attempts + 1, args, kwargs)
+
+        if await self._dlq.add(letter):
+            logger.warning(
+                f"Exception encountered in event {event}:{handler} {error}. "
+                f"Retry {letter.attempts}/{self._dlq.policy.max_attempts} scheduled."
+            )
+            return
+
         if isinstance(event, Query):
             event.set_response(Result.Err(error))
         elif isinstance(event, Command):
@@ -91,8 +218,6 @@ class EventHandler:
         elif isinstance(event, Task):
             event.set_task(asyncio.create_task(asyncio.sleep(0.00001)))
 
-        self._dlq.append((event, error))
-
         logger.error(
             f"Exception encountered in event {event}:{handler} {error}. Event added to dead letter queue."
         )
@@ -0,0 +1,57 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from core.clock import set_replay_time
+from core.events._base import Event
+from core.models.dispatch_mode import DispatchMode
+
+from .direct_dispatch import set_dispatch_mode
+from .event_handler import EventHandler
+
+
+@dataclass(frozen=True)
+class ReplayStats:
+    events: int
+    elapsed: float
+
+    @property
+    def events_per_sec(self) -> float:
+        return self.events / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "events": self.events,
+            "elapsed": self.elapsed,
+            "events_per_sec": self.events_per_sec,
+        }
+
+
+class EventReplayer:
+    def __init__(self, event_handler: EventHandler):
+        self._event_handler = event_handler
+
+    async def replay(
+        self,
+        events: Iterable[Event],
+        handler: Optional[Callable[[Event], Awaitable[Any]]] = None,
+    ) -> ReplayStats:
+        return await asyncio.create_task(
+            self._run(events, handler or self._event_handler.handle_event)
+        )
+
+    async def _run(
+        self, events: Iterable[Event], handler: Callable[[Event], Awaitable[Any]]
+    ) -> ReplayStats:
+        set_dispatch_mode(DispatchMode.DIRECT)
+
+        count = 0
+        start = time.perf_counter()
+
+        for event in events:
+            set_replay_time(event.meta.timestamp)
+            await handler(event)
+            count += 1
+
+        return ReplayStats(count, time.perf_counter() - start)
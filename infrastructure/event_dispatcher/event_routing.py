@@ -0,0 +1,55 @@
+from dataclasses import fields
+from typing import Any, Callable, Dict, Hashable, Optional, Type
+
+from core.events._base import Event
+
+RoutingKey = Hashable
+KeyExtractor = Callable[[Event], Optional[RoutingKey]]
+
+
+def _key_of(source: Any) -> Optional[RoutingKey]:
+    symbol = getattr(source, "symbol", None)
+    timeframe = getattr(source, "timeframe", None)
+
+    if symbol is None or timeframe is None:
+        return None
+
+    return symbol, timeframe
+
+
+def _from_signal(event: Event) -> Optional[RoutingKey]:
+    return _key_of(event.signal)
+
+
+def _from_position(event: Event) -> Optional[RoutingKey]:
+    return _key_of(getattr(event.position, "signal", None))
+
+
+def _from_event(event: Event) -> Optional[RoutingKey]:
+    return _key_of(event)
+
+
+class EventRouter:
+    def __init__(self):
+        self._extractors: Dict[Type[Event], KeyExtractor] = {}
+
+    def routing_key(self, event: Event) -> Optional[RoutingKey]:
+        event_class = type(event)
+        extractor = self._extractors.get(event_class)
+
+        if extractor is None:
+            extractor = self._resolve_extractor(event_class)
+            self._extractors[event_class] = extractor
+
+        return extractor(event)
+
+    @staticmethod
+    def _resolve_extractor(event_class: Type[Event]) -> KeyExtractor:
+        names = {f.name for f in fields(event_class)}
+
+        if "signal" in names:
+            return _from_signal
+        if "position" in names:
+            return _from_position
+
+        return _from_event
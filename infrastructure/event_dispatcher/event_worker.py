@@ -1,13 +1,20 @@
 import asyncio
+import time
 from collections import deque
-from typing import Any, AsyncIterable, Dict, Tuple
+from typing import Any, AsyncIterable, Dict, List, Optional, Tuple
 
 import numpy as np
 
 from core.events._base import Event
+from core.models.dispatch_mode import DispatchMode
+from infrastructure.backpressure import BoundedQueue, consume_from
+from infrastructure.telemetry.bus_metrics import BusMetrics
 
+from .direct_dispatch import set_dispatch_mode
 from .event_handler import EventHandler
 
+STOP = object()
+
 
 class EventWorker:
     def __init__(
@@ -15,11 +22,17 @@ class EventWorker:
         event_handler: EventHandler,
         cancel_event: asyncio.Event,
         task_duration_limit: int = 100,
+        latency_smoothing: float = 0.2,
+        max_queue_size: int = 0,
+        bus_metrics: Optional[BusMetrics] = None,
     ):
         self._event_handler = event_handler
+        self._bus_metrics = bus_metrics
         self._cancel_event = cancel_event
-        self._queue = asyncio.Queue()
+        self._queue = BoundedQueue(max_queue_size)
         self._task_durations = deque(maxlen=task_duration_limit)
+        self._latency_smoothing = latency_smoothing
+        self._latency = 0.0
 
     @property
     def score(self):
@@ -27,27 +40,66 @@ class EventWorker:
             np.mean(self._task_durations) if len(self._task_durations) > 2 else 0.0
         )
 
+    @property
+    def queue_size(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def latency(self) -> float:
+        return self._latency
+
+    @property
+    def metrics(self):
+        return self._queue.metrics
+
+    def retire(self) -> None:
+        self._queue.put_nowait(STOP)
+
     async def run(self):
-        async for event, args, kwargs in self._get_event_stream():
+        consume_from(self._queue)
+        set_dispatch_mode(DispatchMode.QUEUED)
+
+        async for event, args, kwargs, enqueued_at in self._get_event_stream():
+            if self._bus_metrics:
+                self._bus_metrics.observe_queue_wait(
+                    event, time.monotonic() - enqueued_at
+                )
+
             start_time = asyncio.get_event_loop().time()
 
             await self._event_handler.handle_event(event, *args, **kwargs)
 
             end_time = asyncio.get_event_loop().time()
-            self._task_durations.append(end_time - start_time)
+            self._record_duration(end_time - start_time)
+
+    def _record_duration(self, duration: float) -> None:
+        self._task_durations.append(duration)
+        self._latency += self._latency_smoothing * (duration - self._latency)
 
     async def _get_event_stream(
         self,
-    ) -> AsyncIterable[Tuple[Event, Tuple[Any], Dict[str, Any]]]:
+    ) -> AsyncIterable[Tuple[Event, Tuple[Any], Dict[str, Any], float]]:
         while not self._cancel_event.is_set():
-            event, args, kwargs = await self._queue.get()
+            item = await self._queue.get()
+
+            if item is STOP:
+                self._queue.task_done()
+                return
 
-            yield event, args, kwargs
+            event, args, kwargs, enqueued_at = item
+
+            yield event, args, kwargs, enqueued_at
 
             self._queue.task_done()
 
     async def dispatch(self, event: Event, *args, **kwargs) -> None:
-        await self._queue.put((event, args, kwargs))
+        await self._queue.put((event, args, kwargs, time.monotonic()))
+
+    async def dispatch_many(self, events: List[Event], *args, **kwargs) -> None:
+        enqueued_at = time.monotonic()
+        await self._queue.put_many(
+            (event, args, kwargs, enqueued_at) for event in events
+        )
 
     async def wait(self) -> None:
         await self._queue.join()
@@ -0,0 +1,129 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+from core.models.execution_policy import ExecutionPolicy
+
+
+def resolve_policy(handler: Callable[..., Any]) -> ExecutionPolicy:
+    while isinstance(handler, partial):
+        handler = handler.func
+
+    return getattr(handler, "_execution_policy_", ExecutionPolicy.DEFAULT)
+
+
+def _timed_call(func: Callable[..., Any], args, kwargs):
+    return time.time(), func(*args, **kwargs)
+
+
+class PoolMetrics:
+    def __init__(self):
+        self.waiting = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.queue_wait = 0.0
+        self.max_queue_wait = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "waiting": self.waiting,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "queue_wait": self.queue_wait,
+            "max_queue_wait": self.max_queue_wait,
+        }
+
+    def record_wait(self, wait: float) -> None:
+        self.queue_wait += wait
+        self.max_queue_wait = max(self.max_queue_wait, wait)
+
+
+class HandlerPool:
+    def __init__(self, factory: Callable[[], Executor], max_pending: int):
+        self._factory = factory
+        self._executor: Optional[Executor] = None
+        self._pending = asyncio.Semaphore(max_pending)
+        self.metrics = PoolMetrics()
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        submitted_at = time.time()
+
+        self.metrics.waiting += 1
+
+        try:
+            await self._pending.acquire()
+        finally:
+            self.metrics.waiting -= 1
+
+        self.metrics.in_flight += 1
+
+        try:
+            started_at, result = await loop.run_in_executor(
+                self.executor, _timed_call, func, args, kwargs
+            )
+        except Exception:
+            self.metrics.failed += 1
+            raise
+        finally:
+            self.metrics.in_flight -= 1
+            self._pending.release()
+
+        self.metrics.record_wait(max(started_at - submitted_at, 0.0))
+        self.metrics.completed += 1
+
+        return result
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = self._factory()
+
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class HandlerExecutor:
+    def __init__(self, thread_workers: int = 4, max_pending: int = 256):
+        self._pools = {
+            ExecutionPolicy.THREAD: HandlerPool(
+                partial(
+                    ThreadPoolExecutor,
+                    max_workers=thread_workers,
+                    thread_name_prefix="handler",
+                ),
+                max_pending,
+            ),
+        }
+
+    async def run(self, handler: Callable[..., Any], *args, **kwargs) -> Any:
+        if asyncio.iscoroutinefunction(handler):
+            return await handler(*args, **kwargs)
+
+        policy = resolve_policy(handler)
+
+        if policy == ExecutionPolicy.INLINE:
+            return handler(*args, **kwargs)
+
+        if policy in self._pools:
+            return await self._pools[policy].run(handler, *args, **kwargs)
+
+        return await asyncio.to_thread(handler, *args, **kwargs)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            policy.name.lower(): pool.metrics.to_dict()
+            for policy, pool in self._pools.items()
+        }
+
+    def shutdown(self) -> None:
+        for pool in self._pools.values():
+            pool.shutdown()
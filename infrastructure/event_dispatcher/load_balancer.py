@@ -1,12 +1,17 @@
+import random
+from bisect import bisect_right
+
 import numpy as np
 
 from .pid_controller import PID
 
 
-def softmax(x, temperature=1.0):
-    x = x / temperature
-    e_x = np.exp(x - np.max(x))
-    return e_x / np.sum(e_x)
+def softmax(x, temperature=1.0, out=None):
+    out = np.divide(x, temperature, out=out)
+    np.subtract(out, np.max(out), out=out)
+    np.exp(out, out=out)
+    np.divide(out, np.sum(out), out=out)
+    return out
 
 
 class LoadBalancer:
@@ -22,8 +27,10 @@ class LoadBalancer:
         threshold_growth_rate: float = 1.1,
         smoothing_factor: float = 0.2,
         temperature: float = 0.5,
+        refresh_interval: int = 32,
     ):
         self._group_event_counts = np.zeros(priority_groups)
+        self._total_events = 0.0
         self._pid = PID(
             priority_groups,
             initial_kp,
@@ -37,38 +44,57 @@ class LoadBalancer:
         self._target_ratios = 1 / (np.arange(priority_groups) + 1)
         self._smoothing_factor = smoothing_factor
         self._temperature = temperature
+        self._refresh_interval = max(1, refresh_interval)
+
+        self._ratios = np.zeros(priority_groups)
+        self._errors = np.zeros(priority_groups)
+        self._outputs = np.zeros(priority_groups)
+        self._prob = np.zeros(priority_groups)
+        self._cum_prob = []
+        self._since_refresh = 0
 
-    def register_event(self, priority_group: int):
+    def register_event(self, priority_group: int, count: int = 1):
         if not 0 <= priority_group < len(self._group_event_counts):
             raise ValueError(f"Invalid priority group: {priority_group}")
 
-        self._group_event_counts[priority_group] += 1
+        self._group_event_counts[priority_group] += count
+        self._total_events += count
 
         if self._group_event_counts.max() > self._group_event_counts_threshold:
             self._group_event_counts *= 0.5
+            self._total_events *= 0.5
 
         self._group_event_counts_threshold = max(
             self._group_event_counts_threshold * self._threshold_growth_rate, 1e4
         )
 
     def determine_priority_group(self, priority: int) -> int:
-        total_group = self._group_event_counts.sum()
+        if self._total_events == 0:
+            return min(max(priority - 1, 0), len(self._group_event_counts) - 1)
 
-        if total_group == 0:
-            return np.clip(priority - 1, 0, len(self._group_event_counts) - 1)
+        if not self._cum_prob or self._since_refresh >= self._refresh_interval:
+            self._refresh_probabilities()
 
-        processed_ratios = self._group_event_counts / total_group
-        errors = self._target_ratios - processed_ratios
+        self._since_refresh += 1
 
-        control_outputs = self._pid.update(errors)
+        choice = bisect_right(self._cum_prob, random.random() * self._cum_prob[-1])
 
-        penalty_factor = np.exp(-processed_ratios)
-        weighted_outputs = control_outputs * penalty_factor
-        smoothed_outputs = (
-            self._smoothing_factor * weighted_outputs
-            + (1 - self._smoothing_factor) * control_outputs
-        )
+        return min(choice, len(self._cum_prob) - 1)
+
+    def _refresh_probabilities(self) -> None:
+        np.divide(self._group_event_counts, self._total_events, out=self._ratios)
+        np.subtract(self._target_ratios, self._ratios, out=self._errors)
+
+        control_outputs = self._pid.update(self._errors)
+
+        np.negative(self._ratios, out=self._outputs)
+        np.exp(self._outputs, out=self._outputs)
+        np.multiply(self._outputs, control_outputs, out=self._outputs)
+        np.multiply(self._outputs, self._smoothing_factor, out=self._outputs)
+        np.multiply(control_outputs, 1 - self._smoothing_factor, out=self._prob)
+        np.add(self._outputs, self._prob, out=self._outputs)
 
-        prob = softmax(smoothed_outputs, temperature=self._temperature)
+        softmax(self._outputs, temperature=self._temperature, out=self._prob)
 
-        return np.random.choice(np.arange(len(prob)), p=prob)
+        self._cum_prob = np.cumsum(self._prob).tolist()
+        self._since_refresh = 0
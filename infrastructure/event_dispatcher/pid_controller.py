@@ -21,27 +21,31 @@ class PID:
         self.learning_rate = learning_rate
         self.decay_rate = decay_rate
 
-    def update(self, errors: np.ndarray):
-        control_outputs = np.zeros_like(errors)
+        self._derivative = np.zeros(num_groups)
+        self._scratch = np.zeros(num_groups)
+        self._control_outputs = np.zeros(num_groups)
 
-        for i, error in enumerate(errors):
-            self.integral_errors[i] += error
-            derivative = error - self.previous_errors[i]
+    def update(self, errors: np.ndarray) -> np.ndarray:
+        np.add(self.integral_errors, errors, out=self.integral_errors)
+        np.subtract(errors, self.previous_errors, out=self._derivative)
 
-            self.kp[i] = np.clip(self.kp[i] + self.learning_rate * error, 0, 1)
-            self.ki[i] = np.clip(
-                self.ki[i] + self.learning_rate * self.integral_errors[i], 0, 1
-            )
-            self.kd[i] = np.clip(self.kd[i] + self.learning_rate * derivative, 0, 1)
+        self._adapt_gain(self.kp, errors)
+        self._adapt_gain(self.ki, self.integral_errors)
+        self._adapt_gain(self.kd, self._derivative)
 
-            control_outputs[i] = (
-                self.kp[i] * error
-                + self.ki[i] * self.integral_errors[i]
-                + self.kd[i] * derivative
-            )
+        np.multiply(self.kp, errors, out=self._control_outputs)
+        np.multiply(self.ki, self.integral_errors, out=self._scratch)
+        np.add(self._control_outputs, self._scratch, out=self._control_outputs)
+        np.multiply(self.kd, self._derivative, out=self._scratch)
+        np.add(self._control_outputs, self._scratch, out=self._control_outputs)
 
-            self.previous_errors[i] = error
+        self.previous_errors[:] = errors
 
         self.learning_rate *= self.decay_rate
 
-        return control_outputs
+        return self._control_outputs
+
+    def _adapt_gain(self, gain: np.ndarray, signal: np.ndarray) -> None:
+        np.multiply(signal, self.learning_rate, out=self._scratch)
+        np.add(gain, self._scratch, out=gain)
+        np.clip(gain, 0, 1, out=gain)
@@ -0,0 +1,158 @@
+import asyncio
+from collections import defaultdict
+from dataclasses import fields
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Type
+
+from cachetools import LRUCache, TTLCache
+
+from core.events._base import Event
+from core.models.cache_policy import CacheKey, CachePolicy, KeyFunc
+from core.queries._base import Query
+from core.result import Result
+
+Invalidator = Tuple[Type[Query], Optional[KeyFunc]]
+
+
+class CacheStats:
+    __slots__ = ("hits", "misses", "coalesced", "invalidations")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "invalidations": self.invalidations,
+            "hit_ratio": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+        }
+
+
+class QueryCache:
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._caches: Dict[Type[Query], LRUCache] = {}
+        self._fields: Dict[Type[Query], Tuple[str, ...]] = {}
+        self._invalidators: Dict[Type[Event], List[Invalidator]] = defaultdict(list)
+        self._inflight: Dict[Tuple[Type[Query], CacheKey], asyncio.Future] = {}
+        self._stale: Set[Tuple[Type[Query], CacheKey]] = set()
+        self._stats: Dict[Type[Query], CacheStats] = defaultdict(CacheStats)
+
+    async def get(self, query: Query, fetch: Callable[[], Awaitable[Result]]) -> Result:
+        policy = query.CACHE
+
+        if not self.enabled or policy is None:
+            return await fetch()
+
+        query_type = type(query)
+        cache = self._caches.get(query_type)
+
+        if cache is None:
+            cache = self._create(query_type, policy)
+
+        stats = self._stats[query_type]
+        key = (query_type, self._key(query))
+
+        try:
+            result = cache.get(key)
+        except TypeError:
+            return await fetch()
+
+        if result is not None:
+            stats.hits += 1
+            return result
+
+        inflight = self._inflight.get(key)
+
+        if inflight is not None:
+            stats.coalesced += 1
+
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+
+                return await fetch()
+
+        stats.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            result = await fetch()
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._inflight[key]
+
+        future.set_result(result)
+
+        if key in self._stale:
+            self._stale.discard(key)
+        elif result.is_ok():
+            cache[key] = result
+
+        return result
+
+    def invalidate(self, event: Event) -> None:
+        for query_type, key_func in self._invalidators.get(type(event), ()):
+            cache = self._caches[query_type]
+
+            if key_func is None:
+                cache.clear()
+                self._stale.update(
+                    key for key in self._inflight if key[0] is query_type
+                )
+            else:
+                key = (query_type, key_func(event))
+                cache.pop(key, None)
+
+                if key in self._inflight:
+                    self._stale.add(key)
+
+            self._stats[query_type].invalidations += 1
+
+    def clear(self) -> None:
+        for cache in self._caches.values():
+            cache.clear()
+
+        self._stale.update(self._inflight)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            query_type.__name__: {
+                **stats.to_dict(),
+                "size": len(self._caches.get(query_type, ())),
+            }
+            for query_type, stats in self._stats.items()
+        }
+
+    def _create(self, query_type: Type[Query], policy: CachePolicy) -> LRUCache:
+        cache = (
+            TTLCache(maxsize=policy.maxsize, ttl=policy.ttl)
+            if policy.ttl
+            else LRUCache(maxsize=policy.maxsize)
+        )
+
+        self._caches[query_type] = cache
+        self._fields[query_type] = tuple(
+            f.name
+            for f in fields(query_type)
+            if f.name != "meta" and not f.name.startswith("_")
+        )
+
+        for event_type, key_func in policy.invalidated_by.items():
+            self._invalidators[event_type].append((query_type, key_func))
+
+        return cache
+
+    def _key(self, query: Query) -> CacheKey:
+        return tuple(getattr(query, name) for name in self._fields[type(query)])
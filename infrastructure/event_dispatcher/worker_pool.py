@@ -1,14 +1,29 @@
 import asyncio
-from typing import List
-
-import numpy as np
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
 
 from core.events._base import Event
+from infrastructure.backpressure import QueueMetrics
+from infrastructure.telemetry.bus_metrics import BusMetrics
 
 from .event_dedup import EventDedup
 from .event_handler import EventHandler
 from .event_worker import EventWorker
 from .load_balancer import LoadBalancer
+from .worker_selector import WeightedRandomSelector, WorkerSelector
+
+
+@dataclass(frozen=True)
+class ScalingPolicy:
+    min_workers: int
+    max_workers: int
+    interval: int = 64
+    scale_up_depth: int = 8
+    idle_checks: int = 4
+
+    @classmethod
+    def fixed(cls, num_workers: int) -> "ScalingPolicy":
+        return cls(num_workers, num_workers)
 
 
 class WorkerPool:
@@ -18,25 +33,41 @@ class WorkerPool:
         num_piority_groups: int,
         event_handler: EventHandler,
         cancel_event: asyncio.Event,
-        alpha: float = 0.7,
-        beta: float = 0.3,
+        selector: Optional[WorkerSelector] = None,
+        balancer_refresh: int = 32,
+        max_queue_size: int = 0,
+        bus_metrics: Optional[BusMetrics] = None,
+        scaling: Optional[ScalingPolicy] = None,
+        dedup: Optional[EventDedup] = None,
     ):
-        self.workers = []
-        self.load_balancer = LoadBalancer(num_piority_groups)
-        self.dedup = EventDedup()
+        self.load_balancer = LoadBalancer(
+            num_piority_groups, refresh_interval=balancer_refresh
+        )
+        self.dedup = dedup or EventDedup()
         self.event_handler = event_handler
         self.cancel_event = cancel_event
         self._num_priority_groups = num_piority_groups
-        self._initialize_workers(num_workers)
-        self.alpha = alpha
-        self.beta = beta
+        self.selector = selector or WeightedRandomSelector()
+        self._max_queue_size = max_queue_size
+        self._bus_metrics = bus_metrics
+        self.scaling = scaling or ScalingPolicy.fixed(num_workers)
+        self._groups: List[List[EventWorker]] = []
+        self._idle_checks = [0] * num_piority_groups
+        self._retiring: Set[EventWorker] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._since_scale = 0
+        self._initialize_workers()
+
+    @property
+    def workers(self) -> List[EventWorker]:
+        return [worker for group in self._groups for worker in group]
 
     async def dispatch_to_worker(self, event: Event, *args, **kwargs) -> None:
         priority_group = self.load_balancer.determine_priority_group(
             event.meta.priority
         )
 
-        if await self.dedup.acquire(event):
+        if self.dedup.acquire(event):
             group_workers = self._distribute_workers(priority_group)
 
             worker = self._choose_worker(group_workers)
@@ -44,43 +75,101 @@ class WorkerPool:
             await worker.dispatch(event, *args, **kwargs)
 
         self.load_balancer.register_event(priority_group)
+        self._tick(1)
 
-    async def wait(self) -> None:
-        await asyncio.gather(*(worker.wait() for worker in self.workers))
+    async def dispatch_many_to_worker(
+        self, events: List[Event], *args, **kwargs
+    ) -> None:
+        if not events:
+            return
 
-    def _initialize_workers(self, num_workers):
-        self.workers = [
-            EventWorker(self.event_handler, self.cancel_event)
-            for _ in range(num_workers * self._num_priority_groups)
-        ]
+        priority_group = self.load_balancer.determine_priority_group(
+            events[0].meta.priority
+        )
 
-        asyncio.gather(*(worker.run() for worker in self.workers))
+        accepted = self.dedup.acquire_many(events)
 
-    def _distribute_workers(self, priority_group: int) -> List[EventWorker]:
-        workers_per_group = len(self.workers) // self._num_priority_groups
-        group_start = priority_group * workers_per_group
-        group_end = group_start + workers_per_group
+        if accepted:
+            group_workers = self._distribute_workers(priority_group)
 
-        return self.workers[group_start:group_end]
+            worker = self._choose_worker(group_workers)
 
-    def _choose_worker(self, group_workers: List[EventWorker]) -> EventWorker:
-        scores = np.array([worker.score for worker in group_workers])
-        queue_sizes, median_times = scores[:, 0], scores[:, 1]
+            await worker.dispatch_many(accepted, *args, **kwargs)
+
+        self.load_balancer.register_event(priority_group, len(events))
+        self._tick(len(events))
 
-        norm_queue_sizes = (queue_sizes - queue_sizes.min() + 1) / (
-            queue_sizes.max() - queue_sizes.min() + 1
+    async def wait(self) -> None:
+        await asyncio.gather(
+            *(worker.wait() for worker in [*self.workers, *self._retiring])
         )
-        norm_median_times = (median_times - median_times.min() + 1) / (
-            median_times.max() - median_times.min() + 1
+
+    def metrics(self) -> Dict[str, Any]:
+        metrics = QueueMetrics.merge(
+            worker.metrics for worker in [*self.workers, *self._retiring]
         )
+        metrics["workers"] = [len(group) for group in self._groups]
+        metrics["retiring"] = len(self._retiring)
+        return metrics
+
+    def _initialize_workers(self):
+        self._groups = [
+            [self._spawn_worker() for _ in range(self.scaling.min_workers)]
+            for _ in range(self._num_priority_groups)
+        ]
+
+    def _spawn_worker(self) -> EventWorker:
+        worker = EventWorker(
+            self.event_handler,
+            self.cancel_event,
+            max_queue_size=self._max_queue_size,
+            bus_metrics=self._bus_metrics,
+        )
+
+        task = asyncio.create_task(worker.run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(lambda _: self._retiring.discard(worker))
+
+        return worker
 
-        combined_scores = self.alpha * norm_queue_sizes + self.beta * norm_median_times
+    def _tick(self, count: int) -> None:
+        if self.scaling.min_workers == self.scaling.max_workers:
+            return
 
-        weights = 1 / (combined_scores + np.finfo(float).eps)
-        total_weight = sum(weights)
+        self._since_scale += count
 
-        choice_point = np.random.uniform(0, total_weight)
-        cum_weights = np.cumsum(weights)
-        worker_index = np.searchsorted(cum_weights, choice_point)
+        if self._since_scale >= self.scaling.interval:
+            self._since_scale = 0
+            self._autoscale()
 
-        return group_workers[worker_index]
+    def _autoscale(self) -> None:
+        for priority_group, group in enumerate(self._groups):
+            depth = sum(worker.queue_size for worker in group)
+
+            if (
+                depth >= self.scaling.scale_up_depth * len(group)
+                and len(group) < self.scaling.max_workers
+            ):
+                group.append(self._spawn_worker())
+                self._idle_checks[priority_group] = 0
+            elif depth < len(group) and len(group) > self.scaling.min_workers:
+                self._idle_checks[priority_group] += 1
+
+                if self._idle_checks[priority_group] >= self.scaling.idle_checks:
+                    self._retire_worker(group)
+                    self._idle_checks[priority_group] = 0
+            else:
+                self._idle_checks[priority_group] = 0
+
+    def _retire_worker(self, group: List[EventWorker]) -> None:
+        worker = min(group, key=lambda w: w.latency)
+        group.remove(worker)
+        self._retiring.add(worker)
+        worker.retire()
+
+    def _distribute_workers(self, priority_group: int) -> List[EventWorker]:
+        return self._groups[priority_group]
+
+    def _choose_worker(self, group_workers: List[EventWorker]) -> EventWorker:
+        return self.selector.select(group_workers)
@@ -0,0 +1,78 @@
+import random
+from abc import ABC, abstractmethod
+from typing import List
+
+import numpy as np
+
+from .event_worker import EventWorker
+
+
+class WorkerSelector(ABC):
+    @abstractmethod
+    def select(self, workers: List[EventWorker]) -> EventWorker:
+        pass
+
+
+class WeightedRandomSelector(WorkerSelector):
+    def __init__(self, alpha: float = 0.7, beta: float = 0.3):
+        self.alpha = alpha
+        self.beta = beta
+
+    def select(self, workers: List[EventWorker]) -> EventWorker:
+        scores = np.array([worker.score for worker in workers])
+        queue_sizes, median_times = scores[:, 0], scores[:, 1]
+
+        norm_queue_sizes = (queue_sizes - queue_sizes.min() + 1) / (
+            queue_sizes.max() - queue_sizes.min() + 1
+        )
+        norm_median_times = (median_times - median_times.min() + 1) / (
+            median_times.max() - median_times.min() + 1
+        )
+
+        combined_scores = self.alpha * norm_queue_sizes + self.beta * norm_median_times
+
+        weights = 1 / (combined_scores + np.finfo(float).eps)
+        total_weight = sum(weights)
+
+        choice_point = np.random.uniform(0, total_weight)
+        cum_weights = np.cumsum(weights)
+        worker_index = np.searchsorted(cum_weights, choice_point)
+
+        return workers[worker_index]
+
+
+class PowerOfTwoSelector(WorkerSelector):
+    def __init__(self, min_latency: float = 1e-6):
+        self.min_latency = min_latency
+
+    def select(self, workers: List[EventWorker]) -> EventWorker:
+        num_workers = len(workers)
+
+        if num_workers == 1:
+            return workers[0]
+
+        first = random.randrange(num_workers)
+        second = random.randrange(num_workers - 1)
+
+        if second >= first:
+            second += 1
+
+        a, b = workers[first], workers[second]
+
+        a_cost = (a.queue_size + 1) * max(a.latency, self.min_latency)
+        b_cost = (b.queue_size + 1) * max(b.latency, self.min_latency)
+
+        return a if a_cost <= b_cost else b
+
+
+SELECTORS = {
+    "weighted": WeightedRandomSelector,
+    "p2c": PowerOfTwoSelector,
+}
+
+
+def create_selector(name: str) -> WorkerSelector:
+    if name not in SELECTORS:
+        raise ValueError(f"Unknown worker selection strategy: {name}")
+
+    return SELECTORS[name]()
@@ -1,14 +1,24 @@
 import asyncio
 import json
 from abc import ABC
+from dataclasses import fields, is_dataclass
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Dict
 
 import numpy as np
+import orjson
 
 from core.events._base import Event
 from core.models.indicator import Indicator
 
+ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_APPEND_NEWLINE
+)
+
 
 class Encoder(json.JSONEncoder):
     def default(self, obj):
@@ -28,3 +38,73 @@ class Encoder(json.JSONEncoder):
             return None
 
         return str(obj)
+
+
+class EventEncoder:
+    def __init__(self):
+        self._defaults: Dict[type, Callable[[Any], Any]] = {}
+        self._schemas: Dict[type, Callable[[Any], Any]] = {}
+
+    def encode(self, event: Event) -> bytes:
+        if type(event).to_dict is not Event.to_dict:
+            return self.dumps(event.to_dict())
+
+        return orjson.dumps(event, default=self._schema, option=ORJSON_OPTIONS)
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=self._default, option=ORJSON_OPTIONS)
+
+    # orjson skips underscore fields of dataclasses, so they are passed through
+    # and flattened one level per object; orjson walks the values itself.
+    def _schema(self, obj: Any) -> Any:
+        cls = type(obj)
+        handler = self._schemas.get(cls)
+
+        if handler is None:
+            handler = self._schemas[cls] = self._resolve_schema(obj)
+
+        return handler(obj)
+
+    def _resolve_schema(self, obj: Any) -> Callable[[Any], Any]:
+        if not is_dataclass(obj) or isinstance(obj, type):
+            return self._resolve(obj)
+
+        names = tuple(f.name for f in fields(obj))
+
+        if not isinstance(obj, Event):
+            return lambda o: {name: getattr(o, name) for name in names}
+
+        event_name = obj.__class__.__name__
+
+        def event(o: Event) -> Dict[str, Any]:
+            res = {name: getattr(o, name) for name in names}
+            res["meta"] = {**self._schema(o.meta), "name": event_name}
+            return res
+
+        return event
+
+    def _default(self, obj: Any) -> Any:
+        cls = type(obj)
+        handler = self._defaults.get(cls)
+
+        if handler is None:
+            handler = self._defaults[cls] = self._resolve(obj)
+
+        return handler(obj)
+
+    @staticmethod
+    def _resolve(obj: Any) -> Callable[[Any], Any]:
+        if isinstance(obj, ABC):
+            return lambda o: o.__class__.__name__
+        if isinstance(obj, np.ndarray):
+            return lambda o: o.tolist()
+        if isinstance(obj, tuple):
+            return list
+        if isinstance(obj, (Event, Indicator)):
+            return lambda o: o.to_dict()
+        if isinstance(obj, type(Any)):
+            return lambda _: "Any"
+        if isinstance(obj, asyncio.Future):
+            return lambda _: None
+
+        return str
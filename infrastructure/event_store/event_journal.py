@@ -0,0 +1,165 @@
+import importlib
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any, Dict, Tuple
+
+from core.events._base import Event
+
+from .event_encoder import EventEncoder
+
+JOURNAL_SUFFIX = ".journal"
+TRUSTED_MODULES = ("core.", "factor.")
+
+_TYPE, _ENUM, _CLASS, _TUPLE, _DICT = (
+    "__type__",
+    "__enum__",
+    "__class__",
+    "__tuple__",
+    "__dict__",
+)
+_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def journal_group(group: str) -> str:
+    return f"{group}{JOURNAL_SUFFIX}"
+
+
+def _path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _fields(cls: type) -> Tuple[str, ...]:
+    names = _FIELDS.get(cls)
+
+    if names is None:
+        names = _FIELDS[cls] = tuple(f.name for f in fields(cls))
+
+    return names
+
+
+class EventJournal:
+    def __init__(self):
+        self._encoder = EventEncoder()
+        self._types: Dict[str, type] = {}
+
+    def encode(self, event: Event) -> bytes:
+        return self._encoder.dumps(
+            {
+                "meta": {
+                    "name": event.__class__.__name__,
+                    "timestamp": event.meta.timestamp,
+                },
+                "event": self._to_typed(event),
+            }
+        )
+
+    def decode(self, record: Dict[str, Any]) -> Event:
+        event = self._from_typed(record["event"])
+
+        if not isinstance(event, Event):
+            raise TypeError(f"Journal record is not an event: {record['meta']}")
+
+        return event
+
+    def _to_typed(self, obj: Any) -> Any:
+        if isinstance(obj, type):
+            return {_CLASS: _path(obj)}
+
+        if isinstance(obj, Enum):
+            return {_ENUM: _path(type(obj)), "value": self._to_typed(obj.value)}
+
+        if is_dataclass(obj):
+            return {
+                _TYPE: _path(type(obj)),
+                "fields": {
+                    name: self._to_typed(getattr(obj, name))
+                    for name in _fields(type(obj))
+                },
+            }
+
+        if isinstance(obj, list):
+            return [self._to_typed(item) for item in obj]
+
+        if isinstance(obj, tuple) and not hasattr(obj, "_fields"):
+            return {_TUPLE: [self._to_typed(item) for item in obj]}
+
+        if isinstance(obj, dict):
+            return {
+                _DICT: [
+                    [self._to_typed(key), self._to_typed(value)]
+                    for key, value in obj.items()
+                ]
+            }
+
+        return obj
+
+    def _from_typed(self, data: Any) -> Any:
+        if isinstance(data, list):
+            return [self._from_typed(item) for item in data]
+
+        if not isinstance(data, dict):
+            return data
+
+        if _TYPE in data:
+            return self._build(self._resolve(data[_TYPE]), data["fields"])
+
+        if _ENUM in data:
+            cls = self._resolve(data[_ENUM])
+
+            if not issubclass(cls, Enum):
+                raise TypeError(f"Journal type is not an enum: {cls.__name__}")
+
+            return cls(self._from_typed(data["value"]))
+
+        if _CLASS in data:
+            return self._resolve(data[_CLASS])
+
+        if _TUPLE in data:
+            return tuple(self._from_typed(item) for item in data[_TUPLE])
+
+        if _DICT in data:
+            return {
+                self._from_typed(key): self._from_typed(value)
+                for key, value in data[_DICT]
+            }
+
+        raise ValueError(f"Untagged journal value: {sorted(data)}")
+
+    def _build(self, cls: type, data: Dict[str, Any]) -> Any:
+        if not is_dataclass(cls):
+            raise TypeError(f"Journal type is not a dataclass: {cls.__name__}")
+
+        names = _fields(cls)
+
+        if set(names) != set(data):
+            raise ValueError(f"Journal schema mismatch for {cls.__name__}")
+
+        obj = cls.__new__(cls)
+
+        for name in names:
+            object.__setattr__(obj, name, self._from_typed(data[name]))
+
+        return obj
+
+    def _resolve(self, path: str) -> type:
+        cls = self._types.get(path)
+
+        if cls is not None:
+            return cls
+
+        module, _, qualname = path.partition(":")
+
+        if not module.startswith(TRUSTED_MODULES):
+            raise ValueError(f"Untrusted journal type: {path}")
+
+        cls = importlib.import_module(module)
+
+        for name in qualname.split("."):
+            cls = getattr(cls, name)
+
+        if not isinstance(cls, type):
+            raise TypeError(f"Journal type is not a class: {path}")
+
+        self._types[path] = cls
+
+        return cls
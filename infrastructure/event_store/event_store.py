@@ -1,11 +1,21 @@
+import heapq
 import json
+import logging
 import os
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
 
 from core.events._base import Event
+from core.groups.event import EventGroup
 from core.interfaces.abstract_config import AbstractConfig
 
-from .event_encoder import Encoder
+from .event_journal import EventJournal, journal_group
+from .event_writer import EventWriter
+from .segment_log import SegmentPolicy
+
+logger = logging.getLogger(__name__)
+
+LEGACY_CHUNK_SIZE = 64 * 1024
+LEGACY_SEPARATORS = " \t\r\n[],"
 
 
 class SingletonMeta(type):
@@ -28,8 +38,23 @@ class EventStore(metaclass=SingletonMeta):
 
         self.buffer_size = config["buf_size"]
         self.buffer = {}
-
-    def append(self, event: Event):
+        self.writer = EventWriter(
+            self.base_dir,
+            SegmentPolicy(
+                config.get("segment_size", 64 * 1024 * 1024),
+                config.get("index_block_size", 256),
+                bool(config.get("rotate_daily", 1)),
+                config.get("seal_codec", ""),
+                config.get("seal_level", 6),
+            ),
+            config.get("durability", "interval"),
+            config.get("fsync_interval", 1.0),
+            config.get("writer_queue_size", 256),
+            bool(config.get("journal", 0)),
+        )
+        self.journal = EventJournal()
+
+    async def append(self, event: Event):
         group = str(event.meta.group)
 
         if group not in self.buffer:
@@ -38,54 +63,132 @@ class EventStore(metaclass=SingletonMeta):
         self.buffer[group].append(event)
 
         if len(self.buffer[group]) >= self.buffer_size:
-            self._flush_buffer(group)
+            await self._flush_buffer(group)
+
+    async def append_many(self, events: List[Event]):
+        groups = set()
+
+        for event in events:
+            group = str(event.meta.group)
+
+            if group not in self.buffer:
+                self.buffer[group] = []
+
+            self.buffer[group].append(event)
+            groups.add(group)
+
+        for group in groups:
+            if len(self.buffer[group]) >= self.buffer_size:
+                await self._flush_buffer(group)
+
+    async def flush(self) -> None:
+        for group in list(self.buffer):
+            await self._flush_buffer(group)
+
+        await self.writer.flush()
 
     def get(self, group: str) -> list:
+        return list(self.stream(group))
+
+    # Readers see what has been handed to the writer; await flush() first to
+    # include events still buffered in the store.
+    def stream(self, group: str) -> Iterator[Union[Dict[str, Any], Event]]:
+        self.writer.join()
+
         file_path = self._get_file_path(group)
 
         if os.path.exists(file_path):
-            with open(file_path, "r") as f:
-                events_from_file = json.load(f)
-        else:
-            events_from_file = []
+            yield from self._read_legacy(file_path)
 
-        events_from_buffer = self.buffer.get(group, [])
+        yield from self.writer.log(group).read()
 
-        return events_from_file + events_from_buffer
+    def query(
+        self,
+        group: str,
+        event_type: Optional[Union[Type[Event], str]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        self.writer.join()
 
-    def close(self) -> None:
-        for group in self.buffer:
-            self._flush_buffer(group)
+        events = None
 
-    def _get_file_path(self, group: str, date: Optional[str] = None) -> str:
-        if date:
-            filename = f"{group}_{date}_snapshot.json"
-        else:
-            filename = f"{group}.json"
+        if event_type is not None:
+            events = {
+                event_type if isinstance(event_type, str) else event_type.__name__
+            }
 
-        return os.path.join(self.base_dir, filename)
+        yield from self.writer.log(group).scan(events, start, end)
 
-    def _flush_buffer(self, group: str) -> None:
-        if group in self.buffer and len(self.buffer[group]) > 0:
-            self._append_to_file(group, self.buffer[group])
-            self.buffer[group] = []
+    def replay(
+        self,
+        groups: Optional[Iterable[str]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Iterator[Event]:
+        groups = [str(group) for group in (groups or EventGroup)]
 
-    def _append_to_file(self, group: str, events: list) -> None:
-        file_path = self._get_file_path(group)
+        self.writer.join()
+
+        journals = [
+            self._decode(self.writer.log(journal_group(group)).scan(None, start, end))
+            for group in groups
+        ]
+
+        yield from heapq.merge(*journals, key=lambda event: event.meta.timestamp)
+
+    def metrics(self) -> Dict[str, Any]:
+        return self.writer.metrics.to_dict()
+
+    async def close(self) -> None:
+        for group in list(self.buffer):
+            await self._flush_buffer(group)
+
+        await self.writer.close()
+
+    def _decode(self, records: Iterable[Dict[str, Any]]) -> Iterator[Event]:
+        for record in records:
+            try:
+                yield self.journal.decode(record)
+            except Exception as e:
+                self.writer.metrics.unreplayed += 1
+                logger.warning(f"Skipped journal record {record.get('meta')}: {e}")
 
-        if not os.path.exists(file_path):
-            with open(file_path, "w") as f:
-                f.write("[]")
+    def _get_file_path(self, group: str) -> str:
+        return os.path.join(self.base_dir, f"{group}.json")
 
-        with open(file_path, "rb+") as f:
-            f.seek(-1, os.SEEK_END)
-            f.truncate()
+    # The pre-segment store kept each group as one JSON array; decode it a
+    # record at a time so streaming it does not load the whole file.
+    @staticmethod
+    def _read_legacy(path: str) -> Iterator[Dict[str, Any]]:
+        decoder = json.JSONDecoder()
 
-            for event in events:
-                if f.tell() > 1:
-                    f.write(",".encode("utf-8"))
+        with open(path, "r") as f:
+            buffer, pos, eof = "", 0, False
 
-                event_data = json.dumps(event, cls=Encoder)
-                f.write(event_data.encode("utf-8"))
+            while True:
+                while pos < len(buffer) and buffer[pos] in LEGACY_SEPARATORS:
+                    pos += 1
+
+                if pos == len(buffer) and eof:
+                    return
+
+                try:
+                    record, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+
+                    chunk = f.read(LEGACY_CHUNK_SIZE)
+                    buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+                    continue
+
+                yield record
+
+    async def _flush_buffer(self, group: str) -> None:
+        if group in self.buffer and len(self.buffer[group]) > 0:
+            events, self.buffer[group] = self.buffer[group], []
+            await self._append_to_file(group, events)
 
-            f.write("]".encode("utf-8"))
+    async def _append_to_file(self, group: str, events: list) -> None:
+        await self.writer.submit(group, events)
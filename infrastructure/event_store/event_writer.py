@@ -0,0 +1,237 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from core.events._base import Event
+
+from .event_encoder import EventEncoder
+from .event_journal import EventJournal, journal_group
+from .segment_log import IndexKey, SegmentLog, SegmentPolicy
+
+logger = logging.getLogger(__name__)
+
+DURABILITY = {"batch", "interval", "close"}
+
+STOP = object()
+
+Batch = Tuple[str, List[Event], float]
+
+
+class WriterMetrics:
+    def __init__(self):
+        self.submitted = 0
+        self.written = 0
+        self.batches = 0
+        self.fsyncs = 0
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.blocked_puts = 0
+        self.blocked_time = 0.0
+        self.unjournaled = 0
+        self.unreplayed = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "submitted": self.submitted,
+            "written": self.written,
+            "pending": self.submitted - self.written,
+            "batches": self.batches,
+            "fsyncs": self.fsyncs,
+            "lag": self.lag,
+            "max_lag": self.max_lag,
+            "blocked_puts": self.blocked_puts,
+            "blocked_time": self.blocked_time,
+            "unjournaled": self.unjournaled,
+            "unreplayed": self.unreplayed,
+        }
+
+
+class EventWriter:
+    def __init__(
+        self,
+        base_dir: str,
+        policy: SegmentPolicy,
+        durability: str = "interval",
+        fsync_interval: float = 1.0,
+        max_pending: int = 256,
+        journal: bool = False,
+    ):
+        if durability not in DURABILITY:
+            raise ValueError(
+                f"Unknown durability policy: {durability}. Available: {', '.join(sorted(DURABILITY))}"
+            )
+
+        self.base_dir = base_dir
+        self.policy = policy
+        self.durability = durability
+        self.fsync_interval = fsync_interval
+        self.metrics = WriterMetrics()
+        self.encoder = EventEncoder()
+        self.journal = EventJournal() if journal else None
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._put_lock = asyncio.Lock()
+        self._waiting = 0
+        self._logs: Dict[str, SegmentLog] = {}
+        self._logs_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._last_sync = time.monotonic()
+
+    def log(self, group: str) -> SegmentLog:
+        with self._logs_lock:
+            if group not in self._logs:
+                self._logs[group] = SegmentLog(self.base_dir, group, self.policy)
+
+            return self._logs[group]
+
+    async def submit(self, group: str, events: List[Event]) -> None:
+        self._ensure_started()
+        self.metrics.submitted += len(events)
+        item = (group, events, time.monotonic())
+
+        if not self._waiting:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                pass
+
+        # The blocking put runs in a thread so the loop keeps going; the lock
+        # queues later submits behind it so batches reach the writer in order.
+        self._waiting += 1
+        start = time.monotonic()
+
+        try:
+            async with self._put_lock:
+                await asyncio.to_thread(self._queue.put, item)
+        finally:
+            self._waiting -= 1
+
+        self.metrics.blocked_puts += 1
+        self.metrics.blocked_time += time.monotonic() - start
+
+    async def flush(self) -> None:
+        if self._thread:
+            async with self._put_lock:
+                await asyncio.to_thread(self._queue.join)
+
+    def join(self) -> None:
+        if self._thread:
+            self._queue.join()
+
+    async def close(self) -> None:
+        if self._thread:
+            async with self._put_lock:
+                await asyncio.to_thread(self._queue.put, STOP)
+
+            await asyncio.to_thread(self._thread.join)
+            self._thread = None
+
+        with self._logs_lock:
+            for log in self._logs.values():
+                log.sync()
+                log.close()
+
+    def _ensure_started(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="event-writer", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        timeout = self.fsync_interval if self.durability == "interval" else None
+
+        while True:
+            try:
+                items = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                self._sync_due()
+                continue
+
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(item is STOP for item in items)
+
+            try:
+                self._write([item for item in items if item is not STOP])
+            except Exception as e:
+                logger.error(f"Failed to write events: {e}")
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+
+            if stop:
+                return
+
+    def _write(self, items: List[Batch]) -> None:
+        if not items:
+            return
+
+        grouped: Dict[str, Tuple[List[bytes], List[IndexKey]]] = {}
+
+        for group, events, _ in items:
+            lines, keys = grouped.setdefault(group, ([], []))
+
+            for event in events:
+                lines.append(self.encoder.encode(event))
+                keys.append((event.__class__.__name__, event.meta.timestamp))
+
+        if self.journal:
+            for group, events, _ in items:
+                self._journal(group, events, grouped)
+
+        for group, (lines, keys) in grouped.items():
+            self.log(group).append(lines, keys)
+
+        if self.durability == "batch":
+            self._sync(grouped)
+        else:
+            self._sync_due()
+
+        now = time.monotonic()
+        self.metrics.written += sum(len(events) for _, events, _ in items)
+        self.metrics.batches += 1
+        self.metrics.lag = now - items[0][2]
+        self.metrics.max_lag = max(self.metrics.max_lag, self.metrics.lag)
+
+    def _journal(
+        self,
+        group: str,
+        events: List[Event],
+        grouped: Dict[str, Tuple[List[bytes], List[IndexKey]]],
+    ) -> None:
+        lines, keys = grouped.setdefault(journal_group(group), ([], []))
+
+        for event in events:
+            try:
+                lines.append(self.journal.encode(event))
+            except Exception as e:
+                self.metrics.unjournaled += 1
+                logger.debug(f"Failed to journal {event.__class__.__name__}: {e}")
+                continue
+
+            keys.append((event.__class__.__name__, event.meta.timestamp))
+
+    def _sync_due(self) -> None:
+        if self.durability != "interval":
+            return
+
+        if time.monotonic() - self._last_sync >= self.fsync_interval:
+            with self._logs_lock:
+                groups = list(self._logs)
+
+            self._sync(groups)
+
+    def _sync(self, groups: Iterable[str]) -> None:
+        for group in groups:
+            if self.log(group).sync():
+                self.metrics.fsyncs += 1
+
+        self._last_sync = time.monotonic()
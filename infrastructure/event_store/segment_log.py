@@ -0,0 +1,348 @@
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import IO, Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .snapshot import CODECS, Member, SnapshotManifest, read_member, seal
+
+Record = Dict[str, Any]
+IndexKey = Tuple[str, float]
+
+
+@dataclass(frozen=True)
+class SegmentPolicy:
+    segment_size: int = 64 * 1024 * 1024
+    index_block_size: int = 256
+    rotate_daily: bool = True
+    seal_codec: str = ""
+    seal_level: int = 6
+
+    def __post_init__(self):
+        if self.seal_codec and self.seal_codec not in CODECS:
+            raise ValueError(
+                f"Unknown seal codec: {self.seal_codec}. Available: {', '.join(CODECS)}"
+            )
+
+
+class SegmentLog:
+    def __init__(self, base_dir: str, group: str, policy: SegmentPolicy):
+        self.base_dir = base_dir
+        self.group = group
+        self.policy = policy
+        self.manifest = SnapshotManifest(base_dir, group)
+        self._pattern = re.compile(rf"^{re.escape(group)}\.(\d+)\.ndjson$")
+        self._segments = self._discover_segments()
+        self._lock = threading.Lock()
+        self._handle: Optional[IO[bytes]] = None
+        self._index_handle: Optional[IO[bytes]] = None
+        self._day: Optional[str] = None
+        self._dirty = False
+
+    @property
+    def segments(self) -> List[str]:
+        with self._lock:
+            indices = list(self._segments)
+
+        return [self._segment_path(index) for index in indices]
+
+    def append(self, lines: List[bytes], keys: List[IndexKey]) -> None:
+        if not lines:
+            return
+
+        day = self._date(keys[0][1])
+
+        if self.policy.rotate_daily and self._day and self._day != day:
+            self.rotate()
+
+        handle = self._active_handle()
+        self._day = self._day or day
+        blocks = []
+        block_size = self.policy.index_block_size
+
+        for i in range(0, len(lines), block_size):
+            chunk = b"".join(lines[i : i + block_size])
+            chunk_keys = keys[i : i + block_size]
+            timestamps = [timestamp for _, timestamp in chunk_keys]
+
+            blocks.append(
+                json.dumps(
+                    {
+                        "offset": handle.tell(),
+                        "length": len(chunk),
+                        "start": min(timestamps),
+                        "end": max(timestamps),
+                        "events": sorted({name for name, _ in chunk_keys}),
+                    }
+                )
+                + "\n"
+            )
+            handle.write(chunk)
+
+        handle.flush()
+        self._index_handle.write("".join(blocks).encode("utf-8"))
+        self._index_handle.flush()
+        self._dirty = True
+
+        if handle.tell() >= self.policy.segment_size:
+            self.rotate()
+
+    def rotate(self) -> None:
+        self.sync()
+        self.close()
+
+        if self._segments and self.policy.seal_codec:
+            self._seal(self._segments[-1])
+
+        with self._lock:
+            self._segments.append(self._next_index())
+
+        self._day = None
+
+    def read(self) -> Iterator[Record]:
+        for index, member, path in self._sources():
+            if member is None:
+                try:
+                    yield from self._read_lines(path)
+                    continue
+                except FileNotFoundError:
+                    member = self._sealed(index)
+
+                if member is None:
+                    continue
+
+            yield from (json.loads(line) for line in read_member(self.base_dir, member))
+
+    def scan(
+        self,
+        events: Optional[Set[str]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Iterator[Record]:
+        for index, member, path in self._sources():
+            if member is None:
+                try:
+                    yield from self._scan_segment(path, events, start, end)
+                    continue
+                except FileNotFoundError:
+                    member = self._sealed(index)
+
+                if member is None:
+                    continue
+
+            if self._overlaps(member, events, start, end):
+                yield from (
+                    record
+                    for record in map(json.loads, read_member(self.base_dir, member))
+                    if self._matches(record, events, start, end)
+                )
+
+    def sync(self) -> bool:
+        if not self._handle or not self._dirty:
+            return False
+
+        os.fsync(self._handle.fileno())
+        os.fsync(self._index_handle.fileno())
+        self._dirty = False
+
+        return True
+
+    def close(self) -> None:
+        if self._handle:
+            self._handle.close()
+            self._index_handle.close()
+            self._handle = None
+            self._index_handle = None
+
+    def _seal(self, index: int) -> None:
+        path = self._segment_path(index)
+        index_path = self._index_path(path)
+
+        if not os.path.exists(path):
+            with self._lock:
+                self._segments.remove(index)
+
+            return
+
+        blocks = self._read_index(index_path) if os.path.exists(index_path) else []
+
+        if blocks:
+            start = min(block["start"] for block in blocks)
+            end = max(block["end"] for block in blocks)
+            events = sorted({name for block in blocks for name in block["events"]})
+        else:
+            start, end = 0.0, os.path.getmtime(path)
+            events = None
+
+        snapshot_path = os.path.join(
+            self.base_dir,
+            f"{self.group}_{self._date(start or end)}_snapshot.json"
+            f"{CODECS[self.policy.seal_codec]}",
+        )
+
+        member = seal(
+            path, snapshot_path, self.policy.seal_codec, self.policy.seal_level
+        )
+        member.update(segment=index, start=start, end=end, events=events)
+
+        with self._lock:
+            self.manifest.add(member)
+            self._segments.remove(index)
+
+        self._remove(path, index_path)
+
+    def _active_handle(self) -> IO[bytes]:
+        if self._handle is None:
+            if not self._segments:
+                with self._lock:
+                    self._segments.append(self._next_index())
+
+            path = self._segment_path(self._segments[-1])
+
+            if os.path.exists(path):
+                self._day = self._date(os.path.getmtime(path))
+
+            self._handle = open(path, "ab")
+            self._index_handle = open(self._index_path(path), "ab")
+
+        return self._handle
+
+    def _sources(self) -> List[Tuple[int, Optional[Member], Optional[str]]]:
+        with self._lock:
+            members = list(self.manifest.members)
+            indices = list(self._segments)
+
+        sources = [(member["segment"], member, None) for member in members]
+        sources.extend((index, None, self._segment_path(index)) for index in indices)
+
+        return sorted(sources, key=lambda s: s[0])
+
+    def _sealed(self, index: int) -> Optional[Member]:
+        with self._lock:
+            return next(
+                (m for m in self.manifest.members if m["segment"] == index), None
+            )
+
+    def _scan_segment(
+        self,
+        path: str,
+        events: Optional[Set[str]],
+        start: Optional[float],
+        end: Optional[float],
+    ) -> Iterator[Record]:
+        with open(path, "rb") as f:
+            try:
+                blocks = self._read_index(self._index_path(path))
+            except FileNotFoundError:
+                blocks = None
+
+            if blocks is None:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+
+                        if self._matches(record, events, start, end):
+                            yield record
+                return
+
+            for block in blocks:
+                if not self._overlaps(block, events, start, end):
+                    continue
+
+                f.seek(block["offset"])
+
+                for line in f.read(block["length"]).splitlines():
+                    record = json.loads(line)
+
+                    if self._matches(record, events, start, end):
+                        yield record
+
+    def _next_index(self) -> int:
+        return max([*self._segments, *self.manifest.segments], default=-1) + 1
+
+    def _segment_path(self, index: int) -> str:
+        return os.path.join(self.base_dir, f"{self.group}.{index:06d}.ndjson")
+
+    def _discover_segments(self) -> List[int]:
+        sealed = self.manifest.segments
+        indices = []
+
+        for filename in os.listdir(self.base_dir):
+            match = self._pattern.match(filename)
+
+            if not match:
+                continue
+
+            index = int(match.group(1))
+
+            if index in sealed:
+                path = os.path.join(self.base_dir, filename)
+                self._remove(path, self._index_path(path))
+            else:
+                indices.append(index)
+
+        return sorted(indices)
+
+    @staticmethod
+    def _remove(*paths: str) -> None:
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    @staticmethod
+    def _date(timestamp: float) -> str:
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+
+    @staticmethod
+    def _index_path(segment_path: str) -> str:
+        return f"{segment_path.removesuffix('.ndjson')}.idx"
+
+    @staticmethod
+    def _read_lines(path: str) -> Iterator[Record]:
+        with open(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    @staticmethod
+    def _read_index(path: str) -> List[Record]:
+        with open(path, "rb") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    @staticmethod
+    def _overlaps(
+        block: Record,
+        events: Optional[Set[str]],
+        start: Optional[float],
+        end: Optional[float],
+    ) -> bool:
+        if start is not None and block["end"] < start:
+            return False
+
+        if end is not None and block["start"] > end:
+            return False
+
+        return (
+            events is None
+            or block["events"] is None
+            or not events.isdisjoint(block["events"])
+        )
+
+    @staticmethod
+    def _matches(
+        record: Record,
+        events: Optional[Set[str]],
+        start: Optional[float],
+        end: Optional[float],
+    ) -> bool:
+        meta = record["meta"]
+
+        if events is not None and meta.get("name") not in events:
+            return False
+
+        if start is not None and meta["timestamp"] < start:
+            return False
+
+        return end is None or meta["timestamp"] <= end
@@ -0,0 +1,98 @@
+import json
+import lzma
+import os
+import zlib
+from typing import Any, Dict, Iterator, List, Set
+
+CODECS = {"zlib": ".gz", "lzma": ".xz"}
+
+CHUNK_SIZE = 1024 * 1024
+
+Member = Dict[str, Any]
+
+
+def compressor(codec: str, level: int):
+    if codec == "zlib":
+        return zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    return lzma.LZMACompressor(lzma.FORMAT_XZ, preset=level)
+
+
+def decompressor(codec: str):
+    if codec == "zlib":
+        return zlib.decompressobj(31)
+
+    return lzma.LZMADecompressor(lzma.FORMAT_XZ)
+
+
+def seal(segment_path: str, snapshot_path: str, codec: str, level: int) -> Member:
+    encoder = compressor(codec, level)
+
+    with open(segment_path, "rb") as src, open(snapshot_path, "ab") as dst:
+        offset = dst.tell()
+
+        while chunk := src.read(CHUNK_SIZE):
+            dst.write(encoder.compress(chunk))
+
+        dst.write(encoder.flush())
+        dst.flush()
+        os.fsync(dst.fileno())
+
+        return {
+            "file": os.path.basename(snapshot_path),
+            "codec": codec,
+            "offset": offset,
+            "length": dst.tell() - offset,
+        }
+
+
+def read_member(base_dir: str, member: Member) -> Iterator[bytes]:
+    decoder = decompressor(member["codec"])
+    remaining = member["length"]
+    tail = b""
+
+    with open(os.path.join(base_dir, member["file"]), "rb") as f:
+        f.seek(member["offset"])
+
+        while remaining > 0:
+            chunk = f.read(min(CHUNK_SIZE, remaining))
+
+            if not chunk:
+                break
+
+            remaining -= len(chunk)
+            lines = (tail + decoder.decompress(chunk)).split(b"\n")
+            tail = lines.pop()
+
+            yield from (line for line in lines if line.strip())
+
+    if tail.strip():
+        yield tail
+
+
+class SnapshotManifest:
+    def __init__(self, base_dir: str, group: str):
+        self.path = os.path.join(base_dir, f"{group}.manifest.json")
+        self.members: List[Member] = self._load()
+
+    @property
+    def segments(self) -> Set[int]:
+        return {member["segment"] for member in self.members}
+
+    def add(self, member: Member) -> None:
+        self.members.append(member)
+        self.members.sort(key=lambda m: m["segment"])
+
+        tmp_file = f"{self.path}.tmp"
+
+        with open(tmp_file, "w") as f:
+            json.dump(self.members, f)
+
+        os.replace(tmp_file, self.path)
+
+    def _load(self) -> List[Member]:
+        if not os.path.exists(self.path):
+            return []
+
+        with open(self.path, "r") as f:
+            return json.load(f)
@@ -0,0 +1,148 @@
+from collections import defaultdict
+from functools import partial
+from typing import Any, Callable, Dict, Tuple
+
+from .histogram import Histogram
+from .throughput_monitor import ThroughputMonitor
+
+QUANTILES = (0.5, 0.99)
+
+
+def handler_name(handler: Callable[..., Any]) -> str:
+    while isinstance(handler, partial):
+        handler = handler.func
+
+    owner = getattr(handler, "__self__", None)
+    name = getattr(handler, "__name__", repr(handler))
+
+    if owner is not None:
+        return f"{owner.__class__.__name__}.{name}"
+
+    return getattr(handler, "__qualname__", name)
+
+
+class HandlerStats:
+    __slots__ = ("duration", "timeouts", "dlq", "retries", "recovered")
+
+    def __init__(self):
+        self.duration = Histogram()
+        self.timeouts = 0
+        self.dlq = 0
+        self.retries = 0
+        self.recovered = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "duration": self.duration.to_dict(),
+            "timeouts": self.timeouts,
+            "dlq": self.dlq,
+            "retries": self.retries,
+            "recovered": self.recovered,
+        }
+
+
+class BusMetrics:
+    def __init__(self, events_to_log: int = 10000, enabled: bool = True):
+        self.enabled = enabled
+        self._queue_wait: Dict[str, Histogram] = defaultdict(Histogram)
+        self._handlers: Dict[Tuple[str, str], HandlerStats] = defaultdict(HandlerStats)
+        self._throughput = ThroughputMonitor(events_to_log)
+
+    def observe_queue_wait(self, event: Any, wait: float) -> None:
+        self._throughput.event_processed()
+
+        if self.enabled:
+            self._queue_wait[event.__class__.__name__].observe(wait)
+
+    def observe_handler(
+        self, event: Any, handler: Callable[..., Any], duration: float
+    ) -> None:
+        if self.enabled:
+            self._stats(event, handler).duration.observe(duration)
+
+    def timeout(self, event: Any, handler: Callable[..., Any]) -> None:
+        self._stats(event, handler).timeouts += 1
+
+    def dead_letter(self, event: Any, handler: Callable[..., Any]) -> None:
+        self._stats(event, handler).dlq += 1
+
+    def retry(self, event: Any, handler: Callable[..., Any]) -> None:
+        self._stats(event, handler).retries += 1
+
+    def recovered(self, event: Any, handler: Callable[..., Any]) -> None:
+        self._stats(event, handler).recovered += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "throughput": self._throughput.throughput,
+            "events": {
+                event: histogram.to_dict()
+                for event, histogram in self._queue_wait.items()
+            },
+            "handlers": [
+                {"event": event, "handler": handler, **stats.to_dict()}
+                for (event, handler), stats in self._handlers.items()
+            ],
+        }
+
+    def to_prometheus(self) -> str:
+        lines = [
+            "# TYPE quant_bus_throughput gauge",
+            f"quant_bus_throughput {self._throughput.throughput}",
+            "# TYPE quant_bus_queue_wait_seconds summary",
+        ]
+
+        for event, histogram in self._queue_wait.items():
+            labels = f'event="{event}"'
+            lines.extend(
+                self._summary("quant_bus_queue_wait_seconds", labels, histogram)
+            )
+
+        lines.append("# TYPE quant_bus_handler_seconds summary")
+
+        for (event, handler), stats in self._handlers.items():
+            labels = f'event="{event}",handler="{handler}"'
+            lines.extend(
+                self._summary("quant_bus_handler_seconds", labels, stats.duration)
+            )
+
+        lines.append("# TYPE quant_bus_handler_timeouts_total counter")
+
+        for (event, handler), stats in self._handlers.items():
+            lines.append(
+                f'quant_bus_handler_timeouts_total{{event="{event}",handler="{handler}"}} {stats.timeouts}'
+            )
+
+        lines.append("# TYPE quant_bus_dlq_total counter")
+
+        for (event, handler), stats in self._handlers.items():
+            lines.append(
+                f'quant_bus_dlq_total{{event="{event}",handler="{handler}"}} {stats.dlq}'
+            )
+
+        lines.append("# TYPE quant_bus_retries_total counter")
+
+        for (event, handler), stats in self._handlers.items():
+            lines.append(
+                f'quant_bus_retries_total{{event="{event}",handler="{handler}"}} {stats.retries}'
+            )
+
+        lines.append("# TYPE quant_bus_recovered_total counter")
+
+        for (event, handler), stats in self._handlers.items():
+            lines.append(
+                f'quant_bus_recovered_total{{event="{event}",handler="{handler}"}} {stats.recovered}'
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def _stats(self, event: Any, handler: Callable[..., Any]) -> HandlerStats:
+        return self._handlers[(event.__class__.__name__, handler_name(handler))]
+
+    @staticmethod
+    def _summary(metric: str, labels: str, histogram: Histogram):
+        for q in QUANTILES:
+            yield f'{metric}{{{labels},quantile="{q}"}} {histogram.quantile(q)}'
+
+        yield f"{metric}_sum{{{labels}}} {histogram.total}"
+        yield f"{metric}_count{{{labels}}} {histogram.count}"
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, Optional
+
+from core.interfaces.abstract_config import AbstractConfig
+
+from .bus_metrics import BusMetrics
+from .tracer import Tracer
+
+logger = logging.getLogger(__name__)
+
+ExtraMetrics = Callable[[], Dict[str, Any]]
+
+
+class MetricsExporter:
+    def __init__(
+        self,
+        metrics: BusMetrics,
+        config_service: AbstractConfig,
+        extra: Optional[ExtraMetrics] = None,
+        tracer: Optional[Tracer] = None,
+    ):
+        config = config_service.get("telemetry") or {}
+
+        self.metrics = metrics
+        self.extra = extra
+        self.tracer = tracer
+        self.host = config.get("host", "127.0.0.1")
+        self.port = config.get("port", 0)
+        self.snapshot_interval = config.get("snapshot_interval", 60)
+        self.snapshot_file = self._resolve_path(
+            config.get("snapshot_file", ""), config_service.get("store")
+        )
+        self.trace_file = self._resolve_path(
+            config.get("trace_file", ""), config_service.get("store")
+        )
+
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._snapshot_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self.port:
+            self._server = await asyncio.start_server(self._serve, self.host, self.port)
+            logger.info(
+                f"Bus metrics available at http://{self.host}:{self.port}/metrics"
+            )
+
+        if (self.snapshot_file or self.trace_file) and self.snapshot_interval > 0:
+            self._snapshot_task = asyncio.create_task(self._snapshot_loop())
+
+    async def stop(self) -> None:
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        if self._snapshot_task:
+            self._snapshot_task.cancel()
+            self._snapshot_task = None
+
+        if self.snapshot_file:
+            self.write_snapshot()
+
+        if self.trace_file and self.tracer:
+            self.tracer.export(self.trace_file)
+
+    def snapshot(self) -> Dict[str, Any]:
+        snapshot = {"bus": self.metrics.snapshot()}
+
+        if self.extra:
+            snapshot["queues"] = self.extra()
+
+        return snapshot
+
+    def write_snapshot(self, snapshot: Optional[Dict[str, Any]] = None) -> None:
+        tmp_file = f"{self.snapshot_file}.tmp"
+
+        with open(tmp_file, "w") as f:
+            json.dump(self.snapshot() if snapshot is None else snapshot, f)
+
+        os.replace(tmp_file, self.snapshot_file)
+
+    async def _snapshot_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+
+            try:
+                if self.snapshot_file:
+                    await asyncio.to_thread(self.write_snapshot, self.snapshot())
+
+                if self.trace_file and self.tracer:
+                    await asyncio.to_thread(
+                        self.tracer.export,
+                        self.trace_file,
+                        self.tracer.to_chrome_trace(),
+                    )
+            except Exception as e:
+                logger.error(f"Failed to write metrics snapshot: {e}")
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            request_line = await reader.readline()
+            parts = request_line.decode("latin-1").split()
+            path = parts[1] if len(parts) > 1 else "/"
+
+            if path == "/metrics":
+                status, content_type = "200 OK", "text/plain; version=0.0.4"
+                body = self.metrics.to_prometheus()
+            elif path == "/metrics.json":
+                status, content_type = "200 OK", "application/json"
+                body = json.dumps(self.snapshot())
+            elif path == "/trace.json" and self.tracer:
+                status, content_type = "200 OK", "application/json"
+                body = json.dumps(self.tracer.to_chrome_trace())
+            else:
+                status, content_type, body = "404 Not Found", "text/plain", ""
+
+            payload = body.encode("utf-8")
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode(
+                    "latin-1"
+                )
+                + payload
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _resolve_path(snapshot_file: str, store_config: Optional[Dict[str, Any]]):
+        if not snapshot_file or os.path.isabs(snapshot_file) or not store_config:
+            return snapshot_file
+
+        return os.path.join(store_config["base_dir"], snapshot_file)
@@ -0,0 +1,50 @@
+from bisect import bisect_left
+from typing import Any, Dict, List
+
+MIN_BOUND = 1e-6
+GROWTH = 2**0.5
+NUM_BUCKETS = 56
+
+BOUNDS: List[float] = [MIN_BOUND * GROWTH**i for i in range(NUM_BUCKETS)]
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (NUM_BUCKETS + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+
+            if seen >= rank:
+                return BOUNDS[index] if index < NUM_BUCKETS else self.max
+
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+        }
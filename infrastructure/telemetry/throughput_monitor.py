@@ -9,6 +9,7 @@ class ThroughputMonitor:
         self.events_to_log = events_to_log
         self.start_time = time.monotonic()
         self.num_events = 0
+        self.throughput = 0.0
 
     def event_processed(self):
         self.num_events += 1
@@ -17,9 +18,9 @@ class ThroughputMonitor:
 
     def _log_throughput(self):
         elapsed_time = time.monotonic() - self.start_time
-        throughput = self.num_events / elapsed_time
+        self.throughput = self.num_events / elapsed_time
 
-        logger.debug(f"Throughput = {throughput:.2f} events/sec")
+        logger.debug(f"Throughput = {self.throughput:.2f} events/sec")
 
         self.num_events = 0
         self.start_time = time.monotonic()
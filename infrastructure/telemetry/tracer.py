@@ -0,0 +1,190 @@
+import json
+import os
+from collections import defaultdict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .bus_metrics import handler_name
+
+
+class Span:
+    __slots__ = (
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "event",
+        "handler",
+        "emitted",
+        "start",
+        "end",
+    )
+
+    def __init__(self, event: Any, handler: str, start: float, end: float):
+        meta = event.meta
+        self.trace_id = meta.trace_id
+        self.span_id = meta.key
+        self.parent_id = meta.parent_id
+        self.event = event.__class__.__name__
+        self.handler = handler
+        self.emitted = meta.timestamp
+        self.start = start
+        self.end = end
+
+    @property
+    def wait(self) -> float:
+        return max(self.start - self.emitted, 0.0)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class Tracer:
+    def __init__(self, max_spans: int = 0):
+        self._spans: Deque[Span] = deque(maxlen=max_spans or None)
+        self.enabled = max_spans > 0
+
+    def record(
+        self, event: Any, handler: Callable[..., Any], start: float, end: float
+    ) -> None:
+        self._spans.append(Span(event, handler_name(handler), start, end))
+
+    def traces(self) -> Dict[str, List[Span]]:
+        traces = defaultdict(list)
+
+        for span in list(self._spans):
+            traces[span.trace_id].append(span)
+
+        return traces
+
+    @staticmethod
+    def critical_path(spans: List[Span]) -> List[Span]:
+        by_event: Dict[str, List[Span]] = defaultdict(list)
+        children: Dict[str, List[str]] = defaultdict(list)
+
+        for span in spans:
+            if span.span_id not in by_event:
+                children[span.parent_id].append(span.span_id)
+
+            by_event[span.span_id].append(span)
+
+        finish = Tracer._finish_times(by_event, children)
+
+        roots = [
+            span_id
+            for span_id, event_spans in by_event.items()
+            if event_spans[0].parent_id not in by_event
+        ]
+
+        path = []
+        candidates = roots
+
+        while candidates:
+            span_id = max(candidates, key=finish.__getitem__)
+            path.append(max(by_event[span_id], key=lambda span: span.end))
+            candidates = children.get(span_id, [])
+
+        return path
+
+    @staticmethod
+    def _finish_times(
+        by_event: Dict[str, List[Span]], children: Dict[str, List[str]]
+    ) -> Dict[str, float]:
+        # Post-order walk with an explicit stack: long event chains would
+        # otherwise exceed the recursion limit.
+        finish: Dict[str, float] = {}
+        visited = set()
+
+        for root in by_event:
+            stack = [(root, False)]
+
+            while stack:
+                span_id, expanded = stack.pop()
+
+                if expanded:
+                    finish[span_id] = max(
+                        [span.end for span in by_event[span_id]]
+                        + [
+                            finish[child]
+                            for child in children.get(span_id, [])
+                            if child in finish
+                        ]
+                    )
+                elif span_id not in visited:
+                    visited.add(span_id)
+                    stack.append((span_id, True))
+                    stack.extend((child, False) for child in children.get(span_id, []))
+
+        return finish
+
+    def breakdown(self) -> Dict[str, Any]:
+        result: Dict[str, Dict[str, Any]] = {}
+
+        for spans in self.traces().values():
+            path = self.critical_path(spans)
+
+            if not path:
+                continue
+
+            root = result.setdefault(
+                path[0].event, {"traces": 0, "latency": 0.0, "hops": {}}
+            )
+            root["traces"] += 1
+            root["latency"] += path[-1].end - path[0].emitted
+
+            for span in path:
+                hop = root["hops"].setdefault(
+                    f"{span.event}:{span.handler}",
+                    {"count": 0, "wait": 0.0, "run": 0.0},
+                )
+                hop["count"] += 1
+                hop["wait"] += span.wait
+                hop["run"] += span.duration
+
+        for root in result.values():
+            root["latency"] /= root["traces"]
+
+            for hop in root["hops"].values():
+                hop["wait"] /= hop["count"]
+                hop["run"] /= hop["count"]
+
+        return result
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        events = []
+
+        for tid, spans in enumerate(self.traces().values()):
+            critical = {id(span) for span in self.critical_path(spans)}
+
+            for span in spans:
+                events.append(
+                    {
+                        "name": span.handler,
+                        "cat": span.event,
+                        "ph": "X",
+                        "ts": span.start * 1e6,
+                        "dur": span.duration * 1e6,
+                        "pid": 1,
+                        "tid": tid,
+                        "args": {
+                            "trace_id": span.trace_id,
+                            "span_id": span.span_id,
+                            "parent_id": span.parent_id,
+                            "wait_ms": span.wait * 1e3,
+                            "critical": id(span) in critical,
+                        },
+                    }
+                )
+
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"critical_path": self.breakdown()},
+        }
+
+    def export(self, path: str, trace: Optional[Dict[str, Any]] = None) -> None:
+        tmp_file = f"{path}.tmp"
+
+        with open(tmp_file, "w") as f:
+            json.dump(self.to_chrome_trace() if trace is None else trace, f)
+
+        os.replace(tmp_file, path)
@@ -2,14 +2,22 @@ import asyncio
 from typing import Union
 
 from core.actors import BaseActor
-from core.commands.market import IngestMarketData
+from core.commands.market import IngestMarketData, IngestMarketDataBatch
 from core.interfaces.abstract_timeseries import AbstractTimeSeriesService
 from core.mixins import EventHandlerMixin
 from core.models.entity.ohlcv import OHLCV
 from core.models.ta import TechAnalysis
 from core.queries.ohlcv import TA, BackNBars, BatchBars, NextBar, PrevBar
 
-MarketEvent = Union[IngestMarketData, NextBar, PrevBar, TA, BackNBars, BatchBars]
+MarketEvent = Union[
+    IngestMarketData,
+    IngestMarketDataBatch,
+    NextBar,
+    PrevBar,
+    TA,
+    BackNBars,
+    BatchBars,
+]
 
 
 class MarketActor(BaseActor, EventHandlerMixin):
@@ -24,6 +32,7 @@ class MarketActor(BaseActor, EventHandlerMixin):
 
     def _register_event_handlers(self):
         self.register_handler(IngestMarketData, self._ingest_market_data)
+        self.register_handler(IngestMarketDataBatch, self._ingest_market_data_batch)
         self.register_handler(NextBar, self._handle_next_bar)
         self.register_handler(PrevBar, self._handle_prev_bar)
         self.register_handler(BatchBars, self._handle_batch_bars)
@@ -34,6 +43,9 @@ class MarketActor(BaseActor, EventHandlerMixin):
         if event.bar.closed:
             await self.ts.upsert(event.symbol, event.timeframe, event.bar.ohlcv)
 
+    async def _ingest_market_data_batch(self, event: IngestMarketDataBatch) -> int:
+        return await self.ts.upsert_many(event.symbol, event.timeframe, event.ohlcv)
+
     async def _handle_next_bar(self, event: NextBar) -> OHLCV:
         return await self.ts.next_bar(event.symbol, event.timeframe, event.ohlcv)
 
@@ -1,10 +1,10 @@
 import asyncio
 import logging
-import time
 from typing import Union
 
 from core.actors import StrategyActor
 from core.actors.state import InMemory
+from core.clock import now
 from core.events.backtest import BacktestEnded
 from core.events.meta import EventMeta
 from core.events.position import (
@@ -29,13 +29,23 @@ from core.models.side import PositionSide
 from core.models.symbol import Symbol
 from core.models.timeframe import Timeframe
 from core.queries.portfolio import GetPortfolioPerformance
-
-from ._sm import TRANSITIONS, PositionStateMachine, SMKey
+from infrastructure.event_dispatcher.event_replayer import ReplayStats
+
+from ._sm import (
+    RESTORED_STATES,
+    TRANSITIONS,
+    PositionState,
+    PositionStateMachine,
+    SMKey,
+)
 
 SignalEvent = Union[GoLongSignalReceived, GoShortSignalReceived]
 BrokerPositionEvent = Union[BrokerPositionOpened, BrokerPositionClosed]
 ExitSignal = Union[RiskLongThresholdBreached, RiskShortThresholdBreached]
 BacktestSignal = BacktestEnded
+RestoredEvent = Union[
+    PositionInitialized, PositionOpened, PositionCloseRequested, PositionClosed
+]
 
 PositionEvent = Union[SignalEvent, ExitSignal, BrokerPositionEvent, BacktestSignal]
 
@@ -65,9 +75,23 @@ class PositionActor(StrategyActor):
                 ]
             )
 
+    async def restore(self) -> ReplayStats:
+        return await self.replay(self._restore_position, *RESTORED_STATES)
+
+    async def _restore_position(self, event: RestoredEvent):
+        side = event.position.side
+        state = RESTORED_STATES[type(event)]
+
+        if state == PositionState.IDLE:
+            await self._state.delete(self._get_key(side))
+        else:
+            await self._state.set(self._get_key(side), event.position)
+
+        await self.sm.restore(side, state)
+
     async def handle_signal_received(self, event: SignalEvent) -> bool:
         if self._is_stale_signal(event.meta):
-            logger.warn(f"Stale Signal: {event}, {time.time()}")
+            logger.warn(f"Stale Signal: {event}, {now()}")
             return False
 
         async def create_and_store_position(event: SignalEvent, side: PositionSide):
@@ -183,7 +207,7 @@ class PositionActor(StrategyActor):
 
     @staticmethod
     def _is_stale_signal(meta: EventMeta) -> bool:
-        return int(meta.timestamp) < int(time.time()) - TIME_BUFF
+        return int(meta.timestamp) < int(now()) - TIME_BUFF
 
     def _get_key(self, side: PositionSide) -> SMKey:
         return self.symbol, self.timeframe, side
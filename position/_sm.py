@@ -8,6 +8,10 @@ from core.events.backtest import BacktestEnded
 from core.events.position import (
     BrokerPositionClosed,
     BrokerPositionOpened,
+    PositionClosed,
+    PositionCloseRequested,
+    PositionInitialized,
+    PositionOpened,
 )
 from core.events.risk import RiskLongThresholdBreached, RiskShortThresholdBreached
 from core.events.signal import (
@@ -82,6 +86,13 @@ TRANSITIONS: Transitions = {
 
 SMKey = Tuple[Symbol, Timeframe, PositionSide]
 
+RESTORED_STATES: Dict[type, PositionState] = {
+    PositionInitialized: PositionState.WAITING_BROKER_CONFIRMATION,
+    PositionOpened: PositionState.OPENED,
+    PositionCloseRequested: PositionState.CLOSE,
+    PositionClosed: PositionState.IDLE,
+}
+
 
 class PositionStateMachine:
     def __init__(self, actor: Type[StrategyActor], transitions: Transitions):
@@ -110,6 +121,9 @@ class PositionStateMachine:
             f"SM: key={key}, event={event}, side: {side}, curr_state={current_state}, next_state={next_state}"
         )
 
+    async def restore(self, side: PositionSide, state: PositionState):
+        await self._state.set(self._get_key(side), state)
+
     def _get_key(self, side: PositionSide) -> SMKey:
         return self._actor.symbol, self._actor.timeframe, side
 
@@ -15,6 +15,7 @@ from infrastructure.config import ConfigService
 from infrastructure.event_dispatcher.event_dispatcher import EventDispatcher
 from infrastructure.logger import configure_logging
 from infrastructure.shutdown import GracefulShutdown
+from infrastructure.telemetry.exporter import MetricsExporter
 from market import MarketActor
 from ocean import OceanActor
 from portfolio import PortfolioActor
@@ -72,15 +73,32 @@ async def main():
 
     event_bus = EventDispatcher(config_service)
 
+    wasm_config = config_service.get("wasm") or {}
+    wasm = WasmManager(
+        WASM_FOLDER,
+        wasm_config.get("pool_size", 1),
+        bool(wasm_config.get("threads", 0)),
+    )
+    timeseries = TimeSeriesService(wasm)
+
+    telemetry = None
+
+    if (config_service.get("telemetry") or {}).get("enabled", 0):
+        telemetry = MetricsExporter(
+            event_bus.bus_metrics,
+            config_service,
+            lambda: {**event_bus.metrics(), "timeseries": timeseries.metrics()},
+            event_bus.tracer,
+        )
+        await telemetry.start()
+
     datasource = DataSourceFactory(EnvironmentSecretService())
     datasource.register_rest_exchange(default_datasource)
     datasource.register_ws_exchange(default_datasource)
 
-    wasm = WasmManager(WASM_FOLDER)
-
     OceanActor(datasource, config_service).start()
     ReefActor(datasource, config_service).start()
-    MarketActor(TimeSeriesService(wasm)).start()
+    MarketActor(timeseries).start()
     FactorActor(datasource, config_service).start()
     PortfolioActor(config_service).start()
     SmartRouter(datasource, config_service)
@@ -113,6 +131,14 @@ async def main():
         config_service=config_service,
     )
 
+    # Replay after the systems subscribe so a replayed deployment resumes trading;
+    # the trading system restores its position actors when it recreates them.
+    if config_service.get("store").get("replay_on_start", 0):
+        stats = await event_bus.replay()
+        logging.info(
+            f"Replayed {stats.events} events in {stats.elapsed:.2f}s ({stats.events_per_sec:.0f} ev/s)"
+        )
+
     backtest_system_task = asyncio.create_task(backtest_system.start())
     trading_system_task = asyncio.create_task(trading_system.start())
     shutdown_task = asyncio.create_task(graceful_shutdown.wait_for_exit_signal())
@@ -133,6 +159,9 @@ async def main():
 
         await event_bus.stop()
         await event_bus.wait()
+        if telemetry:
+            await telemetry.stop()
+        wasm.shutdown()
 
         logging.info("Finished.")
 
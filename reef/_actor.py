@@ -12,6 +12,7 @@ from core.models.datasource_type import DataSourceType
 from core.models.order_type import OrderStatus, OrderType
 from core.models.protocol_type import ProtocolType
 from core.models.symbol import Symbol
+from infrastructure.event_dispatcher.direct_dispatch import spawn
 
 from ._order import PQOrder
 
@@ -32,11 +33,11 @@ class ReefActor(BaseActor):
     def on_start(self):
         self._stop_event.clear()
 
-        worker_task = asyncio.create_task(self._process_orders())
+        worker_task = spawn(self._process_orders())
         self._tasks.add(worker_task)
         worker_task.add_done_callback(lambda t: self._tasks.discard(t))
 
-        poll_task = asyncio.create_task(self._fetch_open_orders())
+        poll_task = spawn(self._fetch_open_orders())
         self._tasks.add(poll_task)
         poll_task.add_done_callback(lambda t: self._tasks.discard(t))
 
@@ -112,8 +113,7 @@ class ReefActor(BaseActor):
         monitor_interval = self.order_config.get("monitor_interval", 10)
 
         datasource_tasks = [
-            asyncio.create_task(self._fetch_orders(datasource))
-            for datasource in services
+            spawn(self._fetch_orders(datasource)) for datasource in services
         ]
 
         results = await asyncio.gather(*datasource_tasks, return_exceptions=True)
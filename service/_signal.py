@@ -1,12 +1,16 @@
 from ctypes import addressof, c_ubyte
-from typing import Tuple
+from typing import Hashable, Optional, Tuple
 
+import numpy as np
 import orjson as json
 
 from core.interfaces.abstract_signal_service import AbstractSignalService
 from core.interfaces.abstract_wasm_manager import AbstractWasmManager
+from core.models.entity.ohlcv import OHLCV
 from core.models.strategy import Strategy
-from core.models.strategy_ref import StrategyRef
+from core.models.strategy_ref import SignalEvent, StrategyRef
+from core.models.symbol import Symbol
+from core.models.timeframe import Timeframe
 from core.models.wasm_type import WasmType
 
 
@@ -16,8 +20,41 @@ class SignalService(AbstractSignalService):
         self._wasm_manager = wasm_manager
         self._wasm = WasmType.TREND
 
-    def register(self, strategy: Strategy) -> StrategyRef:
-        instance, store = self._wasm_manager.get_instance(self._wasm)
+    def register(
+        self, strategy: Strategy, affinity: Optional[Hashable] = None
+    ) -> StrategyRef:
+        instance, store = self._wasm_manager.get_instance(self._wasm, affinity)
+
+        return self._wasm_manager.call(store, self._register, strategy, instance, store)
+
+    def unregister(self, strategy_ref: StrategyRef) -> None:
+        self._wasm_manager.call(strategy_ref.store_ref, strategy_ref.unregister)
+
+    async def next(
+        self,
+        strategy_ref: StrategyRef,
+        symbol: Symbol,
+        timeframe: Timeframe,
+        strategy: Strategy,
+        ohlcv: OHLCV,
+    ) -> Optional[SignalEvent]:
+        return await self._wasm_manager.run(
+            strategy_ref.store_ref,
+            strategy_ref.next,
+            symbol,
+            timeframe,
+            strategy,
+            ohlcv,
+        )
+
+    async def run(
+        self, strategy_ref: StrategyRef, ohlcv: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        return await self._wasm_manager.run(
+            strategy_ref.store_ref, strategy_ref.run, ohlcv
+        )
+
+    def _register(self, strategy: Strategy, instance, store) -> StrategyRef:
         exports = instance.exports(store)
         allocation_data = [
             self._write(store, exports, json.dumps(param))
@@ -1,6 +1,9 @@
 import asyncio
+import time
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Any, Dict, Optional, Set, Tuple
+
+import numpy as np
 
 from core.interfaces.abstract_timeseries import AbstractTimeSeriesService
 from core.interfaces.abstract_wasm_manager import AbstractWasmManager
@@ -10,49 +13,189 @@ from core.models.timeframe import Timeframe
 from core.models.timeseries_ref import TimeSeriesRef
 from core.models.wasm_type import WasmType
 
+SeriesKey = Tuple[Symbol, Timeframe]
+
+
+class LockStats:
+    __slots__ = ("acquired", "contended", "wait_time", "max_wait")
+
+    def __init__(self):
+        self.acquired = 0
+        self.contended = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "acquired": self.acquired,
+            "contended": self.contended,
+            "wait_time": self.wait_time,
+            "max_wait": self.max_wait,
+            "avg_wait": self.wait_time / self.contended if self.contended else 0.0,
+        }
+
 
 class TimeSeriesService(AbstractTimeSeriesService):
     def __init__(self, wasm_manager: AbstractWasmManager):
-        self._bucket = {}
-        self._lock = asyncio.Lock()
+        self._bucket: Dict[SeriesKey, TimeSeriesRef] = {}
+        self._locks: Dict[SeriesKey, asyncio.Lock] = {}
+        self._lock_stats: Dict[SeriesKey, LockStats] = {}
+        self._closed: Set[SeriesKey] = set()
+        self._registering: Dict[SeriesKey, asyncio.Task] = {}
         self._wasm_manager = wasm_manager
         self._wasm = WasmType.TIMESERIES
 
+    def register(self, symbol: Symbol, timeframe: Timeframe) -> TimeSeriesRef:
+        key = (symbol, timeframe)
+        self._closed.discard(key)
+
+        if key not in self._bucket:
+            instance, store = self._wasm_manager.get_instance(self._wasm, key)
+            id = self._wasm_manager.call(
+                store, instance.exports(store)["timeseries_register"], store
+            )
+            self._add(key, TimeSeriesRef(id=id, instance_ref=instance, store_ref=store))
+
+        return self._bucket[key]
+
+    def unregister(self, symbol: Symbol, timeframe: Timeframe) -> None:
+        key = (symbol, timeframe)
+
+        if key not in self._bucket:
+            return
+
+        if self._locks[key].locked():
+            self._closed.add(key)
+            return
+
+        timeseries = self._detach(key)
+        self._wasm_manager.call(timeseries.store_ref, timeseries.unregister)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "series": len(self._bucket),
+            "locks": {
+                f"{symbol}_{timeframe}": stats.to_dict()
+                for (symbol, timeframe), stats in self._lock_stats.items()
+            },
+        }
+
     async def upsert(self, symbol: Symbol, timeframe: Timeframe, bar: OHLCV):
         async with self._get_timeseries(symbol, timeframe) as timeseries:
-            timeseries.add(bar)
+            await self._run(timeseries, timeseries.add, bar)
+
+    async def upsert_many(
+        self, symbol: Symbol, timeframe: Timeframe, ohlcv: np.ndarray
+    ) -> int:
+        async with self._get_timeseries(symbol, timeframe) as timeseries:
+            return await self._run(timeseries, timeseries.add_many, ohlcv)
 
     async def next_bar(
         self, symbol: Symbol, timeframe: Timeframe, bar: OHLCV
     ) -> Optional[OHLCV]:
         async with self._get_timeseries(symbol, timeframe) as timeseries:
-            return timeseries.next_bar(bar)
+            return await self._run(timeseries, timeseries.next_bar, bar)
 
     async def prev_bar(
         self, symbol: Symbol, timeframe: Timeframe, bar: OHLCV
     ) -> Optional[OHLCV]:
         async with self._get_timeseries(symbol, timeframe) as timeseries:
-            return timeseries.prev_bar(bar)
+            return await self._run(timeseries, timeseries.prev_bar, bar)
 
     async def back_n_bars(
         self, symbol: Symbol, timeframe: Timeframe, bar: OHLCV, n: int
     ) -> Optional[OHLCV]:
         async with self._get_timeseries(symbol, timeframe) as timeseries:
-            return timeseries.back_n_bars(bar, n)
+            return await self._run(timeseries, timeseries.back_n_bars, bar, n)
 
     async def ta(self, symbol: Symbol, timeframe: Timeframe, bar: OHLCV):
         async with self._get_timeseries(symbol, timeframe) as timeseries:
-            return timeseries.ta(bar)
+            return await self._run(timeseries, timeseries.ta, bar)
+
+    async def _run(self, timeseries: TimeSeriesRef, fn, *args):
+        return await self._wasm_manager.run(timeseries.store_ref, fn, *args)
+
+    async def _register(self, key: SeriesKey) -> TimeSeriesRef:
+        task = self._registering.get(key)
+
+        if task is None:
+            task = self._registering[key] = asyncio.create_task(self._create(key))
+            task.add_done_callback(lambda _: self._registering.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    async def _create(self, key: SeriesKey) -> TimeSeriesRef:
+        instance, store = self._wasm_manager.get_instance(self._wasm, key)
+        id = await self._wasm_manager.run(
+            store, instance.exports(store)["timeseries_register"], store
+        )
+        timeseries = TimeSeriesRef(id=id, instance_ref=instance, store_ref=store)
+
+        if key in self._bucket:
+            await self._run(timeseries, timeseries.unregister)
+            return self._bucket[key]
+
+        return self._add(key, timeseries)
+
+    def _add(self, key: SeriesKey, timeseries: TimeSeriesRef) -> TimeSeriesRef:
+        self._bucket[key] = timeseries
+        self._locks[key] = asyncio.Lock()
+        self._lock_stats[key] = LockStats()
+
+        return timeseries
+
+    async def _release(self, key: SeriesKey) -> None:
+        timeseries = self._detach(key)
+        await self._run(timeseries, timeseries.unregister)
+
+    def _detach(self, key: SeriesKey) -> TimeSeriesRef:
+        self._closed.discard(key)
+        self._locks.pop(key)
+        self._lock_stats.pop(key)
+
+        return self._bucket.pop(key)
 
     @asynccontextmanager
     async def _get_timeseries(self, symbol: Symbol, timeframe: Timeframe):
-        async with self._lock:
-            key = (symbol, timeframe)
-            if key not in self._bucket:
-                instance, store = self._wasm_manager.get_instance(self._wasm)
-                exports = instance.exports(store)
-                id = exports["timeseries_register"](store)
-                self._bucket[key] = TimeSeriesRef(
-                    id=id, instance_ref=instance, store_ref=store
-                )
-            yield self._bucket[key]
+        key = (symbol, timeframe)
+
+        while True:
+            timeseries = self._bucket.get(key) or await self._register(key)
+
+            async with self._acquire(key):
+                if self._bucket.get(key) is not timeseries:
+                    continue
+
+                if key in self._closed:
+                    await self._release(key)
+                    continue
+
+                try:
+                    yield timeseries
+                finally:
+                    if key in self._closed:
+                        await self._release(key)
+
+                return
+
+    @asynccontextmanager
+    async def _acquire(self, key: SeriesKey):
+        lock = self._locks[key]
+        stats = self._lock_stats[key]
+
+        if lock.locked():
+            start = time.monotonic()
+
+            async with lock:
+                wait = time.monotonic() - start
+                stats.acquired += 1
+                stats.contended += 1
+                stats.wait_time += wait
+                stats.max_wait = max(stats.max_wait, wait)
+
+                yield
+        else:
+            async with lock:
+                stats.acquired += 1
+
+                yield
@@ -1,11 +1,16 @@
+import asyncio
 import os
-from functools import lru_cache
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
 
-from wasmtime import Engine, Linker, Module, Store, WasiConfig
+from wasmtime import Engine, Instance, Linker, Module, Store, WasiConfig
 
 from core.interfaces.abstract_wasm_manager import AbstractWasmManager
 from core.models.wasm_type import WasmType
 
+ShardKey = Tuple[WasmType, int]
+
 
 class WasmManager(AbstractWasmManager):
     _type = {
@@ -13,23 +18,73 @@ class WasmManager(AbstractWasmManager):
         WasmType.TIMESERIES: "timeseries.wasm",
     }
 
-    def __init__(self, dir="wasm"):
+    def __init__(self, dir="wasm", pool_size: int = 1, threads: bool = False):
         super().__init__()
         self.dir = dir
+        self.pool_size = max(1, pool_size)
+        self.threads = threads
+        self._engine = Engine()
+        self._modules: Dict[WasmType, Module] = {}
+        self._instances: Dict[ShardKey, Tuple[Instance, Store]] = {}
+        self._executors: Dict[int, ThreadPoolExecutor] = {}
+
+    def get_instance(
+        self, wasm_type: WasmType, affinity: Optional[Hashable] = None
+    ) -> Tuple[Instance, Store]:
+        key = (wasm_type, self.shard(affinity))
+
+        if key not in self._instances:
+            instance, store = self._load_instance(wasm_type)
+            self._instances[key] = (instance, store)
+
+            if self.threads:
+                self._executors[id(store)] = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix=f"wasm-{wasm_type.name.lower()}-{key[1]}",
+                )
+
+        return self._instances[key]
+
+    def shard(self, affinity: Optional[Hashable]) -> int:
+        if affinity is None:
+            return 0
+
+        if isinstance(affinity, tuple):
+            affinity = "_".join(map(str, affinity))
+
+        return zlib.crc32(str(affinity).encode()) % self.pool_size
 
-    @lru_cache(maxsize=None)
-    def get_instance(self, wasm_type: WasmType):
-        return self._load_instance(wasm_type)
+    async def run(self, store: Store, fn: Callable[..., Any], *args) -> Any:
+        executor = self._executors.get(id(store))
+
+        if executor is None:
+            return fn(*args)
+
+        return await asyncio.wrap_future(executor.submit(fn, *args))
+
+    def call(self, store: Store, fn: Callable[..., Any], *args) -> Any:
+        executor = self._executors.get(id(store))
+
+        if executor is None:
+            return fn(*args)
+
+        return executor.submit(fn, *args).result()
+
+    def shutdown(self) -> None:
+        for executor in self._executors.values():
+            executor.shutdown(wait=True)
+
+        self._executors.clear()
 
     def _load_instance(self, wasm_type: WasmType):
-        store = Store()
+        store = Store(self._engine)
 
         wasi = self._configure_wasi()
 
         store.set_wasi(wasi)
 
-        module = self._get_module(wasm_type, store.engine)
-        linker = self._configure_linker(store.engine)
+        module = self._get_module(wasm_type)
+        linker = self._configure_linker(self._engine)
 
         instance = linker.instantiate(store, module)
 
@@ -46,13 +101,16 @@ class WasmManager(AbstractWasmManager):
         linker.define_wasi()
         return linker
 
-    def _get_module(self, type: WasmType, engine: Engine) -> Module:
+    def _get_module(self, type: WasmType) -> Module:
         if type not in WasmType:
             raise ValueError(f"Unknown Strategy: {type}")
 
-        wasm_path = f"./{self.dir}/{self._type.get(type)}"
+        if type not in self._modules:
+            wasm_path = f"./{self.dir}/{self._type.get(type)}"
+
+            if not os.path.exists(wasm_path):
+                raise FileNotFoundError(f"WASM file not found: {wasm_path}")
 
-        if not os.path.exists(wasm_path):
-            raise FileNotFoundError(f"WASM file not found: {wasm_path}")
+            self._modules[type] = Module.from_file(self._engine, wasm_path)
 
-        return Module.from_file(engine, wasm_path)
+        return self._modules[type]
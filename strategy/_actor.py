@@ -33,18 +33,24 @@ class SignalActor(StrategyActor):
         return self._strategy
 
     def on_start(self):
-        self.strategy_ref = self.service.register(self.strategy)
+        self.strategy_ref = self.service.register(
+            self.strategy, (self.symbol, self.timeframe)
+        )
 
     def on_stop(self):
-        self.strategy_ref.unregister()
+        self.service.unregister(self.strategy_ref)
         self.strategy_ref = None
 
     def pre_receive(self, event: NewMarketDataReceived):
         return SignalPolicy.should_process(self, event)
 
     async def on_receive(self, event: NewMarketDataReceived):
-        signal_event = self.strategy_ref.next(
-            self.symbol, self.timeframe, self.strategy, event.bar.ohlcv
+        signal_event = await self.service.next(
+            self.strategy_ref,
+            self.symbol,
+            self.timeframe,
+            self.strategy,
+            event.bar.ohlcv,
         )
 
         if signal_event:
@@ -9,6 +9,7 @@ from core.events.backtest import BacktestEnded, BacktestStarted
 from core.events.system import DeployStrategy
 from core.interfaces.abstract_system import AbstractSystem
 from core.models.cap import CapType
+from core.models.dispatch_mode import DispatchMode
 from core.models.feed import FeedType
 from core.models.lookback import Lookback
 from core.models.order_type import OrderType
@@ -18,6 +19,7 @@ from core.models.timeframe import Timeframe
 from core.queries.factor import GetGeneration
 from core.tasks.feed import StartHistoricalFeed
 from infrastructure.estimator import Estimator
+from infrastructure.event_dispatcher.direct_dispatch import set_dispatch_mode
 
 from .context import SystemContext
 
@@ -54,9 +56,18 @@ class BacktestSystem(AbstractSystem):
         self.default_cap = CapType.A
 
     async def start(self):
+        set_dispatch_mode(
+            DispatchMode(
+                self.context.config_service.get("backtest").get(
+                    "dispatch_mode", DispatchMode.QUEUED.value
+                )
+            )
+        )
+
         transitions = {
             SystemState.INIT: {
                 Event.REGENERATE: SystemState.GENERATE,
+                Event.RUN_BACKTEST: SystemState.BACKTEST,
                 Event.SYSTEM_STOP: SystemState.STOPPED,
             },
             SystemState.GENERATE: {
@@ -84,7 +95,7 @@ class BacktestSystem(AbstractSystem):
             },
         }
 
-        await self.event_queue.put(Event.REGENERATE)
+        await self.event_queue.put(await self._resume())
 
         while True:
             event = await self.event_queue.get()
@@ -109,6 +120,21 @@ class BacktestSystem(AbstractSystem):
     def stop(self):
         self.event_queue.put_nowait(Event.SYSTEM_STOP)
 
+    async def _resume(self) -> Event:
+        result = await self.query(GetGeneration())
+
+        if result.is_err():
+            return Event.REGENERATE
+
+        population, generation = result.unwrap()
+
+        if not len(population):
+            return Event.REGENERATE
+
+        logger.info(f"Resume population of generation: {generation + 1}")
+
+        return Event.RUN_BACKTEST
+
     async def _generate(self):
         logger.info("Generate a new population")
 
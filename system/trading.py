@@ -3,6 +3,7 @@ import logging
 from collections import defaultdict
 from enum import Enum, auto
 
+from core.clock import is_replaying
 from core.commands.broker import UpdateSymbolSettings
 from core.event_decorators import event_handler
 from core.events.system import DeployStrategy
@@ -53,6 +54,7 @@ class TradingSystem(AbstractSystem):
         self.next_strategy = defaultdict(set)
         self.event_queue = asyncio.Queue()
         self.state = SystemState.IDLE
+        self.resume = False
         self.config = config_service.get("system")
         self.signal_factory = signal_factory
         self.position_factory = position_factory
@@ -72,6 +74,10 @@ class TradingSystem(AbstractSystem):
         for symbol, timeframe, strategy in event.strategy:
             self.next_strategy[(symbol, timeframe)].add((symbol, timeframe, strategy))
 
+        if is_replaying():
+            self.resume = True
+            return
+
         await self.event_queue.put(Event.CHANGE)
 
     async def start(self):
@@ -90,6 +96,10 @@ class TradingSystem(AbstractSystem):
             },
         }
 
+        if self.resume:
+            logger.info("Resume deployed strategy")
+            await self.event_queue.put(Event.CHANGE)
+
         while True:
             event = await self.event_queue.get()
 
@@ -115,7 +125,8 @@ class TradingSystem(AbstractSystem):
 
         for _, strategies in self.next_strategy.items():
             for symbol, timeframe, strategy in strategies:
-                await self.dispatch(TradeStarted(symbol, timeframe, strategy))
+                if not self.resume:
+                    await self.dispatch(TradeStarted(symbol, timeframe, strategy))
 
                 signal_actor = self.signal_factory.create_actor(
                     symbol, timeframe, strategy
@@ -150,10 +161,15 @@ class TradingSystem(AbstractSystem):
                 )
             )
 
+            position_actor = self.position_factory.create_actor(symbol, timeframe)
+
+            if self.resume:
+                await position_actor.restore()
+
             actors = (
                 *signal_actors[(symbol, timeframe)],
                 self.risk_factory.create_actor(symbol, timeframe),
-                self.position_factory.create_actor(symbol, timeframe),
+                position_actor,
                 self.executor_factory.create_actor(
                     OrderType.MARKET if self.config["mode"] == 1 else OrderType.PAPER,
                     symbol,
@@ -166,6 +182,8 @@ class TradingSystem(AbstractSystem):
 
             self.active_strategy.add(actors)
 
+        self.resume = False
+
         await self.event_queue.put(Event.TRADING)
 
     async def _run_trading(self):
@@ -1,6 +1,7 @@
 use once_cell::sync::Lazy;
 use serde::Serialize;
 use serde_json::to_string;
+use std::cell::RefCell;
 use std::collections::HashMap;
 use std::sync::atomic::{AtomicI32, Ordering};
 use std::sync::{Arc, RwLock};
@@ -12,12 +13,18 @@ type Result = (i32, i32);
 static TIMESERIES: TsTableType = Lazy::new(|| Arc::new(RwLock::new(HashMap::new())));
 static TIMESERIES_ID_COUNTER: Lazy<AtomicI32> = Lazy::new(|| AtomicI32::new(0));
 
+thread_local! {
+    static COLUMNS_BUFFER: RefCell<Vec<u64>> = const { RefCell::new(Vec::new()) };
+    static BATCH_BUFFER: RefCell<Vec<f64>> = const { RefCell::new(Vec::new()) };
+}
+
 fn generate_timeseries_id() -> i32 {
     TIMESERIES_ID_COUNTER.fetch_add(1, Ordering::SeqCst)
 }
 
 const ERROR: Result = (-1, 0);
 const NOT_FOUND: Result = (0, 0);
+const BATCH_FIELDS: usize = 6;
 
 fn serialize<T: Serialize>(data: &T) -> Result {
     match to_string(data) {
@@ -29,6 +36,29 @@ fn serialize<T: Serialize>(data: &T) -> Result {
     }
 }
 
+// Layout: [n: u64][len_0..len_n: u64][column_0..column_n: f64], little-endian.
+// The buffer is reused by the next call, so readers must copy before returning.
+fn serialize_columns(columns: &[&[f32]]) -> Result {
+    COLUMNS_BUFFER.with(|buffer| {
+        let mut buffer = buffer.borrow_mut();
+        let total = columns.iter().map(|column| column.len()).sum::<usize>();
+
+        buffer.clear();
+        buffer.reserve(1 + columns.len() + total);
+        buffer.push(columns.len() as u64);
+        buffer.extend(columns.iter().map(|column| column.len() as u64));
+
+        for column in columns {
+            buffer.extend(column.iter().map(|&value| (value as f64).to_bits()));
+        }
+
+        (
+            buffer.as_ptr() as i32,
+            (buffer.len() * std::mem::size_of::<u64>()) as i32,
+        )
+    })
+}
+
 #[no_mangle]
 pub fn timeseries_register() -> i32 {
     let timeseries_id = generate_timeseries_id();
@@ -70,6 +100,49 @@ pub fn timeseries_add(
     }
 }
 
+// Rows of [ts, open, high, low, close, volume] as f64, written by the host
+// into the region returned by timeseries_batch_buffer.
+#[no_mangle]
+pub fn timeseries_batch_buffer(rows: usize) -> i32 {
+    BATCH_BUFFER.with(|buffer| {
+        let mut buffer = buffer.borrow_mut();
+
+        buffer.clear();
+        buffer.resize(rows * BATCH_FIELDS, 0.0);
+
+        buffer.as_ptr() as i32
+    })
+}
+
+#[no_mangle]
+pub fn timeseries_add_batch(timeseries_id: i32, rows: usize) -> Result {
+    let mut timeseries = TIMESERIES.write().unwrap();
+
+    if let Some(timeseries) = timeseries.get_mut(&timeseries_id) {
+        BATCH_BUFFER.with(|buffer| {
+            let buffer = buffer.borrow();
+            let rows = rows.min(buffer.len() / BATCH_FIELDS);
+
+            for row in buffer.chunks_exact(BATCH_FIELDS).take(rows) {
+                let bar = OHLCV {
+                    ts: row[0] as i64,
+                    open: row[1] as f32,
+                    high: row[2] as f32,
+                    low: row[3] as f32,
+                    close: row[4] as f32,
+                    volume: row[5] as f32,
+                };
+
+                timeseries.add(&bar);
+            }
+
+            (rows as i32, 0)
+        })
+    } else {
+        ERROR
+    }
+}
+
 #[no_mangle]
 pub fn timeseries_next_bar(
     timeseries_id: i32,
@@ -195,9 +268,171 @@ pub fn timeseries_ta(
     }
 }
 
+#[no_mangle]
+pub fn timeseries_ta_columns(
+    timeseries_id: i32,
+    ts: i64,
+    open: f32,
+    high: f32,
+    low: f32,
+    close: f32,
+    volume: f32,
+) -> Result {
+    let timeseries = TIMESERIES.read().unwrap();
+
+    if let Some(timeseries) = timeseries.get(&timeseries_id) {
+        let curr_bar = OHLCV {
+            ts,
+            open,
+            high,
+            low,
+            close,
+            volume,
+        };
+
+        let ta = timeseries.ta(&curr_bar);
+
+        serialize_columns(&ta.columns())
+    } else {
+        ERROR
+    }
+}
+
 #[no_mangle]
 pub fn timeseries_unregister(timeseries_id: i32) -> i32 {
     let mut timeseries = TIMESERIES.write().unwrap();
 
     timeseries.remove(&timeseries_id).is_some() as i32
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn fill_batch(rows: &[[f64; BATCH_FIELDS]]) {
+        timeseries_batch_buffer(rows.len());
+
+        BATCH_BUFFER.with(|buffer| {
+            let mut buffer = buffer.borrow_mut();
+
+            for (dst, row) in buffer.chunks_exact_mut(BATCH_FIELDS).zip(rows) {
+                dst.copy_from_slice(row);
+            }
+        });
+    }
+
+    fn bars(n: usize) -> Vec<[f64; BATCH_FIELDS]> {
+        (0..n)
+            .map(|i| {
+                let close = 100.0 + i as f64;
+                [
+                    1722710400000.0 + i as f64 * 300000.0,
+                    close - 0.5,
+                    close + 1.0,
+                    close - 1.0,
+                    close,
+                    1000.0 + i as f64,
+                ]
+            })
+            .collect()
+    }
+
+    #[test]
+    fn test_timeseries_add_batch() {
+        let timeseries_id = timeseries_register();
+        let rows = bars(3);
+
+        fill_batch(&rows);
+
+        assert_eq!(timeseries_add_batch(timeseries_id, rows.len()), (3, 0));
+
+        let timeseries = TIMESERIES.read().unwrap();
+        let timeseries = timeseries.get(&timeseries_id).unwrap();
+        let last = OHLCV {
+            ts: rows[2][0] as i64,
+            open: rows[2][1] as f32,
+            high: rows[2][2] as f32,
+            low: rows[2][3] as f32,
+            close: rows[2][4] as f32,
+            volume: rows[2][5] as f32,
+        };
+
+        assert_eq!(timeseries.len(), 3);
+        assert_eq!(timeseries.prev_bar(&last).unwrap().close, rows[1][4] as f32);
+        assert_eq!(timeseries.back_n_bars(&last, 3).len(), 2);
+    }
+
+    #[test]
+    fn test_timeseries_add_batch_clamps_rows() {
+        let timeseries_id = timeseries_register();
+
+        fill_batch(&bars(2));
+
+        assert_eq!(timeseries_add_batch(timeseries_id, 10), (2, 0));
+        let timeseries = TIMESERIES.read().unwrap();
+
+        assert_eq!(timeseries.get(&timeseries_id).unwrap().len(), 2);
+    }
+
+    #[test]
+    fn test_timeseries_add_batch_not_found() {
+        fill_batch(&bars(1));
+
+        assert_eq!(timeseries_add_batch(-1, 1), ERROR);
+    }
+
+    #[test]
+    fn test_serialize_columns_layout() {
+        let (_, len) = serialize_columns(&[&[1.0, 2.5], &[], &[-3.0]]);
+
+        COLUMNS_BUFFER.with(|buffer| {
+            let buffer = buffer.borrow();
+
+            assert_eq!(len as usize, buffer.len() * std::mem::size_of::<u64>());
+            assert_eq!(&buffer[..4], &[3, 2, 0, 1]);
+            assert_eq!(
+                buffer[4..]
+                    .iter()
+                    .map(|&bits| f64::from_bits(bits))
+                    .collect::<Vec<_>>(),
+                vec![1.0, 2.5, -3.0]
+            );
+        });
+    }
+
+    #[test]
+    fn test_timeseries_ta_columns_header() {
+        let timeseries_id = timeseries_register();
+        let rows = bars(40);
+
+        fill_batch(&rows);
+        timeseries_add_batch(timeseries_id, rows.len());
+
+        let last = rows[rows.len() - 1];
+        let (_, len) = timeseries_ta_columns(
+            timeseries_id,
+            last[0] as i64,
+            last[1] as f32,
+            last[2] as f32,
+            last[3] as f32,
+            last[4] as f32,
+            last[5] as f32,
+        );
+
+        COLUMNS_BUFFER.with(|buffer| {
+            let buffer = buffer.borrow();
+            let n = buffer[0] as usize;
+            let values = buffer[1..=n].iter().sum::<u64>() as usize;
+
+            assert_eq!(n, TechAnalysis::COLUMNS);
+            assert!(values > 0);
+            assert_eq!(buffer.len(), 1 + n + values);
+            assert_eq!(len as usize, buffer.len() * std::mem::size_of::<u64>());
+        });
+    }
+
+    #[test]
+    fn test_timeseries_ta_columns_not_found() {
+        assert_eq!(timeseries_ta_columns(-1, 0, 0.0, 0.0, 0.0, 0.0, 0.0), ERROR);
+    }
+}
@@ -1,5 +1,6 @@
 use crate::{BaseLine, BaseStrategy, Confirm, Pulse, Signal, Strategy, TradeAction};
 use once_cell::sync::Lazy;
+use std::cell::RefCell;
 use std::collections::HashMap;
 use std::sync::atomic::{AtomicI32, Ordering};
 use std::sync::{Arc, RwLock};
@@ -10,6 +11,13 @@ type StrgTableType = Lazy<Arc<RwLock<HashMap<i32, Box<dyn Strategy + Send + Sync
 static STRATEGIES: StrgTableType = Lazy::new(|| Arc::new(RwLock::new(HashMap::new())));
 static STRATEGIES_ID_COUNTER: Lazy<AtomicI32> = Lazy::new(|| AtomicI32::new(0));
 
+const BATCH_FIELDS: usize = 6;
+
+thread_local! {
+    static BATCH_INPUT: RefCell<Vec<f64>> = const { RefCell::new(Vec::new()) };
+    static BATCH_OUTPUT: RefCell<Vec<u32>> = const { RefCell::new(Vec::new()) };
+}
+
 fn generate_strategy_id() -> i32 {
     STRATEGIES_ID_COUNTER.fetch_add(1, Ordering::SeqCst)
 }
@@ -75,6 +83,66 @@ pub fn strategy_next(
     }
 }
 
+// Rows of [ts, open, high, low, close, volume] as f64, written by the host
+// into the region returned by strategy_batch_buffer.
+#[no_mangle]
+pub fn strategy_batch_buffer(rows: usize) -> i32 {
+    BATCH_INPUT.with(|buffer| {
+        let mut buffer = buffer.borrow_mut();
+
+        buffer.clear();
+        buffer.resize(rows * BATCH_FIELDS, 0.0);
+
+        buffer.as_ptr() as i32
+    })
+}
+
+// Output: [action_0..action_n: i32][price_0..price_n: f32], reused by the next call.
+#[no_mangle]
+pub fn strategy_run_batch(strategy_id: i32, rows: usize) -> (i32, i32) {
+    let mut strategies = STRATEGIES.write().unwrap();
+
+    let Some(strategy) = strategies.get_mut(&strategy_id) else {
+        return (-1, 0);
+    };
+
+    BATCH_INPUT.with(|input| {
+        BATCH_OUTPUT.with(|output| {
+            let input = input.borrow();
+            let mut output = output.borrow_mut();
+            let rows = rows.min(input.len() / BATCH_FIELDS);
+
+            output.clear();
+            output.resize(rows * 2, 0);
+
+            for (i, row) in input.chunks_exact(BATCH_FIELDS).take(rows).enumerate() {
+                let bar = OHLCV {
+                    ts: row[0] as i64,
+                    open: row[1] as f32,
+                    high: row[2] as f32,
+                    low: row[3] as f32,
+                    close: row[4] as f32,
+                    volume: row[5] as f32,
+                };
+
+                let (action, price) = match strategy.next(&bar) {
+                    TradeAction::GoLong(entry_price) => (1, entry_price),
+                    TradeAction::GoShort(entry_price) => (2, entry_price),
+                    TradeAction::DoNothing => (0, 0.0),
+                };
+
+                output[i] = action;
+                output[rows + i] = price.to_bits();
+            }
+
+            (
+                output.as_ptr() as i32,
+                (output.len() * std::mem::size_of::<u32>()) as i32,
+            )
+        })
+    })
+}
+
 #[no_mangle]
 pub fn allocate(size: usize) -> *mut u8 {
     let mut buf = Vec::with_capacity(size);
@@ -366,4 +434,105 @@ mod tests {
         assert_eq!(res.len(), ohlcv.len());
         assert_eq!(res[res.len() - 1], 1);
     }
+
+    fn register_mock() -> i32 {
+        register_strategy(
+            Box::<BaseTimeSeries>::default(),
+            Box::new(MockSignal),
+            Box::new(MockConfirm),
+            Box::new(MockPulse),
+            Box::new(MockBaseLine),
+        )
+    }
+
+    fn fill_batch(bars: &[OHLCV]) {
+        strategy_batch_buffer(bars.len());
+
+        BATCH_INPUT.with(|buffer| {
+            let mut buffer = buffer.borrow_mut();
+
+            for (row, bar) in buffer.chunks_exact_mut(BATCH_FIELDS).zip(bars) {
+                row.copy_from_slice(&[
+                    bar.ts as f64,
+                    bar.open as f64,
+                    bar.high as f64,
+                    bar.low as f64,
+                    bar.close as f64,
+                    bar.volume as f64,
+                ]);
+            }
+        });
+    }
+
+    fn bars(n: usize) -> Vec<OHLCV> {
+        (0..n)
+            .map(|i| {
+                let close = 0.29 + (i % 5) as f32 * 0.001;
+
+                OHLCV {
+                    ts: 1722710400876 + i as i64 * 300000,
+                    open: close - 0.0005,
+                    high: close + 0.001,
+                    low: close - 0.001,
+                    close,
+                    volume: 100000.0 + i as f32,
+                }
+            })
+            .collect()
+    }
+
+    #[test]
+    fn test_strategy_run_batch_matches_next() {
+        let ohlcv = bars(3 * PERIOD);
+        let batch_id = register_mock();
+        let next_id = register_mock();
+
+        fill_batch(&ohlcv);
+
+        let (_, len) = strategy_run_batch(batch_id, ohlcv.len());
+
+        let expected: Vec<(i32, f32)> = ohlcv
+            .iter()
+            .map(|bar| {
+                strategy_next(
+                    next_id, bar.ts, bar.open, bar.high, bar.low, bar.close, bar.volume,
+                )
+            })
+            .collect();
+
+        BATCH_OUTPUT.with(|output| {
+            let output = output.borrow();
+            let rows = ohlcv.len();
+
+            assert_eq!(len as usize, rows * 2 * std::mem::size_of::<u32>());
+            assert_eq!(output.len(), rows * 2);
+
+            for (i, &(action, price)) in expected.iter().enumerate() {
+                assert_eq!(output[i] as i32, action);
+                assert_eq!(f32::from_bits(output[rows + i]), price);
+            }
+        });
+
+        assert!(expected.iter().any(|&(action, _)| action == 1));
+        assert_eq!(expected[0], (0, 0.0));
+    }
+
+    #[test]
+    fn test_strategy_run_batch_clamps_rows() {
+        let strategy_id = register_mock();
+
+        fill_batch(&bars(2));
+
+        let (_, len) = strategy_run_batch(strategy_id, 10);
+
+        assert_eq!(len as usize, 2 * 2 * std::mem::size_of::<u32>());
+        BATCH_OUTPUT.with(|output| assert_eq!(output.borrow().len(), 4));
+    }
+
+    #[test]
+    fn test_strategy_run_batch_not_found() {
+        fill_batch(&bars(1));
+
+        assert_eq!(strategy_run_batch(-1, 1), (-1, 0));
+    }
 }
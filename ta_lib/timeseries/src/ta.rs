@@ -34,3 +34,43 @@ pub struct TechAnalysis {
     pub hlc3: Vec<f32>,
     pub hlcc4: Vec<f32>,
 }
+
+impl TechAnalysis {
+    pub const COLUMNS: usize = 31;
+
+    pub fn columns(&self) -> [&[f32]; Self::COLUMNS] {
+        [
+            &self.frsi,
+            &self.srsi,
+            &self.fma,
+            &self.sma,
+            &self.froc,
+            &self.sroc,
+            &self.macd,
+            &self.ppo,
+            &self.cci,
+            &self.obv,
+            &self.vo,
+            &self.nvol,
+            &self.mfi,
+            &self.tr,
+            &self.gkyz,
+            &self.yz,
+            &self.upb,
+            &self.lwb,
+            &self.ebb,
+            &self.ekch,
+            &self.k,
+            &self.d,
+            &self.hh,
+            &self.ll,
+            &self.support,
+            &self.resistance,
+            &self.dmi,
+            &self.vwap,
+            &self.close,
+            &self.hlc3,
+            &self.hlcc4,
+        ]
+    }
+}